@@ -0,0 +1,100 @@
+"""
+Benchmark fixtures for the hot paths.
+
+Run with pytest-benchmark (pip install pytest-benchmark) from the repo root:
+
+    pytest benchmarks --no-cov -m "not slow" --benchmark-autosave
+    pytest benchmarks --no-cov --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Results are saved as JSON under .benchmarks/ and compared against the
+latest saved run. The bench_conn fixture runs each database benchmark
+against a file-backed SQLite database and the PostgreSQL container from
+tests/fixtures/postgres.py. The 100k and 1M row write benchmarks are
+marked slow.
+"""
+import datetime
+import pathlib
+import site
+import sys
+
+import database as db
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+site.addsitedir(ROOT / 'tests')
+sys.path.insert(0, str(ROOT))
+
+pytest_plugins = [
+    'tests.fixtures.postgres',
+]
+
+BENCH_TABLE = 'bench_rows'
+
+_DDL = {
+    'postgresql': f"""
+    CREATE TABLE {BENCH_TABLE} (
+        id INTEGER PRIMARY KEY,
+        name VARCHAR(64) NOT NULL,
+        value DOUBLE PRECISION,
+        amount NUMERIC(12, 2),
+        created DATE,
+        note TEXT
+    )
+    """,
+    'sqlite': f"""
+    CREATE TABLE {BENCH_TABLE} (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        value REAL,
+        amount REAL,
+        created DATE,
+        note TEXT
+    )
+    """,
+}
+
+
+def make_rows(count: int, start: int = 0) -> list[dict]:
+    """Return count benchmark rows with ids starting at start."""
+    base = datetime.date(2024, 1, 1)
+    return [
+        {
+            'id': i,
+            'name': f'name-{i}',
+            'value': i * 0.5,
+            'amount': i % 1000,
+            'created': base + datetime.timedelta(days=i % 365),
+            'note': None if i % 3 else 'x' * 32,
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def reset_table(cn, rows: list[dict] | None = None) -> None:
+    """Recreate the benchmark table, optionally loading rows."""
+    db.execute(cn, f'DROP TABLE IF EXISTS {BENCH_TABLE}')
+    db.execute(cn, _DDL[cn.dialect])
+    if rows:
+        db.insert_rows(cn, BENCH_TABLE, rows)
+
+
+def pytest_report_header(config):
+    if sys.gettrace() is not None:
+        return 'benchmarks: a tracer (coverage?) is active; pass --no-cov for meaningful timings'
+    return None
+
+
+@pytest.fixture(scope='module', params=['sqlite', 'postgresql'], ids=['sl', 'pg'])
+def bench_conn(request, tmp_path_factory):
+    """Connection to each backend with an empty benchmark table."""
+    if request.param == 'sqlite':
+        path = tmp_path_factory.mktemp('bench') / 'bench.db'
+        cn = db.connect({'drivername': 'sqlite', 'database': str(path)})
+    else:
+        request.getfixturevalue('psql_docker')
+        import config
+        cn = db.connect('postgresql', config=config)
+    reset_table(cn)
+    yield cn
+    db.execute(cn, f'DROP TABLE IF EXISTS {BENCH_TABLE}')
+    cn.close()
@@ -0,0 +1,37 @@
+"""Benchmark for `import database` in a fresh interpreter."""
+import json
+import subprocess
+import sys
+
+from benchmarks.conftest import ROOT
+
+# Seconds spent inside `import database`, excluding interpreter startup.
+# pandas, numpy, pyarrow and dateutil are loaded lazily; importing any of
+# them eagerly again would roughly double this.
+IMPORT_BUDGET = 1.0
+
+_CODE = """
+import json, sys, time
+start = time.perf_counter()
+import database
+elapsed = time.perf_counter() - start
+heavy = [m for m in ('pandas', 'numpy', 'pyarrow', 'dateutil') if m in sys.modules]
+print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))
+"""
+
+
+def _import_database() -> dict:
+    result = subprocess.run([sys.executable, '-c', _CODE], capture_output=True,
+                            text=True, check=True, cwd=ROOT / 'src')
+    return json.loads(result.stdout)
+
+
+def test_import_time(benchmark):
+    """Cold `import database`, including interpreter startup."""
+    runs = []
+    benchmark.pedantic(lambda: runs.append(_import_database()), rounds=5, iterations=1)
+
+    fastest = min(run['elapsed'] for run in runs)
+    benchmark.extra_info['import_seconds'] = fastest
+    assert not runs[0]['heavy'], f"eagerly imported: {runs[0]['heavy']}"
+    assert fastest < IMPORT_BUDGET, f'import database took {fastest:.3f}s'
@@ -0,0 +1,62 @@
+"""Benchmarks for load_data with each data loader and select_row latency."""
+import database as db
+import pytest
+from database.cursor import extract_column_info, load_data
+from database.options import iterdict_data_loader, pandas_numpy_data_loader
+from database.options import pandas_pyarrow_data_loader
+
+from benchmarks.conftest import BENCH_TABLE, make_rows, reset_table
+
+ROWS = 10_000
+
+LOADERS = {
+    'iterdict': iterdict_data_loader,
+    'numpy': pandas_numpy_data_loader,
+    'pyarrow': pandas_pyarrow_data_loader,
+}
+
+
+@pytest.fixture(scope='module')
+def loaded_conn(bench_conn):
+    reset_table(bench_conn, make_rows(ROWS))
+    return bench_conn
+
+
+@pytest.mark.parametrize('batch', [0, 2_000], ids=['fetchall', 'pipelined'])
+@pytest.mark.parametrize('loader', LOADERS)
+def test_load_data(benchmark, loaded_conn, loader, batch):
+    """Fetch and load ROWS rows from an executed cursor."""
+    original = loaded_conn.options.data_loader
+    loaded_conn.options.data_loader = LOADERS[loader]
+    cursors = []
+
+    def setup():
+        cursor = loaded_conn.cursor()
+        cursor.execute(f'SELECT * FROM {BENCH_TABLE}')
+        cursors.append(cursor)
+        return (cursor,), {'columns': extract_column_info(cursor), 'fetch_batch_size': batch}
+
+    try:
+        result = benchmark.pedantic(load_data, setup=setup, rounds=10)
+    finally:
+        loaded_conn.options.data_loader = original
+        for cursor in cursors:
+            cursor.close()
+    assert len(result) == ROWS
+
+
+def test_select_row_latency(benchmark, loaded_conn):
+    """Single-row lookup by primary key."""
+    ids = iter(range(10**9))
+
+    def lookup():
+        return db.select_row(loaded_conn, f'SELECT * FROM {BENCH_TABLE} WHERE id = %s',
+                             next(ids) % ROWS)
+
+    row = benchmark(lookup)
+    assert row['name'].startswith('name-')
+
+
+def test_select_scalar_latency(benchmark, loaded_conn):
+    """Single-value query round trip."""
+    benchmark(db.select_scalar, loaded_conn, f'SELECT COUNT(*) FROM {BENCH_TABLE}')
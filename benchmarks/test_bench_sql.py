@@ -0,0 +1,56 @@
+"""Benchmarks for prepare_query and parameter conversion (no database)."""
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from database.sql import prepare_query
+from database.types import TypeConverter
+
+SMALL_SQL = 'SELECT * FROM users WHERE id = %s AND status = %s'
+
+LARGE_SQL = """
+WITH recent AS (
+    SELECT o.id, o.customer_id, o.total -- amounts in cents
+    FROM orders o
+    WHERE o.created >= %(since)s AND o.status IS NOT %(status)s AND o.note NOT LIKE '%%test%%'
+)
+SELECT c.name, r.total, regexp_replace(c.email, '@.*$', '') AS handle
+FROM recent r JOIN customers c ON c.id = r.customer_id
+WHERE c.region = %(region)s OR c.tier = %(tier)s
+/* ordering is stable for pagination */
+ORDER BY r.total DESC, c.name
+""" * 4
+
+IN_SQL = 'SELECT * FROM orders WHERE customer_id IN %s AND status = %s'
+
+
+@pytest.mark.parametrize('dialect', ['postgresql', 'sqlite'])
+def test_prepare_query_small(benchmark, dialect):
+    benchmark(prepare_query, SMALL_SQL, (1, 'active'), dialect)
+
+
+@pytest.mark.parametrize('dialect', ['postgresql', 'sqlite'])
+def test_prepare_query_large(benchmark, dialect):
+    args = {'since': datetime.date(2024, 1, 1), 'status': None, 'region': 'east', 'tier': 'gold'}
+    benchmark(prepare_query, LARGE_SQL, args, dialect)
+
+
+@pytest.mark.parametrize('in_binding', ['expand', 'array'])
+@pytest.mark.parametrize('size', [10, 1_000, 10_000])
+def test_prepare_query_in_list(benchmark, size, in_binding):
+    args = (list(range(size)), 'open')
+    benchmark(prepare_query, IN_SQL, args, 'postgresql', in_binding)
+
+
+_ROW = (1, 2.5, 'text', None, True, b'bytes', datetime.date(2024, 1, 1),
+        datetime.datetime(2024, 1, 1, 12), Decimal('1.25'), np.int64(7), np.float64(0.5))
+
+
+def test_convert_params_row(benchmark):
+    benchmark(TypeConverter.convert_params, _ROW)
+
+
+def test_convert_params_batch(benchmark):
+    batch = [_ROW] * 1_000
+    benchmark(TypeConverter.convert_params, batch)
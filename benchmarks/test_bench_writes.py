@@ -0,0 +1,51 @@
+"""Benchmarks for insert_rows, upsert_rows and filter_table_columns."""
+import database as db
+import pytest
+
+from benchmarks.conftest import BENCH_TABLE, make_rows, reset_table
+
+SIZES = [
+    pytest.param(1_000, id='1k'),
+    pytest.param(100_000, id='100k', marks=pytest.mark.slow),
+    pytest.param(1_000_000, id='1M', marks=pytest.mark.slow),
+]
+
+
+def _rounds(size: int) -> int:
+    return max(1, min(5, 100_000 // size))
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_insert_rows(benchmark, bench_conn, size):
+    rows = make_rows(size)
+
+    def setup():
+        reset_table(bench_conn)
+        return (bench_conn, BENCH_TABLE, rows), {}
+
+    count = benchmark.pedantic(db.insert_rows, setup=setup, rounds=_rounds(size))
+    assert count == size
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_upsert_rows(benchmark, bench_conn, size):
+    """Upsert where half the rows exist and half are new."""
+    existing = make_rows(size // 2)
+    rows = make_rows(size, start=size // 4)
+
+    def setup():
+        reset_table(bench_conn, existing)
+        return (bench_conn, BENCH_TABLE, rows), {'batch_size': 1_000}
+
+    benchmark.pedantic(db.upsert_rows, setup=setup, rounds=_rounds(size))
+    assert db.select_scalar(bench_conn, f'SELECT COUNT(*) FROM {BENCH_TABLE}') == size // 4 + size
+
+
+@pytest.mark.parametrize('size', [1_000, 100_000], ids=['1k', '100k'])
+def test_filter_table_columns(benchmark, bench_conn, size):
+    """Drop unknown keys and fix column name case."""
+    rows = [{'ID': r['id'], 'Name': r['name'], 'value': r['value'], 'extra': 1}
+            for r in make_rows(size)]
+    bench_conn.get_table_columns(BENCH_TABLE)  # warm the schema cache
+    filtered = benchmark(bench_conn.filter_table_columns, BENCH_TABLE, rows)
+    assert set(filtered[0]) == {'id', 'name', 'value'}
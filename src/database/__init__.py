@@ -9,18 +9,27 @@ The module functions are facades for backwards compatibility.
 """
 __version__ = '0.1.9'
 
-from typing import Any, TextIO
+from typing import Any
 
-from database.connection import ConnectionWrapper, connect
+from database.connection import ConnectionWrapper, IncrementalScan, TableScan
+from database.connection import UpsertResult, connect
+from database.diff import TableDiff, diff_tables
 from database.exceptions import ConnectionFailure, DatabaseError
 from database.exceptions import DbConnectionError, IntegrityError
 from database.exceptions import IntegrityViolationError, OperationalError
 from database.exceptions import ProgrammingError, QueryError
 from database.exceptions import TypeConversionError, UniqueViolation
 from database.exceptions import ValidationError
+from database.instrumentation import QueryHook, QueryStats, add_query_hook
+from database.instrumentation import remove_query_hook
 from database.options import DatabaseOptions
+from database.row import Row
+from database.sql import ArrayParam
+from database.strategy.base import CopySource
 from database.transaction import Transaction as transaction
+from database.transfer import transfer_table
 from database.types import Column, get_adapter_registry
+from database.watermark import WatermarkStore
 
 adapter_registry = get_adapter_registry()
 
@@ -98,6 +107,21 @@ def update_row(cn: ConnectionWrapper, table: str, keyfields: list[str],
     return cn.update_row(table, keyfields, keyvalues, datafields, datavalues)
 
 
+def update_rows(cn: ConnectionWrapper, table: str, keyfields: list[str],
+                rows: list[dict[str, Any]], datafields: list[str] | None = None,
+                batch_size: int = 1000) -> int:
+    """Update many rows identified by keyfields with set-based statements.
+    """
+    return cn.update_rows(table, keyfields, rows, datafields, batch_size)
+
+
+def delete_rows(cn: ConnectionWrapper, table: str, keyfields: list[str],
+                keys: list[Any], batch_size: int = 10000) -> int:
+    """Delete the rows identified by a list of single or composite keys.
+    """
+    return cn.delete_rows(table, keyfields, keys, batch_size)
+
+
 def update_or_insert(cn: ConnectionWrapper, update_sql: str, insert_sql: str,
                      *args: Any) -> int:
     """Try to update first; if no rows are updated, then insert.
@@ -116,7 +140,10 @@ def upsert_rows(
     reset_sequence: bool = False,
     batch_size: int = 500,
     use_primary_key: bool = False,
-) -> int:
+    only_if_changed: bool = False,
+    returning: list[str] | None = None,
+    dedupe: str | None = None,
+) -> 'int | UpsertResult':
     """Perform an UPSERT operation (INSERT or UPDATE) for multiple rows.
     """
     return cn.upsert_rows(
@@ -128,7 +155,10 @@ def upsert_rows(
         update_cols_ifnull=update_cols_ifnull,
         reset_sequence=reset_sequence,
         batch_size=batch_size,
-        use_primary_key=use_primary_key)
+        use_primary_key=use_primary_key,
+        only_if_changed=only_if_changed,
+        returning=returning,
+        dedupe=dedupe)
 
 
 def reset_table_sequence(cn: ConnectionWrapper, table: str,
@@ -157,11 +187,29 @@ def cluster_table(cn: ConnectionWrapper, table: str,
     cn.cluster_table(table, index)
 
 
-def copy_from(cn: ConnectionWrapper, table: str, file: TextIO,
+def iter_table(cn: ConnectionWrapper, table: str, key_columns: list[str] | None = None,
+               page_size: int = 50000, columns: list[str] | None = None,
+               after: tuple | list | None = None, **kwargs: Any) -> TableScan:
+    """Iterate over a table in keyset-paginated pages, resumable from scan.token.
+    """
+    return cn.iter_table(table, key_columns, page_size, columns, after, **kwargs)
+
+
+def select_since(cn: ConnectionWrapper, table: str, watermark_column: str,
+                 last_value: Any = None, key_columns: list[str] | None = None,
+                 page_size: int = 50000, columns: list[str] | None = None,
+                 **kwargs: Any) -> IncrementalScan:
+    """Iterate over the rows whose watermark column is past last_value.
+    """
+    return cn.select_since(table, watermark_column, last_value, key_columns, page_size,
+                           columns, **kwargs)
+
+
+def copy_from(cn: ConnectionWrapper, table: str, source: CopySource,
               columns: list[str] | None = None) -> int:
-    """Bulk load data from a file-like object using COPY.
+    """Bulk load rows from a CSV file, iterable, DataFrame or Arrow reader.
     """
-    return cn.copy_from(table, file, columns)
+    return cn.copy_from(table, source, columns)
 
 
 __all__ = [
@@ -171,6 +219,7 @@ __all__ = [
     'DatabaseOptions',
     'execute',
     'delete',
+    'delete_rows',
     'insert',
     'update',
     'select',
@@ -182,14 +231,30 @@ __all__ = [
     'insert_row',
     'insert_rows',
     'update_row',
+    'update_rows',
     'update_or_insert',
     'upsert_rows',
+    'UpsertResult',
     'reset_table_sequence',
     'vacuum_table',
     'reindex_table',
     'cluster_table',
     'copy_from',
+    'iter_table',
+    'TableScan',
+    'select_since',
+    'IncrementalScan',
+    'WatermarkStore',
+    'diff_tables',
+    'TableDiff',
+    'transfer_table',
+    'add_query_hook',
+    'remove_query_hook',
+    'QueryHook',
+    'QueryStats',
     'Column',
+    'Row',
+    'ArrayParam',
     'IntegrityError',
     'ProgrammingError',
     'OperationalError',
@@ -18,37 +18,50 @@ import atexit
 import logging
 import threading
 import time
-from collections.abc import Callable
-from dataclasses import fields
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field, fields
 from functools import wraps
-from typing import Any, Self, TextIO, TypeVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self, TypeVar
 
-import pandas as pd
 import sqlalchemy as sa
-from database.cursor import extract_column_info, get_dict_cursor, load_data
+from database.cache import Cache
+from database.cursor import Cursor, extract_column_info, get_dict_cursor
+from database.cursor import get_tuple_cursor, load_data
 from database.cursor import process_multiple_result_sets
 from database.exceptions import DbConnectionError, ValidationError
 from database.exceptions import is_retryable_error
-from database.options import DatabaseOptions, use_iterdict_data_loader
+from database.instrumentation import finish_event, start_event
+from database.options import DatabaseOptions
+from database.row import Row, as_rows
 from database.sql import _split_qualified_identifier, make_placeholders
-from database.sql import prepare_query, quote_identifier
+from database.sql import prepare_query, quote_identifier, split_in_list
 from database.strategy import get_db_strategy, get_strategy
+from database.strategy.base import CopySource
 from database.transaction import Transaction
-from database.types import RowAdapter
+from database.types import Column, TypeConverter
 from database.utils import ensure_commit, get_dialect_name
 from sqlalchemy import inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import NullPool, StaticPool
 
-from libb import attrdict, is_null, load_options, peel
+from libb import is_null, load_options, peel
+
+if TYPE_CHECKING:
+    import cachetools
+    import pandas as pd
 
 __all__ = [
     'ConnectionWrapper',
+    'UpsertResult',
     'connect',
     'configure_connection',
     'check_connection',
     'create_url_from_options',
     'get_engine_for_options',
+    'get_read_engine_for_options',
     'dispose_all_engines',
     'get_dialect_name',
     'ensure_commit',
@@ -60,6 +73,12 @@ T = TypeVar('T')
 _engine_registry: dict[str, Engine] = {}
 _engine_registry_lock = threading.RLock()
 
+# One writer at a time per database when a read-only pool is in use
+_writer_locks: dict[str, threading.RLock] = {}
+
+# Statements eligible for the read-only pool
+_READ_QUERY_PREFIXES = ('SELECT', 'WITH')
+
 
 def _split_schema_for_inspector(table: str) -> tuple[str | None, str]:
     """Split a possibly schema-qualified table into (schema, name) for use
@@ -87,6 +106,7 @@ def _build_engine_registry_key(options: DatabaseOptions, use_pool: bool,
         options.drivername, options.hostname, options.port,
         options.username, options.database, options.appname,
         use_pool, pool_size, pool_recycle, pool_timeout,
+        options.sqlite_profile, sorted((options.sqlite_pragmas or {}).items()),
     ))
 
 
@@ -151,24 +171,31 @@ def check_connection(func: Callable[..., T] | None = None, *, max_retries: int =
 
             tries = 0
             delay = retry_delay
-            while tries < max_retries:
-                try:
-                    return f(*args, **kwargs)
-                except error_types as err:
-                    if check_retryable and not is_retryable_error(err):
-                        logger.debug(f'Non-retryable error, failing immediately: {err}')
-                        raise
-
-                    tries += 1
-                    if tries >= max_retries:
-                        logger.error(f'Maximum retries ({max_retries}) exceeded: {err}')
-                        raise
-                    conn = args[0] if args else None
-                    if isinstance(conn, ConnectionWrapper) and not conn.in_transaction:
-                        conn._invalidate()
-                    logger.warning(f'Retryable error (attempt {tries}/{max_retries}): {err}')
-                    sleep_func(delay)
-                    delay *= retry_backoff
+            conn = args[0] if args else None
+            is_wrapper = isinstance(conn, ConnectionWrapper)
+            try:
+                while tries < max_retries:
+                    try:
+                        return f(*args, **kwargs)
+                    except error_types as err:
+                        if check_retryable and not is_retryable_error(err):
+                            logger.debug(f'Non-retryable error, failing immediately: {err}')
+                            raise
+
+                        tries += 1
+                        if tries >= max_retries:
+                            logger.error(f'Maximum retries ({max_retries}) exceeded: {err}')
+                            raise
+                        if is_wrapper:
+                            conn.retries = tries
+                            if not conn.in_transaction:
+                                conn._invalidate()
+                        logger.warning(f'Retryable error (attempt {tries}/{max_retries}): {err}')
+                        sleep_func(delay)
+                        delay *= retry_backoff
+            finally:
+                if is_wrapper and tries:
+                    conn.retries = 0
 
         return inner
 
@@ -217,6 +244,7 @@ def get_engine_for_options(options: DatabaseOptions, use_pool: bool = False,
         engine_kwargs.update(kwargs)
 
         engine = engine_factory(url, **engine_kwargs)
+        strategy.configure_engine(engine, options)
 
         # ':memory:' engines own a private in-memory database via StaticPool;
         # caching them would leak that database across independent connect()
@@ -228,6 +256,67 @@ def get_engine_for_options(options: DatabaseOptions, use_pool: bool = False,
         return engine
 
 
+def get_read_engine_for_options(options: DatabaseOptions,
+                                engine_factory: Callable[..., Engine] = sa.create_engine) -> Engine | None:
+    """Get or create the read-only engine for the given options.
+
+    Returns None when the dialect or options do not enable a separate
+    reader pool (see DatabaseOptions.sqlite_readers). The pool holds at
+    most sqlite_readers connections, each configured once on connect.
+    """
+    strategy = get_strategy(options.drivername)
+    url = strategy.build_readonly_connection_url(options)
+    if url is None:
+        return None
+
+    key = '|'.join(str(part) for part in (
+        'readonly', url, options.appname, options.sqlite_readers,
+        options.pool_max_idle_time, options.pool_wait_timeout,
+        options.sqlite_profile, sorted((options.sqlite_pragmas or {}).items()),
+    ))
+
+    with _engine_registry_lock:
+        if key in _engine_registry:
+            return _engine_registry[key]
+
+        engine_kwargs: dict[str, Any] = {'echo': False}
+        engine_kwargs.update(strategy.get_engine_kwargs(options))
+        connect_args = engine_kwargs.setdefault('connect_args', {})
+        connect_args['check_same_thread'] = False
+        engine_kwargs['pool_size'] = options.sqlite_readers
+        engine_kwargs['max_overflow'] = 0
+        engine_kwargs['pool_recycle'] = options.pool_max_idle_time
+        engine_kwargs['pool_timeout'] = options.pool_wait_timeout
+
+        engine = engine_factory(sa.make_url(url), **engine_kwargs)
+        strategy.configure_engine(engine, options)
+
+        def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+            strategy.configure_connection(dbapi_connection)
+            strategy.register_type_adapters(dbapi_connection)
+
+        sa.event.listen(engine, 'connect', on_connect)
+
+        _engine_registry[key] = engine
+        logger.debug(f'Created read-only engine for {options.drivername}')
+
+        return engine
+
+
+def _get_writer_lock(options: DatabaseOptions) -> threading.RLock:
+    """Return the process-wide writer lock for a database.
+
+    File databases are keyed on their resolved path, so relative paths and
+    symlinks to the same file share one lock.
+    """
+    database = options.database
+    if database and database != ':memory:':
+        database = str(Path(database).resolve())
+    key = f'{options.drivername}|{options.hostname}|{database}'
+    with _engine_registry_lock:
+        return _writer_locks.setdefault(key, threading.RLock())
+
+
 def dispose_all_engines() -> None:
     """Dispose all engines in the registry.
     """
@@ -241,6 +330,165 @@ def dispose_all_engines() -> None:
 atexit.register(dispose_all_engines)
 
 
+@dataclass(frozen=True)
+class _UpsertPlan:
+    """Resolved upsert for one table and argument signature.
+
+    sql is None when the upsert falls back to a plain insert. conflict_cols
+    are the conflict target's columns, empty unless all are in the rows.
+    """
+    columns: tuple[str, ...]
+    needs_filter: bool
+    sql: str | None = None
+    key_cols: list[str] = field(default_factory=list)
+    key_cols_in_data: bool = False
+    conflict_cols: list[str] = field(default_factory=list)
+
+
+def _upsert_plan_cache() -> 'cachetools.TTLCache':
+    return Cache.get_instance().get_cache('upsert_plans', maxsize=256, ttl=600)
+
+
+def _clear_upsert_plans(engine_id: int, table: str) -> None:
+    """Drop cached upsert plans for one table of one engine."""
+    plans = _upsert_plan_cache()
+    for key in [k for k in list(plans) if k[0] == engine_id and k[1] == table]:
+        plans.pop(key, None)
+
+
+def _freeze(values: list[str] | None) -> tuple[str, ...] | None:
+    return None if values is None else tuple(values)
+
+
+DEDUPE_MODES = ('first', 'last', 'error')
+
+
+def _dedupe_rows(rows: tuple[dict[str, Any], ...], key_cols: list[str],
+                 keep: str) -> tuple[dict[str, Any], ...]:
+    """Collapse rows with equal key values in one pass.
+
+    Surviving rows keep the position of the first occurrence of their
+    key; keep is 'first', 'last' or 'error'. Rows with a NULL in their
+    key never conflict and are all kept.
+    """
+    unique: dict[tuple, dict[str, Any]] = {}
+    for i, row in enumerate(rows):
+        key = tuple(row.get(k) for k in key_cols)
+        if None in key:
+            # Stored keys never hold None, so (i, None) cannot collide with them
+            unique[i, None] = row
+        elif key not in unique or keep == 'last':
+            unique[key] = row
+        elif keep == 'error':
+            raise ValidationError(f'Duplicate conflict key {dict(zip(key_cols, key))} in upsert rows')
+    if len(unique) < len(rows):
+        logger.debug(f'Dropped {len(rows) - len(unique)} rows with duplicate keys')
+    return tuple(unique.values())
+
+
+@dataclass
+class UpsertResult:
+    """Outcome of upsert_rows(..., returning=...).
+
+    Unchanged rows are those that hit a conflict and were not written
+    (DO NOTHING, or only_if_changed with equal values). rows holds the
+    returning columns of every inserted or updated row.
+    """
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    rows: list[Row] = field(default_factory=list)
+
+    @property
+    def rowcount(self) -> int:
+        """Rows written, as upsert_rows returns without returning."""
+        return self.inserted + self.updated
+
+
+class TableScan:
+    """Keyset-paginated pages of a table, returned by iter_table.
+
+    Iterating yields each page as loaded by the connection's data loader.
+    Pages are fetched with WHERE (keys) > (last keys) ORDER BY keys LIMIT n,
+    so every page costs the same and no cursor stays open between pages.
+    token holds the key values of the last row yielded; pass it as after
+    to iter_table to resume with the next row.
+    """
+
+    def __init__(self, cn: 'ConnectionWrapper', table: str, key_columns: list[str],
+                 page_size: int, columns: list[str] | None, after: tuple | None,
+                 loader_kwargs: dict[str, Any], where: str | None = None,
+                 where_args: tuple = ()) -> None:
+        self.cn = cn
+        self.key_columns = key_columns
+        self.page_size = page_size
+        self.token = tuple(after) if after is not None else None
+        self._loader_kwargs = loader_kwargs
+        self._where_args = where_args
+
+        dialect = cn.dialect
+        quoted_keys = [quote_identifier(k, dialect) for k in key_columns]
+        selected = ','.join(quote_identifier(c, dialect) for c in columns) if columns else '*'
+        order = ','.join(quoted_keys)
+        if len(key_columns) == 1:
+            after_sql = f'{quoted_keys[0]} > %s'
+        else:
+            after_sql = f"({order}) > ({','.join(['%s'] * len(key_columns))})"
+        base = f'select {selected} from {quote_identifier(table, dialect)}'
+        if where:
+            self._first_sql = f'{base} where {where} order by {order} limit %s'
+            self._next_sql = f'{base} where {where} and {after_sql} order by {order} limit %s'
+        else:
+            self._first_sql = f'{base} order by {order} limit %s'
+            self._next_sql = f'{base} where {after_sql} order by {order} limit %s'
+
+    def __iter__(self) -> Iterator[Any]:
+        cn = self.cn
+        positions = None
+        while True:
+            if self.token is None:
+                sql, args = self._first_sql, (*self._where_args, self.page_size)
+            else:
+                sql, args = self._next_sql, (*self._where_args, *self.token, self.page_size)
+            processed_sql, processed_args = prepare_query(sql, args, cn.dialect, cn.in_binding)
+            with cn._select_cursor(processed_sql, tuples=True) as cursor, \
+                    cn._observe(processed_sql, cursor):
+                cursor.execute(processed_sql, processed_args)
+                columns = extract_column_info(cursor)
+                data = cursor.fetchall()
+            if not data:
+                return
+
+            names = Column.get_names(columns)
+            if positions is None:
+                lowered = [name.lower() for name in names]
+                positions = [lowered.index(k.lower()) for k in self.key_columns]
+            self.token = tuple(data[-1][p] for p in positions)
+            yield cn.options.data_loader(as_rows(data, names), columns, **self._loader_kwargs)
+            if len(data) < self.page_size:
+                return
+
+
+class IncrementalScan(TableScan):
+    """Rows changed since a watermark, returned by select_since.
+
+    Pages are ordered by the watermark column and then the table key.
+    watermark is the highest watermark value yielded so far, or the
+    starting value before the first page. token is the (watermark,
+    key...) position of the last row; store it once the pages have been
+    processed and pass it back as last_value to resume after that row,
+    which also picks up rows that later arrive with the same watermark.
+    """
+
+    def __init__(self, *args: Any, start: Any = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.start = start
+
+    @property
+    def watermark(self) -> Any:
+        return self.token[0] if self.token is not None else self.start
+
+
 class ConnectionWrapper:
     """Wraps a SQLAlchemy connection object to track calls and execution time
 
@@ -264,6 +512,9 @@ class ConnectionWrapper:
         self.calls = 0
         self.time = 0
         self.in_transaction = False
+        self.read_engine: Engine | None = None
+        self._writer_lock: threading.RLock | None = None
+        self.retries = 0
 
     def __enter__(self) -> Self:
         """Support for context manager protocol
@@ -307,6 +558,81 @@ class ConnectionWrapper:
             self.dbapi_connection = self.sa_connection.connection
             configure_connection(self.sa_connection)
 
+    def write_lock(self) -> AbstractContextManager:
+        """Context manager serializing writers when a reader pool is used.
+
+        Held for the duration of each write (or transaction) so that only
+        one connection writes to the database at a time; a no-op when
+        reads and writes share the primary connection.
+        """
+        return self._writer_lock or nullcontext()
+
+    @contextmanager
+    def _select_cursor(self, sql: str, tuples: bool = False,
+                       server_side: bool = False) -> Iterator[Cursor]:
+        """Yield a cursor for a query, from the read-only pool if possible.
+
+        Queries inside a transaction stay on the primary connection so
+        they see its uncommitted writes. With tuples=True the cursor
+        returns plain tuple rows. server_side=True (PostgreSQL read
+        queries only) runs the query on a named cursor inside a
+        transaction, the caller's or one held until the block exits, so
+        fetchmany pulls each batch from the server; execute it with
+        auto_commit=False.
+        """
+        if server_side:
+            self._ensure_connection()
+            strategy = get_db_strategy(self)
+            driver_connection = self.dbapi_connection.driver_connection
+            with nullcontext() if self.in_transaction else driver_connection.transaction():
+                dbapi_cursor = strategy.create_server_cursor(driver_connection, tuples)
+                try:
+                    yield Cursor(dbapi_cursor, self, strategy)
+                finally:
+                    dbapi_cursor.close()
+            return
+
+        if (self.read_engine is None or self.in_transaction
+                or not sql.lstrip().upper().startswith(_READ_QUERY_PREFIXES)):
+            if tuples:
+                self._ensure_connection()
+                yield get_tuple_cursor(self)
+            else:
+                yield self.cursor()
+            return
+
+        strategy = get_db_strategy(self)
+        with self.read_engine.connect() as sa_connection:
+            raw_conn = sa_connection.connection
+            dbapi_cursor = (strategy.create_tuple_cursor(raw_conn) if tuples
+                            else strategy.create_dict_cursor(raw_conn))
+            try:
+                yield Cursor(dbapi_cursor, self, strategy)
+            finally:
+                dbapi_cursor.close()
+
+    @contextmanager
+    def _observe(self, sql: str, cursor: Cursor) -> Iterator[None]:
+        """Report a statement to query hooks, if any are registered.
+
+        The cursor records execute, fetch and data-loader time on the
+        event while the block runs.
+        """
+        event = start_event(sql, self._dialect, self.retries)
+        if event is None:
+            yield
+            return
+
+        cursor.event = event
+        try:
+            yield
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            cursor.event = None
+            finish_event(event)
+
     def _invalidate(self) -> None:
         """Discard a broken connection so the next cursor() rebuilds it.
         """
@@ -336,6 +662,12 @@ class ConnectionWrapper:
         """Return the dialect name ('postgresql' or 'sqlite')."""
         return self._dialect
 
+    @property
+    def in_binding(self) -> str:
+        """Return how IN lists are bound ('expand' or 'array').
+        """
+        return self.options.in_binding if self.options else 'expand'
+
     def commit(self) -> None:
         """Explicit commit that works regardless of auto-commit setting
         """
@@ -362,83 +694,184 @@ class ConnectionWrapper:
     def execute(self, sql: str, *args: Any) -> int:
         """Execute a SQL query with the given parameters and return affected row count.
         """
-        cursor = self.cursor()
-        try:
-            processed_sql, processed_args = prepare_query(sql, args, self.dialect)
-            cursor.execute(processed_sql, processed_args)
-            logger.debug(f'Executed query with {len(processed_args) if processed_args else 0} parameters')
-            rowcount = cursor.rowcount
-            if not self.in_transaction:
-                self.commit()
-            return rowcount
-        except Exception:
-            if not self.in_transaction:
-                try:
-                    self.rollback()
-                except Exception:
-                    pass
-            raise
+        with self.write_lock():
+            cursor = self.cursor()
+            try:
+                processed_sql, processed_args = prepare_query(sql, args, self.dialect, self.in_binding)
+                with self._observe(processed_sql, cursor):
+                    cursor.execute(processed_sql, processed_args)
+                logger.debug(f'Executed query with {len(processed_args) if processed_args else 0} parameters')
+                rowcount = cursor.rowcount
+                if not self.in_transaction:
+                    self.commit()
+                return rowcount
+            except Exception:
+                if not self.in_transaction:
+                    try:
+                        self.rollback()
+                    except Exception:
+                        pass
+                raise
 
     @check_connection
-    def select(self, sql: str, *args: Any, **kwargs: Any) -> list[dict[str, Any]] | pd.DataFrame | list[pd.DataFrame]:
+    def select(self, sql: str, *args: Any, **kwargs: Any) -> 'list[dict[str, Any]] | pd.DataFrame | list[pd.DataFrame]':
         """Execute a SELECT query or stored procedure.
-        """
-        processed_sql, processed_args = prepare_query(sql, args, self.dialect)
-        cursor = self.cursor()
-        cursor.execute(processed_sql, processed_args)
 
-        normalized_sql = processed_sql.strip().upper()
+        An `IN %s` list longer than in_chunk_size (keyword or connection
+        option) is split into one query per chunk whose rows are combined
+        and loaded once; in_chunk_workers > 1 runs the chunks concurrently
+        on pooled connections. Only use this for queries whose result is
+        the union of the chunk results (no aggregates, ORDER BY, LIMIT or
+        DISTINCT across the list).
+        """
+        normalized_sql = sql.strip().upper()
         is_procedure = (normalized_sql.startswith(('EXEC ', 'CALL ', 'EXECUTE ')))
         return_all = kwargs.pop('return_all', False)
         prefer_first = kwargs.pop('prefer_first', False)
-
-        if not is_procedure and not return_all:
-            columns = extract_column_info(cursor)
-            result = load_data(cursor, columns=columns, **kwargs)
-            logger.debug(f"Select query returned {len(result) if hasattr(result, '__len__') else 'scalar'} result")
+        chunk_size = kwargs.pop('in_chunk_size', None)
+        chunk_workers = kwargs.pop('in_chunk_workers', 1)
+        if chunk_size is None:
+            chunk_size = self.options.in_chunk_size if self.options else 0
+
+        if chunk_size and not is_procedure and not return_all:
+            chunks = split_in_list(sql, args, self.dialect, chunk_size, self.in_binding)
+            if chunks is not None:
+                return self._select_chunked(sql, chunks, chunk_workers, **kwargs)
+
+        fetch_batch_size = kwargs.get('fetch_batch_size')
+        if fetch_batch_size is None:
+            fetch_batch_size = self.options.fetch_batch_size if self.options else 0
+        server_side = (bool(fetch_batch_size) and self.dialect == 'postgresql'
+                       and normalized_sql.startswith(_READ_QUERY_PREFIXES)
+                       and not is_procedure and not return_all)
+
+        processed_sql, processed_args = prepare_query(sql, args, self.dialect, self.in_binding)
+        with self._select_cursor(processed_sql, server_side=server_side) as cursor, \
+                self._observe(processed_sql, cursor):
+            cursor.execute(processed_sql, processed_args, auto_commit=not server_side)
+
+            if not is_procedure and not return_all:
+                columns = extract_column_info(cursor)
+                result = load_data(cursor, columns=columns, **kwargs)
+                logger.debug(f"Select query returned {len(result) if hasattr(result, '__len__') else 'scalar'} result")
+                return result
+
+            result = process_multiple_result_sets(cursor, return_all, prefer_first, **kwargs)
+            logger.debug(f"Procedure returned {len(result) if isinstance(result, list) else 'single'} result set(s)")
             return result
 
-        result = process_multiple_result_sets(cursor, return_all, prefer_first, **kwargs)
-        logger.debug(f"Procedure returned {len(result) if isinstance(result, list) else 'single'} result set(s)")
-        return result
+    def _select_chunked(self, sql: str, chunks: list, workers: int, **kwargs: Any) -> Any:
+        """Run a query once per IN-list chunk and load the combined rows.
+
+        Chunks run in order on this connection, or with workers > 1
+        concurrently on pooled connections (the SQLite reader pool or a
+        PostgreSQL engine connection each) when not in a transaction. The
+        column metadata of the first chunk is passed to the data loader.
+        """
+        kwargs.pop('fetch_batch_size', None)
+
+        def run(args: Any, pooled: bool) -> tuple[list[Column], list[tuple]]:
+            processed_sql, processed_args = prepare_query(sql, args, self.dialect, self.in_binding)
+            source = self._pooled_cursor(processed_sql) if pooled \
+                else self._select_cursor(processed_sql, tuples=True)
+            with source as cursor, self._observe(processed_sql, cursor):
+                cursor.execute(processed_sql, processed_args)
+                return extract_column_info(cursor), cursor.fetchall()
+
+        parallel = (workers > 1 and not self.in_transaction
+                    and (self.read_engine is not None or self.dialect == 'postgresql'))
+        if parallel:
+            with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                results = list(pool.map(lambda args: run(args, True), chunks))
+        else:
+            results = [run(args, False) for args in chunks]
+
+        columns = results[0][0]
+        data = [row for _, rows in results for row in rows]
+        logger.debug(f'Chunked select ran {len(chunks)} queries returning {len(data)} rows')
+        return self.options.data_loader(as_rows(data, Column.get_names(columns)), columns, **kwargs)
+
+    @contextmanager
+    def _pooled_cursor(self, sql: str) -> Iterator[Cursor]:
+        """Yield a tuple cursor on a separate connection from the pool.
+
+        Uses the read-only pool when there is one, otherwise a new
+        connection from this connection's engine.
+        """
+        engine = self.read_engine or self.engine
+        strategy = get_db_strategy(self)
+        with engine.connect() as sa_connection:
+            if self.read_engine is None:
+                configure_connection(sa_connection)
+            dbapi_cursor = strategy.create_tuple_cursor(sa_connection.connection)
+            try:
+                yield Cursor(dbapi_cursor, self, strategy)
+            finally:
+                dbapi_cursor.close()
+
+    def _select_single(self, sql: str, args: tuple) -> tuple[list[str], tuple | None, int]:
+        """Fetch at most one row as a tuple, bypassing the data loader.
+
+        Returns (column names, the row or None, total row count). The
+        count is only computed beyond two rows when the result is not a
+        single row, since that is the error path.
+        """
+        processed_sql, processed_args = prepare_query(sql, args, self.dialect, self.in_binding)
+        with self._select_cursor(processed_sql, tuples=True) as cursor, self._observe(processed_sql, cursor):
+            cursor.execute(processed_sql, processed_args)
+            names = [d[0] for d in cursor.description or ()]
+            rows = cursor.fetchmany(2)
+            if len(rows) == 1:
+                return names, rows[0], 1
+            return names, None, len(rows) + len(cursor.fetchall() if rows else ())
+
+    def _select_tuples(self, sql: str, *args: Any) -> list[tuple]:
+        """Fetch all rows as plain tuples, bypassing the data loader.
+        """
+        processed_sql, processed_args = prepare_query(sql, args, self.dialect, self.in_binding)
+        with self._select_cursor(processed_sql, tuples=True) as cursor, self._observe(processed_sql, cursor):
+            cursor.execute(processed_sql, processed_args)
+            return cursor.fetchall()
 
-    @use_iterdict_data_loader
+    @check_connection
     def select_column(self, sql: str, *args: Any) -> list[Any]:
         """Execute a query and return a single column as a list.
         """
-        data = self.select(sql, *args)
-        return [RowAdapter.create(self, row).get_value() for row in data]
+        processed_sql, processed_args = prepare_query(sql, args, self.dialect, self.in_binding)
+        with self._select_cursor(processed_sql, tuples=True) as cursor, self._observe(processed_sql, cursor):
+            cursor.execute(processed_sql, processed_args)
+            return [row[0] for row in cursor.fetchall()]
 
-    @use_iterdict_data_loader
-    def select_row(self, sql: str, *args: Any) -> attrdict:
-        """Execute a query and return a single row as an attribute dictionary.
+    @check_connection
+    def select_row(self, sql: str, *args: Any) -> Row:
+        """Execute a query and return a single row with key and attribute access.
 
         Raises ValidationError if the query returns zero or multiple rows.
         """
-        data = self.select(sql, *args)
-        if len(data) != 1:
-            raise ValidationError(f'Expected one row, got {len(data)}')
-        return RowAdapter.create(self, data[0]).to_attrdict()
+        names, row, count = self._select_single(sql, args)
+        if row is None:
+            raise ValidationError(f'Expected one row, got {count}')
+        return Row(row, Row.build_index(names))
 
-    @use_iterdict_data_loader
-    def select_row_or_none(self, sql: str, *args: Any) -> attrdict | None:
+    @check_connection
+    def select_row_or_none(self, sql: str, *args: Any) -> Row | None:
         """Execute a query and return a single row or None if no rows found.
         """
-        data = self.select(sql, *args)
-        if len(data) == 1:
-            return RowAdapter.create(self, data[0]).to_attrdict()
-        return None
+        names, row, _ = self._select_single(sql, args)
+        if row is None:
+            return None
+        return Row(row, Row.build_index(names))
 
-    @use_iterdict_data_loader
+    @check_connection
     def select_scalar(self, sql: str, *args: Any) -> Any:
         """Execute a query and return a single scalar value.
 
         Raises ValidationError if the query returns zero or multiple rows.
         """
-        data = self.select(sql, *args)
-        if len(data) != 1:
-            raise ValidationError(f'Expected one row, got {len(data)}')
-        result = RowAdapter.create(self, data[0]).get_value()
+        _, row, count = self._select_single(sql, args)
+        if row is None:
+            raise ValidationError(f'Expected one row, got {count}')
+        result = row[0]
         logger.debug(f'Scalar query returned value of type {type(result).__name__}')
         return result
 
@@ -460,6 +893,8 @@ class ConnectionWrapper:
         with _schema_cache_lock:
             if not bypass_cache and cache_key in _schema_cache:
                 return _schema_cache[cache_key]
+        if bypass_cache:
+            _clear_upsert_plans(id(self.engine), table)
 
         schema, name = _split_schema_for_inspector(table)
         self._ensure_connection()
@@ -476,6 +911,8 @@ class ConnectionWrapper:
         with _schema_cache_lock:
             if not bypass_cache and cache_key in _schema_cache:
                 return _schema_cache[cache_key]
+        if bypass_cache:
+            _clear_upsert_plans(id(self.engine), table)
 
         schema, name = _split_schema_for_inspector(table)
         self._ensure_connection()
@@ -563,8 +1000,10 @@ class ConnectionWrapper:
 
         all_params = [tuple(row.values()) for row in rows]
 
-        cursor = self.cursor()
-        return cursor.executemany(sql, all_params)
+        with self.write_lock():
+            cursor = self.cursor()
+            with self._observe(sql, cursor):
+                return cursor.executemany(sql, all_params)
 
     def update_row(self, table: str, keyfields: list[str], keyvalues: list[Any],
                    datafields: list[str], datavalues: list[Any]) -> int:
@@ -588,6 +1027,123 @@ class ConnectionWrapper:
         values = tuple(datavalues) + tuple(keyvalues)
         return self.execute(sql, *values)
 
+    def update_rows(self, table: str, keyfields: list[str], rows: list[dict[str, Any]],
+                    datafields: list[str] | None = None, batch_size: int = 1000) -> int:
+        """Update many rows identified by keyfields in set-based statements.
+
+        Rows are sent in batches as UPDATE ... FROM (VALUES ...) joined on
+        the key columns instead of one UPDATE per row; on PostgreSQL very
+        large inputs are COPY'd into a temporary table and applied with a
+        single join update.
+
+        Args:
+            table: Target table name
+            keyfields: Columns identifying each row
+            rows: Dicts holding the keyfields and datafields values
+            datafields: Columns to set (default: the non-key columns of the first row)
+            batch_size: Rows per statement
+
+        Returns
+            int: Number of table rows updated
+        """
+        if not keyfields:
+            raise ValidationError('update_rows requires at least one keyfield')
+        rows = self.filter_table_columns(table, list(rows))
+        if not rows:
+            return 0
+
+        case_map = {col.lower(): col for col in self.get_table_columns(table)}
+        keyfields = [case_map.get(k.lower(), k) for k in keyfields]
+        key_set = {k.lower() for k in keyfields}
+        if datafields is None:
+            datafields = [c for c in rows[0] if c.lower() not in key_set]
+        else:
+            datafields = [case_map.get(f.lower(), f) for f in datafields]
+        if not datafields:
+            raise ValidationError('update_rows has no datafields to set')
+        for f in datafields:
+            if f.lower() in key_set:
+                raise ValidationError(f'keyfield {f} cannot be in datafields')
+
+        fields = keyfields + datafields
+        params = []
+        for row in rows:
+            missing = [f for f in fields if f not in row]
+            if missing:
+                raise ValidationError(f'update_rows row is missing {missing}')
+            params.append(TypeConverter.convert_params(tuple(row[f] for f in fields)))
+
+        strategy = get_db_strategy(self)
+        quoted_table = quote_identifier(table, self.dialect)
+        datacols = ','.join([f'{quote_identifier(f, self.dialect)}=v.{quote_identifier(f, self.dialect)}'
+                             for f in datafields])
+        sql = f'update {quoted_table} set {datacols} from (values ...) v'
+
+        with self.write_lock():
+            cursor = get_tuple_cursor(self)
+            with self._observe(sql, cursor):
+                updated = strategy.update_rows(self, cursor, table, keyfields, datafields,
+                                               params, batch_size)
+            if not self.in_transaction:
+                ensure_commit(self)
+
+        logger.debug(f'Updated {updated} rows in {table} from {len(params)} input rows')
+        return updated
+
+    def delete_rows(self, table: str, keyfields: list[str], keys: list[Any],
+                    batch_size: int = 10000) -> int:
+        """Delete the rows identified by a list of keys.
+
+        Instead of one DELETE per key or an IN list with a placeholder per
+        value, PostgreSQL binds the keys as arrays (= ANY, or an unnest
+        join for composite keys) and COPYs very large key sets into a
+        temporary table; SQLite joins on a temporary table of the keys.
+
+        Args:
+            table: Target table name
+            keyfields: Key columns
+            keys: Key values; scalars for a single keyfield, otherwise
+                tuples in keyfields order or dicts holding the keyfields
+            batch_size: Keys per statement
+
+        Returns
+            int: Number of table rows deleted
+        """
+        if not keyfields:
+            raise ValidationError('delete_rows requires at least one keyfield')
+        case_map = {col.lower(): col for col in self.get_table_columns(table)}
+        missing = [k for k in keyfields if k.lower() not in case_map]
+        if missing:
+            raise ValidationError(f'delete_rows keyfields {missing} are not columns of {table}')
+        keyfields = [case_map[k.lower()] for k in keyfields]
+
+        params = []
+        for key in keys:
+            if isinstance(key, dict):
+                lowered = {k.lower(): v for k, v in key.items()}
+                key = tuple(lowered.get(k.lower()) for k in keyfields)
+            elif len(keyfields) == 1 and not isinstance(key, list | tuple):
+                key = (key,)
+            if len(key) != len(keyfields):
+                raise ValidationError(f'delete_rows key {key!r} does not match keyfields {keyfields}')
+            params.append(TypeConverter.convert_params(tuple(key)))
+        if not params:
+            return 0
+
+        strategy = get_db_strategy(self)
+        keycols = ','.join(quote_identifier(k, self.dialect) for k in keyfields)
+        sql = f'delete from {quote_identifier(table, self.dialect)} where ({keycols}) in (...)'
+
+        with self.write_lock():
+            cursor = get_tuple_cursor(self)
+            with self._observe(sql, cursor):
+                deleted = strategy.delete_rows(self, cursor, table, keyfields, params, batch_size)
+            if not self.in_transaction:
+                ensure_commit(self)
+
+        logger.debug(f'Deleted {deleted} rows from {table} for {len(params)} keys')
+        return deleted
+
     def update_or_insert(self, update_sql: str, insert_sql: str, *args: Any) -> int:
         """Try to update first; if no rows are updated, then insert.
         """
@@ -643,6 +1199,107 @@ class ConnectionWrapper:
         ]
         return self.select(f"select {','.join(quoted_columns)} from {quoted_table}")
 
+    def iter_table(self, table: str, key_columns: list[str] | None = None,
+                   page_size: int = 50000, columns: list[str] | None = None,
+                   after: tuple | list | None = None, **kwargs: Any) -> TableScan:
+        """Iterate over a table in pages ordered by a unique key.
+
+        Unlike OFFSET pagination each page is a keyset query of constant
+        cost, and unlike a server-side cursor nothing is held open between
+        pages, so long scans can stop and resume from scan.token.
+
+        Args:
+            table: Table name
+            key_columns: Unique, non-null ordering columns (default: primary key)
+            page_size: Rows per page
+            columns: Columns to select, including the key columns (default: all)
+            after: Token of a previous scan to resume after
+            **kwargs: Passed to the data loader for each page
+
+        Returns
+            TableScan: Iterable of pages exposing the resume token
+
+        Examples
+            scan = cn.iter_table('events', page_size=10000)
+            for page in scan:
+                process(page)
+                save_checkpoint(scan.token)
+        """
+        if page_size < 1:
+            raise ValidationError('page_size must be at least 1')
+        key_columns = key_columns or self.get_table_primary_keys(table)
+        if not key_columns:
+            raise ValidationError(f'{table} has no primary key; pass key_columns')
+        if columns:
+            selected = {c.lower() for c in columns}
+            missing = [k for k in key_columns if k.lower() not in selected]
+            if missing:
+                raise ValidationError(f'columns must include the key columns {missing}')
+        if after is not None and len(after) != len(key_columns):
+            raise ValidationError(f'after {after!r} does not match key columns {key_columns}')
+        return TableScan(self, table, list(key_columns), page_size, columns, after, kwargs)
+
+    def select_since(self, table: str, watermark_column: str, last_value: Any = None,
+                     key_columns: list[str] | None = None, page_size: int = 50000,
+                     columns: list[str] | None = None, **kwargs: Any) -> IncrementalScan:
+        """Iterate over the rows whose watermark column is past last_value.
+
+        Rows are paged like iter_table, ordered by the watermark column and
+        then the table key, and loaded through the configured data loader.
+        Pair it with a WatermarkStore to only read rows changed since the
+        previous run. Rows with a NULL watermark are never returned.
+
+        last_value is either a scan's token, a (watermark, key...) tuple
+        resuming after that row, or a plain watermark value read strictly
+        past. Resuming from the token also reads rows committed after the
+        previous run with the same watermark (e.g. the same second of a
+        timestamp) and a higher key.
+
+        Args:
+            table: Table name
+            watermark_column: Monotonic column such as updated_at or a version
+            last_value: Token or watermark of the previous run (default: read all rows)
+            key_columns: Unique tie-breaking columns (default: primary key)
+            page_size: Rows per page
+            columns: Columns to select (default: all)
+            **kwargs: Passed to the data loader for each page
+
+        Returns
+            IncrementalScan: Iterable of pages exposing the new watermark
+
+        Examples
+            store = db.WatermarkStore(cn)
+            scan = cn.select_since('events', 'updated_at', store.get('events'))
+            for page in scan:
+                load(page)
+            store.set('events', scan.token)
+        """
+        if page_size < 1:
+            raise ValidationError('page_size must be at least 1')
+        key_columns = key_columns or self.get_table_primary_keys(table)
+        if not key_columns:
+            raise ValidationError(f'{table} has no primary key; pass key_columns')
+        ordering = [watermark_column] + [k for k in key_columns
+                                         if k.lower() != watermark_column.lower()]
+        if columns:
+            selected = {c.lower() for c in columns}
+            missing = [k for k in ordering if k.lower() not in selected]
+            if missing:
+                raise ValidationError(f'columns must include the key columns {missing}')
+
+        quoted = quote_identifier(watermark_column, self.dialect)
+        after, start = None, last_value
+        if isinstance(last_value, tuple):
+            if len(last_value) != len(ordering):
+                raise ValidationError(f'last_value token must hold values for {ordering}')
+            after, start = last_value, last_value[0]
+        if last_value is None or after is not None:
+            where, where_args = f'{quoted} is not null', ()
+        else:
+            where, where_args = f'{quoted} > %s', (TypeConverter.convert_value(last_value),)
+        return IncrementalScan(self, table, ordering, page_size, columns, after, kwargs,
+                               where=where, where_args=where_args, start=start)
+
     @check_connection
     def upsert_rows(
         self,
@@ -655,41 +1312,133 @@ class ConnectionWrapper:
         reset_sequence: bool = False,
         batch_size: int = 500,
         use_primary_key: bool = False,
-    ) -> int:
+        only_if_changed: bool = False,
+        returning: list[str] | None = None,
+        dedupe: str | None = None,
+    ) -> 'int | UpsertResult':
         """Perform an UPSERT operation (INSERT or UPDATE) for multiple rows.
 
         Conflict-target precedence: constraint_name (postgres only, by index
         or constraint name) > conflict_columns (explicit column list, must be
         covered by a unique constraint or unique index) > primary-key
         auto-detect.
+
+        With only_if_changed, conflicting rows whose update columns already
+        hold the new values are left untouched (no new row version, WAL or
+        triggers) and the returned count covers only inserted and actually
+        changed rows.
+
+        With returning (a list of columns, possibly empty) an UpsertResult
+        is returned instead of a count: inserted, updated and unchanged
+        counts plus the returning columns of each written row, collected
+        in the same round trips as the upsert itself.
+
+        dedupe collapses rows that share conflict-key values before any
+        SQL is generated: 'last' keeps the last row for each key, 'first'
+        the first, and 'error' raises ValidationError naming the
+        duplicated key. By default rows are sent as given.
         """
+        if dedupe is not None and dedupe not in DEDUPE_MODES:
+            raise ValidationError(f'dedupe must be one of {DEDUPE_MODES}, got {dedupe!r}')
+
         if not rows:
             logger.debug('Skipping upsert of empty rows')
-            return 0
+            return 0 if returning is None else UpsertResult()
 
         if constraint_name is not None and conflict_columns is not None:
             raise ValidationError('constraint_name and conflict_columns are mutually exclusive')
 
+        provided_keys = frozenset(key for row in rows for key in row)
+        plan = self._upsert_plan(table, provided_keys, constraint_name, conflict_columns,
+                                 update_cols_always, update_cols_ifnull, use_primary_key,
+                                 only_if_changed, returning)
+
+        if plan.needs_filter:
+            rows = tuple(self.filter_table_columns(table, list(rows)))
+
+        if not plan.columns:
+            logger.warning(f'No valid columns provided for table {table}')
+            return 0 if returning is None else UpsertResult()
+
+        if plan.sql is None:
+            if returning is not None:
+                raise ValidationError(f'returning requires a conflict target present in the rows for {table}')
+            logger.debug(f'No usable constraint or key columns for {table} upsert, falling back to INSERT')
+            return self.insert_rows(table, rows)
+
+        if dedupe is not None:
+            if not plan.conflict_cols:
+                raise ValidationError(f'dedupe requires the conflict key columns in the rows for {table}')
+            rows = _dedupe_rows(rows, plan.conflict_cols, dedupe)
+
+        columns = plan.columns
+        params = [[row[col] for col in columns] for row in rows]
+        if returning is not None:
+            return self._upsert_returning(get_db_strategy(self), plan.sql, params, table,
+                                          plan.key_cols, columns if plan.key_cols_in_data else None,
+                                          returning, batch_size, reset_sequence)
+
+        with self.write_lock():
+            cursor = self.cursor()
+            with self._observe(plan.sql, cursor):
+                rc = cursor.executemany(plan.sql, params, batch_size)
+
+            total_affected = rc if isinstance(rc, int) else 0
+            if isinstance(rc, int) and rc != len(rows):
+                logger.debug(f'{len(rows) - rc} rows skipped')
+
+            if reset_sequence:
+                self.reset_table_sequence(table)
+
+        return total_affected
+
+    def _upsert_plan(self, table: str, provided_keys: frozenset[str],
+                     constraint_name: str | None, conflict_columns: list[str] | None,
+                     update_cols_always: list[str] | None, update_cols_ifnull: list[str] | None,
+                     use_primary_key: bool, only_if_changed: bool,
+                     returning: list[str] | None) -> '_UpsertPlan':
+        """Return the cached plan for this upsert signature, resolving it once.
+
+        Plans are kept in the 'upsert_plans' cache, so they expire with
+        it, are dropped by Cache.clear_all() / clear_for_table(table), and
+        are dropped for a table when its columns or primary keys are
+        re-read with bypass_cache=True.
+        """
+        key = (id(self.engine), table, provided_keys, constraint_name,
+               _freeze(conflict_columns), _freeze(update_cols_always),
+               _freeze(update_cols_ifnull), use_primary_key, only_if_changed,
+               _freeze(returning))
+        plans = _upsert_plan_cache()
+        plan = plans.get(key)
+        if plan is None:
+            plan = self._resolve_upsert_plan(table, provided_keys, constraint_name,
+                                             conflict_columns, update_cols_always,
+                                             update_cols_ifnull, use_primary_key,
+                                             only_if_changed, returning)
+            plans[key] = plan
+        return plan
+
+    def _resolve_upsert_plan(self, table: str, provided_keys: frozenset[str],
+                             constraint_name: str | None, conflict_columns: list[str] | None,
+                             update_cols_always: list[str] | None,
+                             update_cols_ifnull: list[str] | None, use_primary_key: bool,
+                             only_if_changed: bool, returning: list[str] | None) -> '_UpsertPlan':
+        """Resolve columns, conflict target, update columns and SQL for an upsert.
+        """
         dialect = self.dialect
 
         if dialect != 'postgresql':
             constraint_name = None
 
-        filtered_rows = self.filter_table_columns(table, list(rows))
-        if not filtered_rows:
-            logger.debug(f'No valid columns found for {table} after filtering')
-            return 0
-        rows = tuple(filtered_rows)
-
         table_columns = self.get_table_columns(table)
         case_map = {col.lower(): col for col in table_columns}
 
-        provided_keys = {key for row in rows for key in row}
-        columns = tuple(col for col in table_columns if col in provided_keys)
+        needs_filter = not provided_keys <= set(table_columns)
+        provided = {case_map[key.lower()] for key in provided_keys if key.lower() in case_map}
+        columns = tuple(col for col in table_columns if col in provided)
 
         if not columns:
-            logger.warning(f'No valid columns provided for table {table}')
-            return 0
+            return _UpsertPlan(columns=(), needs_filter=needs_filter)
 
         should_update = update_cols_always is not None or update_cols_ifnull is not None
 
@@ -699,7 +1448,7 @@ class ConnectionWrapper:
             key_cols = self.get_table_primary_keys(table)
 
         provided_cols_lower = {col.lower() for col in columns}
-        key_cols_in_data = key_cols and all(k.lower() in provided_cols_lower for k in key_cols)
+        key_cols_in_data = bool(key_cols) and all(k.lower() in provided_cols_lower for k in key_cols)
 
         if dialect == 'sqlite' and not use_primary_key and not key_cols_in_data and conflict_columns is None:
             strategy = get_db_strategy(self)
@@ -712,10 +1461,12 @@ class ConnectionWrapper:
                         key_cols_in_data = True
                         break
 
+        fallback = _UpsertPlan(columns=columns, needs_filter=needs_filter)
+
         if should_update and ((dialect != 'postgresql') or (dialect == 'postgresql' and not constraint_name)):
             if not key_cols:
                 logger.debug(f'No primary keys found for {table}, falling back to INSERT')
-                return self.insert_rows(table, rows)
+                return fallback
 
         columns_lower = {col.lower() for col in columns}
         key_cols_lower = {k.lower() for k in key_cols} if key_cols else set()
@@ -740,14 +1491,17 @@ class ConnectionWrapper:
             update_cols_ifnull = valid_update_ifnull
 
         if (not key_cols or not key_cols_in_data) and (dialect != 'postgresql' or not constraint_name):
-            logger.debug(f'No usable constraint or key columns for {dialect} upsert, falling back to INSERT')
-            return self.insert_rows(table, rows)
+            return fallback
 
         strategy = get_db_strategy(self)
 
         constraint_expr = None
+        conflict_cols = list(key_cols) if key_cols_in_data else []
         if constraint_name and dialect == 'postgresql':
             constraint_expr = strategy.get_constraint_definition(self, table, constraint_name)
+            conflict_cols = strategy.get_constraint_columns(self, table, constraint_name)
+            if not all(c.lower() in provided_cols_lower for c in conflict_cols):
+                conflict_cols = []
 
         sql = strategy.build_upsert_sql(
             table=table,
@@ -756,28 +1510,90 @@ class ConnectionWrapper:
             constraint_expr=constraint_expr,
             update_cols_always=update_cols_always if should_update else None,
             update_cols_ifnull=update_cols_ifnull if should_update else None,
+            only_if_changed=only_if_changed,
+            returning=None if returning is None else [case_map.get(c.lower(), c) for c in returning],
+            column_types=strategy.get_column_types(self, table) if only_if_changed else None,
         )
+        return _UpsertPlan(columns=columns, needs_filter=needs_filter, sql=sql,
+                           key_cols=list(key_cols), key_cols_in_data=key_cols_in_data,
+                           conflict_cols=[case_map.get(c.lower(), c) for c in conflict_cols])
+
+    def _upsert_returning(self, strategy: Any, sql: str, params: list[list[Any]],
+                          table: str, key_cols: list[str], columns: tuple[str, ...] | None,
+                          returning: list[str], batch_size: int,
+                          reset_sequence: bool) -> UpsertResult:
+        """Run an upsert with RETURNING and break its outcome down.
+
+        columns is None when the conflict target is a named constraint
+        whose key columns need not be in the rows (PostgreSQL only).
+        """
+        key_positions = None
+        if columns is not None:
+            positions = {col.lower(): i for i, col in enumerate(columns)}
+            key_positions = [positions[k.lower()] for k in key_cols]
+        params = [TypeConverter.convert_params(p) for p in params]
+
+        with self.write_lock():
+            cursor = get_tuple_cursor(self)
+            with self._observe(sql, cursor):
+                returned, inserted = strategy.upsert_returning(
+                    cursor, sql, params, table, key_cols, key_positions, batch_size)
+            if not self.in_transaction:
+                ensure_commit(self)
 
-        params = [[row[col] for col in columns] for row in rows]
-
-        cursor = self.cursor()
-        rc = cursor.executemany(sql, params, batch_size)
-
-        total_affected = rc if isinstance(rc, int) else 0
-        if isinstance(rc, int) and rc != len(rows):
-            logger.debug(f'{len(rows) - rc} rows skipped')
-
-        if reset_sequence:
-            self.reset_table_sequence(table)
+            if reset_sequence:
+                self.reset_table_sequence(table)
 
-        return total_affected
+        logger.debug(f'Upsert into {table} returned {len(returned)} of {len(params)} rows')
+        return UpsertResult(inserted=inserted, updated=len(returned) - inserted,
+                            unchanged=len(params) - len(returned),
+                            rows=as_rows((tuple(r)[:len(returning)] for r in returned),
+                                         list(returning)))
 
-    def copy_from(self, table: str, file: TextIO,
+    def copy_from(self, table: str, source: CopySource,
                   columns: list[str] | None = None) -> int:
-        """Bulk load data from a file-like object using COPY.
+        """Bulk load rows using COPY (PostgreSQL) or chunked executemany (SQLite).
+
+        The source may be a CSV file-like object, an iterable of tuples or
+        dicts (including generators), a DataFrame, or an Arrow Table /
+        RecordBatchReader. Non-file sources are streamed, never buffered.
         """
         strategy = get_db_strategy(self)
-        return strategy.copy_from(self, table, file, columns)
+        with self.write_lock():
+            return strategy.copy_from(self, table, source, columns)
+
+    @contextmanager
+    def bulk_load(self, defer_indexes: list[str] | None = None,
+                  cache_size: int | None = -262144,
+                  journal_mode: str | None = None) -> Iterator[Self]:
+        """Run a large load as one transaction with durability relaxed.
+
+        On SQLite this switches to synchronous=OFF, raises cache_size
+        (negative values are KiB, default 256 MiB), optionally changes
+        journal_mode, and drops the non-unique indexes of the
+        defer_indexes tables until the load finishes. execute,
+        insert_rows, upsert_rows and copy_from calls made inside the block
+        join the single transaction instead of committing per chunk.
+        Everything is restored on exit; an exception rolls the whole load
+        back. On PostgreSQL it only provides the single transaction.
+
+        Examples
+            with cn.bulk_load(defer_indexes=['events']):
+                cn.copy_from('events', rows)
+        """
+        if self.in_transaction:
+            raise ValidationError('bulk_load cannot be nested inside a transaction')
+
+        self._ensure_connection()
+        strategy = get_db_strategy(self)
+        with self.write_lock():
+            self.in_transaction = True
+            try:
+                with strategy.bulk_load(self, defer_indexes=defer_indexes,
+                                        cache_size=cache_size, journal_mode=journal_mode):
+                    yield self
+            finally:
+                self.in_transaction = False
 
 
 def configure_connection(sa_connection: sa.engine.Connection) -> None:
@@ -807,6 +1623,7 @@ def connect(options: DatabaseOptions | dict[str, Any] | str,
         pool_max_connections: Maximum connections in pool (default: 5)
         pool_max_idle_time: Maximum seconds a connection can be idle (default: 300)
         pool_wait_timeout: Maximum seconds to wait for a connection (default: 30)
+        sqlite_readers: Size of the SQLite read-only pool for select calls (default: 0)
 
     Returns
         ConnectionWrapper object for connecting to the database
@@ -826,4 +1643,8 @@ def connect(options: DatabaseOptions | dict[str, Any] | str,
     sa_connection = engine.connect()
     configure_connection(sa_connection)
 
-    return ConnectionWrapper(sa_connection, options)
+    cn = ConnectionWrapper(sa_connection, options)
+    cn.read_engine = get_read_engine_for_options(options)
+    if cn.read_engine is not None:
+        cn._writer_lock = _get_writer_lock(options)
+    return cn
@@ -7,13 +7,16 @@ import logging
 import re
 import time
 from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from typing import Any
 
 from database.exceptions import QueryError
-from database.sql import has_placeholders
+from database.options import get_batch_stages
+from database.row import as_rows
+from database.sql import fingerprint, has_placeholders
 from database.strategy import get_db_strategy
-from database.types import RowAdapter, TypeConverter
+from database.types import Column, TypeConverter
 from database.types import columns_from_cursor_description
 from database.utils import ensure_commit
 
@@ -39,6 +42,7 @@ def dumpsql(is_many: bool = False):
         @wraps(func)
         def wrapper(self, operation: str, *args: Any, **kwargs: Any):
             start = time.perf_counter()
+            self.last_sql = operation
             if is_many:
                 row_count = len(args[0]) if args and args[0] else 0
                 logger.debug('SQL:\n%s\nparams: %d rows', operation, row_count)
@@ -46,6 +50,8 @@ def dumpsql(is_many: bool = False):
                 logger.debug('SQL:\n%s\nargs: %s', operation, args)
             try:
                 result = func(self, operation, *args, **kwargs)
+                if self.event is not None and isinstance(result, int):
+                    self.event.rowcount = result
                 if hasattr(self.dbapi_cursor, 'statusmessage'):
                     logger.debug('%s result: %s',
                                  label, self.dbapi_cursor.statusmessage)
@@ -60,6 +66,8 @@ def dumpsql(is_many: bool = False):
             finally:
                 elapsed = time.perf_counter() - start
                 self.connwrapper._addcall(elapsed)
+                if self.event is not None:
+                    self.event.execute_time += elapsed
                 logger.debug('%s time: %.4fs', label, elapsed)
         return wrapper
     return decorator
@@ -84,6 +92,8 @@ class Cursor:
         self.connwrapper = connection_wrapper
         self._strategy = strategy
         self._arraysize: int = 1
+        self.event: Any = None  # QueryEvent while instrumentation is active
+        self.last_sql: str | None = None
 
     @property
     def strategy(self) -> Any:
@@ -100,6 +110,18 @@ class Cursor:
         """Return iterator for cursor results."""
         return iter_chunk(self.dbapi_cursor)
 
+    @property
+    def fingerprint(self) -> str | None:
+        """Fingerprint of the last executed statement, or None.
+
+        Computed on first access per statement (see database.sql.fingerprint),
+        so executions that never ask for it pay nothing.
+        """
+        if self.last_sql is None:
+            return None
+        dialect = getattr(self.connwrapper, 'dialect', None) or 'postgresql'
+        return fingerprint(self.last_sql, dialect)
+
     @property
     def description(self) -> list[tuple] | None:
         """Column descriptions for last query."""
@@ -123,18 +145,31 @@ class Cursor:
         """Close cursor."""
         self.dbapi_cursor.close()
 
+    def _observed_fetch(self, fetch: Any, *args: Any) -> Any:
+        """Run a fetch call, recording rows and time on the active event."""
+        start = time.perf_counter()
+        rows = fetch(*args)
+        self.event.record_fetch(rows, time.perf_counter() - start)
+        return rows
+
     def fetchone(self) -> tuple | None:
         """Fetch next row."""
+        if self.event is not None:
+            return self._observed_fetch(self.dbapi_cursor.fetchone)
         return self.dbapi_cursor.fetchone()
 
     def fetchmany(self, size: int | None = None) -> list[tuple]:
         """Fetch next set of rows."""
         if size is None:
             size = self.arraysize
+        if self.event is not None:
+            return self._observed_fetch(self.dbapi_cursor.fetchmany, size)
         return self.dbapi_cursor.fetchmany(size)
 
     def fetchall(self) -> list[tuple]:
         """Fetch all remaining rows."""
+        if self.event is not None:
+            return self._observed_fetch(self.dbapi_cursor.fetchall)
         return self.dbapi_cursor.fetchall()
 
     def setinputsizes(self, sizes: Sequence) -> None:
@@ -306,6 +341,15 @@ def get_dict_cursor(cn: Any) -> Cursor:
     return Cursor(cursor, cn, strategy)
 
 
+def get_tuple_cursor(cn: Any) -> Cursor:
+    """Get cursor that returns rows as plain tuples.
+    """
+    raw_conn = cn.connection if hasattr(cn, 'connection') else cn
+    strategy = get_db_strategy(cn)
+    cursor = strategy.create_tuple_cursor(raw_conn)
+    return Cursor(cursor, cn, strategy)
+
+
 def extract_column_info(cursor: 'Any', table_name: str | None = None) -> list['Any']:
     """Extract column information from cursor description based on database type."""
     if cursor.description is None:
@@ -327,27 +371,74 @@ def extract_column_info(cursor: 'Any', table_name: str | None = None) -> list['A
 
 
 def load_data(cursor: 'Any', columns: list['Any'] | None = None,
-              **kwargs: Any) -> Any:
-    """Data loader callable that processes cursor results into the configured format."""
+              fetch_batch_size: int | None = None, **kwargs: Any) -> Any:
+    """Data loader callable that processes cursor results into the configured format.
+
+    Rows reach the data loader as Row objects sharing one column index.
+    With fetch_batch_size (keyword or connection option) and a built-in
+    data loader, rows are fetched in batches while a worker thread
+    converts the previous batch; see _load_pipelined.
+    """
     if columns is None:
         columns = extract_column_info(cursor)
 
+    options = cursor.connwrapper.options
+    data_loader = options.data_loader
+    if fetch_batch_size is None:
+        fetch_batch_size = getattr(options, 'fetch_batch_size', 0)
+    stages = get_batch_stages(data_loader) if fetch_batch_size else None
+    if stages is not None:
+        return _load_pipelined(cursor, columns, fetch_batch_size, stages, **kwargs)
+
     data = cursor.fetchall()
 
     if not data:
-        data_loader = cursor.connwrapper.options.data_loader
         return data_loader([], columns, **kwargs)
 
-    adapted_data = []
-    for row in data:
-        adapter = RowAdapter.create(cursor.connwrapper, row)
-        if hasattr(adapter, 'cursor'):
-            adapter.cursor = cursor
-        adapted_data.append(adapter.to_dict())
-    data = adapted_data
+    event = getattr(cursor, 'event', None)
+    if event is None:
+        return data_loader(as_rows(data, Column.get_names(columns)), columns, **kwargs)
 
-    data_loader = cursor.connwrapper.options.data_loader
-    return data_loader(data, columns, **kwargs)
+    start = time.perf_counter()
+    result = data_loader(as_rows(data, Column.get_names(columns)), columns, **kwargs)
+    event.load_time += time.perf_counter() - start
+    return result
+
+
+def _load_pipelined(cursor: 'Any', columns: list['Any'], size: int,
+                    stages: tuple, **kwargs: Any) -> Any:
+    """Fetch batches on this thread while one worker converts them.
+
+    Each fetchmany batch is handed to a single worker thread that turns
+    it into a columnar chunk (a list, DataFrame or Arrow table depending
+    on the loader) while the next batch is fetched. The chunks are
+    combined once at the end. Conversion and combine time is recorded
+    as load time on the active event.
+    """
+    convert, finish = stages
+    names = Column.get_names(columns)
+
+    def timed_convert(rows: list) -> tuple[Any, float]:
+        start = time.perf_counter()
+        chunk = convert(as_rows(rows, names), columns, **kwargs)
+        return chunk, time.perf_counter() - start
+
+    futures = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        while rows := cursor.fetchmany(size):
+            futures.append(pool.submit(timed_convert, rows))
+            if len(rows) < size:
+                break
+    if not futures:
+        return cursor.connwrapper.options.data_loader([], columns, **kwargs)
+
+    results = [future.result() for future in futures]
+    start = time.perf_counter()
+    result = finish([chunk for chunk, _ in results], columns, **kwargs)
+    event = getattr(cursor, 'event', None)
+    if event is not None:
+        event.load_time += time.perf_counter() - start + sum(elapsed for _, elapsed in results)
+    return result
 
 
 def process_multiple_result_sets(cursor: 'Any', return_all: bool = False,
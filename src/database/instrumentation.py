@@ -0,0 +1,328 @@
+"""
+Query instrumentation hooks and an in-process latency aggregator.
+
+Hooks registered with add_query_hook() see every statement issued through
+a ConnectionWrapper: before_execute() fires before the statement runs and
+after_execute() once its results have been fetched and loaded, with the
+execute / fetch / data-loader time split, row and byte counts, and retry
+count. When no hooks are registered nothing is measured. Events carry the
+normalized statement text and its fingerprint (see database.sql), so
+executions differing only in literals or IN-list length group together.
+
+QueryStats is a ready-made hook that keeps an HDR-style latency histogram
+per statement and reports the top statements by total time.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from database.sql import fingerprint, normalize_sql
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'QueryEvent',
+    'QueryHook',
+    'LatencyHistogram',
+    'QueryStats',
+    'add_query_hook',
+    'remove_query_hook',
+]
+
+# Copy-on-write so the hot path reads the tuple without locking
+_hooks: tuple['QueryHook', ...] = ()
+_hooks_lock = threading.RLock()
+
+
+@dataclass(slots=True)
+class QueryEvent:
+    """One statement execution as seen by query hooks.
+
+    Times are in seconds. bytes_fetched is an estimate: the length of
+    str/bytes values plus 8 bytes for every other non-null value.
+    """
+    sql: str
+    statement: str
+    fingerprint: str = ''
+    dialect: str | None = None
+    rowcount: int = -1
+    rows_fetched: int = 0
+    bytes_fetched: int = 0
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    load_time: float = 0.0
+    retries: int = 0
+    error: BaseException | None = None
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0
+
+    def record_fetch(self, rows: Any, elapsed: float) -> None:
+        """Account for rows returned by a fetch call.
+
+        Args:
+            rows: A row, a list of rows, or None
+            elapsed: Seconds spent in the fetch call
+        """
+        self.fetch_time += elapsed
+        if rows is None:
+            return
+        if not isinstance(rows, list):
+            rows = [rows]
+        self.rows_fetched += len(rows)
+        self.bytes_fetched += _estimate_bytes(rows)
+
+
+def _estimate_bytes(rows: list) -> int:
+    """Estimate the payload size of fetched rows.
+    """
+    total = 0
+    for row in rows:
+        values = row.values() if hasattr(row, 'values') else row
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(value, (str, bytes, bytearray, memoryview)):
+                total += len(value)
+            else:
+                total += 8
+    return total
+
+
+class QueryHook:
+    """Base class for query hooks; override either method.
+    """
+
+    def before_execute(self, event: QueryEvent) -> None:
+        """Called before the statement is sent to the database."""
+
+    def after_execute(self, event: QueryEvent) -> None:
+        """Called after the statement finished (or failed) and its results
+        were fetched and loaded.
+        """
+
+
+def add_query_hook(hook: QueryHook) -> None:
+    """Register a hook for every statement in this process.
+    """
+    global _hooks
+    with _hooks_lock:
+        if hook not in _hooks:
+            _hooks = (*_hooks, hook)
+
+
+def remove_query_hook(hook: QueryHook) -> None:
+    """Unregister a hook; unknown hooks are ignored.
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def start_event(sql: str, dialect: str | None = None,
+                retries: int = 0) -> QueryEvent | None:
+    """Create an event and fire before_execute, or return None when no
+    hooks are registered.
+    """
+    hooks = _hooks
+    if not hooks:
+        return None
+    flavor = dialect or 'postgresql'
+    event = QueryEvent(sql=sql, statement=normalize_sql(sql, flavor),
+                       fingerprint=fingerprint(sql, flavor),
+                       dialect=dialect, retries=retries)
+    for hook in hooks:
+        try:
+            hook.before_execute(event)
+        except Exception as e:
+            logger.warning(f'Query hook {hook!r} failed in before_execute: {e}')
+    return event
+
+
+def finish_event(event: QueryEvent) -> None:
+    """Stamp the elapsed time and fire after_execute.
+    """
+    event.elapsed = time.perf_counter() - event.started
+    for hook in _hooks:
+        try:
+            hook.after_execute(event)
+        except Exception as e:
+            logger.warning(f'Query hook {hook!r} failed in after_execute: {e}')
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are recorded in microseconds into buckets that are linear
+    within each power of two, with 2**precision_bits buckets per octave,
+    so any reported percentile is within 1/2**precision_bits (about 3%
+    at the default of 5) of the true value. Storage is sparse and grows
+    with the number of distinct buckets, not with the sample count.
+    """
+
+    def __init__(self, precision_bits: int = 5) -> None:
+        self.precision_bits = precision_bits
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def _index(self, micros: int) -> int:
+        shift = max(micros.bit_length() - self.precision_bits - 1, 0)
+        return (shift << self.precision_bits) + (micros >> shift)
+
+    def _upper_bound(self, index: int) -> int:
+        shift = max((index >> self.precision_bits) - 1, 0)
+        mantissa = index - (shift << self.precision_bits)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one latency sample given in seconds.
+        """
+        index = self._index(max(int(seconds * 1_000_000), 0))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, pct: float) -> float:
+        """Return the latency in seconds at the given percentile (0-100).
+        """
+        if not self.count:
+            return 0.0
+        target = max(pct / 100 * self.count, 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index) / 1_000_000, self.max)
+        return self.max
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add another histogram's samples to this one.
+        """
+        if other.precision_bits != self.precision_bits:
+            raise ValueError('Cannot merge histograms with different precision')
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+@dataclass
+class StatementStats:
+    """Accumulated metrics for one statement.
+    """
+    statement: str
+    fingerprint: str = ''
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    rows: int = 0
+    bytes: int = 0
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    load_time: float = 0.0
+    retries: int = 0
+    errors: int = 0
+
+
+class QueryStats(QueryHook):
+    """Aggregate per-statement latency histograms in process.
+
+    Examples
+        stats = QueryStats()
+        db.add_query_hook(stats)
+        ...
+        print(stats.format_report(top=10))
+    """
+
+    def __init__(self, precision_bits: int = 5) -> None:
+        self.precision_bits = precision_bits
+        self.statements: dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def after_execute(self, event: QueryEvent) -> None:
+        """Fold a finished event into its statement's stats.
+        """
+        with self._lock:
+            stats = self.statements.get(event.statement)
+            if stats is None:
+                stats = StatementStats(event.statement, event.fingerprint,
+                                       LatencyHistogram(self.precision_bits))
+                self.statements[event.statement] = stats
+            stats.histogram.record(event.elapsed)
+            # psycopg also reports SELECT result sizes as rowcount, so
+            # rowcount only counts for statements that fetched nothing
+            stats.rows += event.rows_fetched or max(event.rowcount, 0)
+            stats.bytes += event.bytes_fetched
+            stats.execute_time += event.execute_time
+            stats.fetch_time += event.fetch_time
+            stats.load_time += event.load_time
+            stats.retries += event.retries
+            stats.errors += event.error is not None
+
+    def reset(self) -> None:
+        """Discard all collected stats.
+        """
+        with self._lock:
+            self.statements.clear()
+
+    def report(self, top: int = 10, sort_by: str = 'total_time') -> list[dict[str, Any]]:
+        """Return the top statements as a list of dicts.
+
+        Args:
+            top: Number of statements to return
+            sort_by: Any numeric key of the returned dicts, e.g.
+                'total_time', 'count', 'p99' or 'max'
+
+        Returns
+            One dict per statement with its fingerprint, count, total/mean/p50/p95/p99/max
+            latency in seconds, the execute/fetch/load split, rows, bytes,
+            retries and errors, sorted descending by sort_by
+        """
+        with self._lock:
+            rows = []
+            for stats in self.statements.values():
+                hist = stats.histogram
+                rows.append({
+                    'statement': stats.statement,
+                    'fingerprint': stats.fingerprint,
+                    'count': hist.count,
+                    'total_time': hist.total,
+                    'mean': hist.total / hist.count if hist.count else 0.0,
+                    'p50': hist.percentile(50),
+                    'p95': hist.percentile(95),
+                    'p99': hist.percentile(99),
+                    'max': hist.max,
+                    'execute_time': stats.execute_time,
+                    'fetch_time': stats.fetch_time,
+                    'load_time': stats.load_time,
+                    'rows': stats.rows,
+                    'bytes': stats.bytes,
+                    'retries': stats.retries,
+                    'errors': stats.errors,
+                })
+        rows.sort(key=lambda r: r[sort_by], reverse=True)
+        return rows[:top]
+
+    def format_report(self, top: int = 10, sort_by: str = 'total_time',
+                      width: int = 60) -> str:
+        """Render report() as a fixed-width text table (times in ms).
+        """
+        header = (f"{'total':>10} {'count':>7} {'p50':>8} {'p95':>8} {'p99':>8} "
+                  f"{'max':>8} {'rows':>9}  statement")
+        lines = [header]
+        for r in self.report(top, sort_by):
+            statement = r['statement']
+            if len(statement) > width:
+                statement = statement[:width - 3] + '...'
+            lines.append(
+                f"{r['total_time'] * 1000:>10.1f} {r['count']:>7} "
+                f"{r['p50'] * 1000:>8.2f} {r['p95'] * 1000:>8.2f} "
+                f"{r['p99'] * 1000:>8.2f} {r['max'] * 1000:>8.2f} "
+                f"{r['rows']:>9}  {statement}")
+        return '\n'.join(lines)
@@ -1,17 +1,23 @@
+import datetime
 from collections.abc import Callable
 from dataclasses import dataclass
+from decimal import Decimal
 from functools import wraps
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-import pyarrow as pa
 from database.exceptions import ValidationError
+from database.row import Row
+from database.sql import IN_BINDINGS
 from database.strategy import get_available_dialects, get_strategy_class
 from database.strategy import is_supported_dialect
 from database.types import Column
 
 from libb import ConfigOptions, scriptname
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
 __all__ = [
     'DatabaseOptions',
     'pandas_numpy_data_loader',
@@ -53,40 +59,195 @@ def iterdict_data_loader(data, column_info, **kwargs) -> list[dict]:
     return list(data)
 
 
-def _empty_dataframe(columns) -> pd.DataFrame:
+def _empty_dataframe(columns) -> 'pd.DataFrame':
     """Create empty DataFrame with column metadata."""
+    import pandas as pd
+
     df = pd.DataFrame(columns=Column.get_names(columns))
     df.attrs['column_types'] = Column.get_column_types_dict(columns)
     return df
 
 
-def pandas_numpy_data_loader(data, columns, **kwargs) -> pd.DataFrame:
+# Value types a column must hold for its python_type to set the dtype;
+# python_type can be a guess (e.g. from the column name), so it is
+# only trusted when the values agree.
+_TYPED_VALUES = {
+    int: {int},
+    float: {float, int, Decimal},
+    bool: {bool},
+    str: {str},
+    datetime.date: {datetime.date},
+    datetime.datetime: {datetime.datetime},
+}
+
+
+def _column_values(data, column_names) -> list[list]:
+    """Transpose a batch of rows into one list of values per column."""
+    if isinstance(data[0], Row):
+        return [list(values) for values in zip(*(row.values() for row in data))]
+    return [[row[col] for row in data] for col in column_names]
+
+
+def _agrees(values: list, python_type: type | None) -> tuple[bool, bool]:
+    """Return (values match python_type, values include NULL)."""
+    kinds = set(map(type, values))
+    has_null = type(None) in kinds
+    kinds.discard(type(None))
+    return python_type in _TYPED_VALUES and kinds <= _TYPED_VALUES[python_type], has_null
+
+
+def _numpy_array(values: list, python_type: type | None) -> Any:
+    """Build a column with the dtype implied by python_type.
+
+    Integers become int64 (nullable Int64 with NULLs), floats and numerics
+    float64, booleans bool (nullable boolean with NULLs) and dates and
+    datetimes datetime64[ns]. Returns the values unchanged for pandas to
+    infer when they do not match python_type or do not fit the dtype.
+    """
+    import numpy as np
+    import pandas as pd
+
+    agrees, has_null = _agrees(values, python_type)
+    if not agrees or python_type is str:
+        return values
+    try:
+        if python_type is int:
+            return pd.array(values, dtype='Int64') if has_null else np.array(values, dtype=np.int64)
+        if python_type is float:
+            return np.array(values, dtype=np.float64)
+        if python_type is bool:
+            return pd.array(values, dtype='boolean') if has_null else np.array(values, dtype=bool)
+        return pd.to_datetime(values).as_unit('ns')
+    except (OverflowError, TypeError, ValueError):
+        return values
+
+
+def _arrow_array(values: list, python_type: type | None) -> 'pa.Array':
+    """Build an Arrow array typed from python_type, or inferred on mismatch."""
+    import pyarrow as pa
+
+    arrow_types = {int: pa.int64(), float: pa.float64(), bool: pa.bool_(),
+                   str: pa.string(), datetime.date: pa.date32()}
+    if _agrees(values, python_type)[0] and python_type in arrow_types:
+        try:
+            return pa.array(values, type=arrow_types[python_type])
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass
+    return pa.array(values)
+
+
+def _categorize(df: 'pd.DataFrame', columns, category_threshold: float) -> None:
+    """Convert low-cardinality text columns to the category dtype in place.
+
+    A text column becomes categorical when its distinct values number at
+    most category_threshold times the row count.
+    """
+    if not category_threshold:
+        return
+    for i, column in enumerate(columns):
+        series = df.iloc[:, i]
+        if column.python_type is str and series.nunique() <= category_threshold * len(df):
+            df.isetitem(i, series.astype('category'))
+
+
+def _numpy_chunk(data, columns, **kwargs) -> 'pd.DataFrame':
+    """Build a DataFrame with typed columns from a non-empty batch of rows."""
+    import pandas as pd
+
+    column_names = Column.get_names(columns)
+    arrays = [_numpy_array(values, column.python_type)
+              for values, column in zip(_column_values(data, column_names), columns)]
+    df = pd.DataFrame(dict(enumerate(arrays)))
+    df.columns = column_names
+    return df
+
+
+def _numpy_finish(chunks, columns, category_threshold: float = 0, **kwargs) -> 'pd.DataFrame':
+    """Concatenate batch DataFrames and attach column metadata.
+
+    Columns whose dtype differs between batches (e.g. inferred from NULLs
+    alone in one) are re-inferred so the result matches a single batch.
+    """
+    import pandas as pd
+
+    if len(chunks) == 1:
+        df = chunks[0]
+    else:
+        df = pd.concat(chunks, ignore_index=True)
+        for i in range(df.shape[1]):
+            if len({chunk.dtypes.iloc[i] for chunk in chunks}) > 1:
+                df.isetitem(i, df.iloc[:, i].infer_objects())
+    _categorize(df, columns, category_threshold)
+    df.attrs['column_types'] = Column.get_column_types_dict(columns)
+    return df
+
+
+def _arrow_chunk(data, columns, **kwargs) -> 'pa.Table':
+    """Build an Arrow table with typed columns from a non-empty batch of rows."""
+    import pyarrow as pa
+
+    column_names = Column.get_names(columns)
+    arrays = [_arrow_array(values, column.python_type)
+              for values, column in zip(_column_values(data, column_names), columns)]
+    return pa.table(arrays, names=column_names)
+
+
+def _arrow_finish(chunks, columns, category_threshold: float = 0, **kwargs) -> 'pd.DataFrame':
+    """Concatenate batch tables, promoting types, and convert once."""
+    import pandas as pd
+    import pyarrow as pa
+
+    table = chunks[0] if len(chunks) == 1 else pa.concat_tables(chunks, promote_options='permissive')
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    _categorize(df, columns, category_threshold)
+    df.attrs['column_types'] = Column.get_column_types_dict(columns)
+    return df
+
+
+def pandas_numpy_data_loader(data, columns, **kwargs) -> 'pd.DataFrame':
     """Standard pandas DataFrame loader using NumPy.
 
     Always returns a DataFrame, never None, with columns preserved for empty results.
-    Includes type information in the DataFrame.attrs attribute.
+    Columns get explicit dtypes from Column.python_type where the values
+    agree (see _numpy_array); pass category_threshold to store
+    low-cardinality text as category. Includes type information in the
+    DataFrame.attrs attribute. pandas is imported on the first call.
     """
     if not data:
         return _empty_dataframe(columns)
+    return _numpy_finish([_numpy_chunk(data, columns)], columns, **kwargs)
 
-    df = pd.DataFrame.from_records(list(data), columns=Column.get_names(columns))
-    df.attrs['column_types'] = Column.get_column_types_dict(columns)
-    return df
 
-
-def pandas_pyarrow_data_loader(data, columns, **kwargs) -> pd.DataFrame:
+def pandas_pyarrow_data_loader(data, columns, **kwargs) -> 'pd.DataFrame':
     """PyArrow-based pandas DataFrame loader.
 
     Always returns a DataFrame, never None, with columns preserved for empty results.
+    Arrow column types come from Column.python_type where the values
+    agree; category_threshold works as for pandas_numpy_data_loader.
+    pandas and pyarrow are imported on the first call.
     """
     if not data:
         return _empty_dataframe(columns)
+    return _arrow_finish([_arrow_chunk(data, columns)], columns, **kwargs)
 
-    column_names = Column.get_names(columns)
-    columns_data = [[row[col] for row in data] for col in column_names]
-    df = pa.table(columns_data, names=column_names).to_pandas(types_mapper=pd.ArrowDtype)
-    df.attrs['column_types'] = Column.get_column_types_dict(columns)
-    return df
+
+_BATCH_STAGES: dict[Callable, tuple[Callable, Callable]] = {
+    iterdict_data_loader: (lambda data, columns, **kwargs: list(data),
+                           lambda chunks, columns, **kwargs: [row for chunk in chunks for row in chunk]),
+    pandas_numpy_data_loader: (_numpy_chunk, _numpy_finish),
+    pandas_pyarrow_data_loader: (_arrow_chunk, _arrow_finish),
+}
+
+
+def get_batch_stages(data_loader: Callable) -> tuple[Callable, Callable] | None:
+    """Return (convert, finish) for loading a result in batches.
+
+    convert(rows, columns, **kwargs) turns one non-empty batch into a chunk
+    and finish(chunks, columns, **kwargs) combines the chunks into what data_loader
+    would have returned for all rows. Returns None for loaders that can
+    only see the whole result at once.
+    """
+    return _BATCH_STAGES.get(data_loader)
 
 
 @dataclass
@@ -100,6 +261,26 @@ class DatabaseOptions(ConfigOptions):
     - pool_max_connections: Maximum connections in pool (default: 5)
     - pool_max_idle_time: Maximum seconds a connection can be idle (default: 300)
     - pool_wait_timeout: Maximum seconds to wait for a connection (default: 30)
+
+    SQLite PRAGMA options (applied once per physical connection):
+    - sqlite_profile: 'default', 'read_heavy', 'bulk_write' or 'low_memory'
+    - sqlite_pragmas: PRAGMA overrides layered on the profile, e.g.
+      {'mmap_size': 1073741824, 'cache_size': -131072}
+    - sqlite_readers: Size of a separate pool of read-only (mode=ro)
+      connections used for select calls; writes are serialized through
+      one writer at a time per database file (default: 0, disabled)
+
+    Query options:
+    - in_binding: How `IN %s` lists are bound. 'expand' emits one
+      placeholder per value; 'array' binds the whole list as a single
+      parameter (PostgreSQL `= ANY(%s)`, SQLite `json_each(?)`), avoiding
+      huge statements and driver parameter limits (default: 'expand')
+    - in_chunk_size: Split a `select` whose expanded IN list is longer
+      than this into one query per chunk and load the combined rows
+      (default: 0, disabled); see ConnectionWrapper.select
+    - fetch_batch_size: Fetch results in batches of this many rows and
+      convert each batch on a worker thread while the next is fetched,
+      for the built-in data loaders (default: 0, fetch all then load)
     """
     drivername: str = 'postgresql'
     hostname: str = None
@@ -115,6 +296,13 @@ class DatabaseOptions(ConfigOptions):
     pool_max_connections: int = 5
     pool_max_idle_time: int = 300
     pool_wait_timeout: int = 30
+    # SQLite PRAGMA tuning
+    sqlite_profile: str | None = None
+    sqlite_pragmas: dict[str, Any] | None = None
+    sqlite_readers: int = 0
+    in_binding: str = 'expand'
+    in_chunk_size: int = 0
+    fetch_batch_size: int = 0
 
     def __post_init__(self):
         if not is_supported_dialect(self.drivername):
@@ -123,6 +311,12 @@ class DatabaseOptions(ConfigOptions):
         self.appname = self.appname or scriptname() or 'python_console'
         strategy_cls = get_strategy_class(self.drivername)
         strategy_cls.validate_options(self)
+        if self.in_binding not in IN_BINDINGS:
+            raise ValidationError(f'in_binding must be one of: {IN_BINDINGS}')
+        if not isinstance(self.in_chunk_size, int) or self.in_chunk_size < 0:
+            raise ValidationError('in_chunk_size must be a non-negative integer')
+        if not isinstance(self.fetch_batch_size, int) or self.fetch_batch_size < 0:
+            raise ValidationError('fetch_batch_size must be a non-negative integer')
         if self.data_loader is None:
             self.data_loader = pandas_numpy_data_loader
 
@@ -1,16 +1,109 @@
-"""Row factory implementations for dictionary-like cursor results."""
-from numbers import Number
+"""Row types and row factory implementations for cursor results."""
+from collections.abc import Iterable, Iterator, Mapping
 from typing import Any
 
+from database.types import NUMERIC_OID, numeric_loads_as_float
 from database.types import postgres_types
+from psycopg.pq import Format
+
+
+class Row(Mapping):
+    """Read-only result row backed by a tuple.
+
+    Values live in a tuple and column names in a name -> position map
+    shared by every row of a result set, so a row costs one small object
+    plus its tuple instead of a dict. Supports row['col'], row.col,
+    row[0], keys(), get() and to_dict(), and compares equal to a dict
+    with the same items.
+    """
+
+    __slots__ = ('_values', '_index')
+
+    def __init__(self, values: tuple, index: dict[str, int]) -> None:
+        """Initialize from a value tuple and a shared column index.
+
+        Args:
+            values: Column values in cursor order
+            index: Mapping of column name to position, see build_index
+        """
+        self._values = values
+        self._index = index
+
+    @staticmethod
+    def build_index(names: Iterable[str]) -> dict[str, int]:
+        """Build the shared name -> position map for a result set.
+
+        Duplicate names resolve to the last position, as with dict rows.
+        """
+        return {name: i for i, name in enumerate(names)}
+
+    def __getitem__(self, key: str | int) -> Any:
+        if isinstance(key, str):
+            return self._values[self._index[key]]
+        return self._values[key]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        try:
+            return self._values[self._index[name]]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __reduce__(self) -> tuple:
+        return Row, (self._values, self._index)
+
+    def __repr__(self) -> str:
+        return f'Row({self.to_dict()!r})'
+
+    def keys(self):
+        """Column names, in cursor order."""
+        return self._index.keys()
+
+    def values(self) -> tuple:
+        """Column values, in cursor order, as the backing tuple."""
+        return self._values
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a mutable dict copy of the row."""
+        return {name: self._values[i] for name, i in self._index.items()}
+
+
+def as_rows(data: Iterable[Any], names: list[str]) -> list[Row]:
+    """Convert fetched rows (tuples, sqlite3.Row, dicts) into Rows.
+
+    Rows that are already Row instances are passed through unchanged.
+    """
+    index = Row.build_index(names)
+    rows = []
+    for row in data:
+        if isinstance(row, Row):
+            rows.append(row)
+        elif isinstance(row, dict):
+            rows.append(Row(tuple(row.values()), index))
+        else:
+            rows.append(Row(tuple(row), index))
+    return rows
 
 
 class DictRowFactory:
     """Row factory for psycopg that returns dictionary-like rows.
 
     This factory is used with PostgreSQL connections to convert cursor results
-    into dictionaries, with automatic type casting for numeric values based
-    on PostgreSQL type codes.
+    into Row objects sharing one column index per result set. Casts are
+    planned once per result set from the column OIDs: only numeric columns
+    need one (Decimal to float), and none do when the connection loads
+    numeric as float (see register_numeric_float_loaders), in which case
+    rows pass through untouched.
     """
 
     def __init__(self, cursor: Any) -> None:
@@ -19,21 +112,54 @@ class DictRowFactory:
         Args:
             cursor: Database cursor with description attribute
         """
-        self.fields = [
-            (c.name, postgres_types.get(c.type_code))
-            for c in (cursor.description or [])
+        description = cursor.description or []
+        self.index = Row.build_index(c.name for c in description)
+
+        adapters = getattr(cursor, 'adapters', None)
+        fmt = getattr(cursor, 'format', Format.TEXT)
+        native = adapters is not None and numeric_loads_as_float(adapters, fmt)
+        self.casts = [
+            (i, postgres_types[NUMERIC_OID])
+            for i, c in enumerate(description)
+            if c.type_code == NUMERIC_OID and not native
         ]
 
-    def __call__(self, values: tuple) -> dict:
-        """Convert a row tuple to a dictionary.
+    def _cast(self, values: tuple) -> tuple:
+        """Apply the planned casts to a row tuple."""
+        if not self.casts:
+            return values
+        values = list(values)
+        for i, cast in self.casts:
+            if values[i] is not None:
+                values[i] = cast(values[i])
+        return tuple(values)
+
+    def __call__(self, values: tuple) -> Row:
+        """Convert a row tuple to a Row.
+
+        Args:
+            values: Tuple of column values from cursor
+
+        Returns
+            Row mapping column names to values
+        """
+        return Row(self._cast(values), self.index)
+
+
+class TupleRowFactory(DictRowFactory):
+    """Row factory for psycopg that returns plain tuples.
+
+    Applies the same casts as DictRowFactory without building a Row per
+    row.
+    """
+
+    def __call__(self, values: tuple) -> tuple:
+        """Cast a row tuple's numeric values.
 
         Args:
             values: Tuple of column values from cursor
 
         Returns
-            Dictionary mapping column names to values
+            Tuple of column values
         """
-        return {
-            name: cast(value) if isinstance(value, Number) and cast is not None else value
-            for (name, cast), value in zip(self.fields, values)
-        }
+        return self._cast(values)
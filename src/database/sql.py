@@ -8,9 +8,17 @@ Public API:
 - quote_identifier(name, dialect) - Quote table/column names
 - has_placeholders(sql) - Check for parameter placeholders
 - standardize_placeholders(sql, dialect) - Convert %s <-> ?
+- normalize_sql(sql, dialect) / fingerprint(sql, dialect) - Canonical
+  statement text and its stable hash, for metrics and caching keys
+- ArrayParam(values) - Bind one IN list as a single array parameter
+- split_in_list(sql, args, dialect, size) - Split an oversized IN list
+  into per-chunk argument sets
 """
+import hashlib
+import json
 import re
 from collections import namedtuple
+from functools import lru_cache
 from typing import Any
 
 from database.exceptions import DatabaseError, ValidationError
@@ -26,12 +34,34 @@ _STR_RE = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"")  # String literals
 _REGEXP_RE = re.compile(r'regexp_replace\s*\([^)]*(?:\([^)]*\)[^)]*)*\)', re.I)
 _UNESCAPE_PCT = re.compile(r'(?<!%)%(?![%s(])')  # Unescaped % not followed by % or s or (
 _DOLLAR_OPEN_RE = re.compile(r'\$(\w*)\$')  # PG dollar-quoted-string opening tag
+_NUMBER_RE = re.compile(r'(?<![\w$.])(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?![\w$])')
+_FP_PH_RE = {  # Placeholders collapsed to '?' by normalize_sql
+    'postgresql': re.compile(r'%\(\w+\)s|%s|\?|\$\d+'),
+    'sqlite': re.compile(r'%\(\w+\)s|%s|\?\d*|(?<!:):\w+'),
+}
+_PUNCT_SPACE_RE = re.compile(r'\s*([(,])\s*|\s*(\))')
+_IN_LIST_RE = re.compile(r'\bin\((?:\?, )*\?\)')
+_IN_TAIL_RE = re.compile(r'(\bNOT\s+)?\bIN\s*(\()?\s*$', re.I)  # IN keyword before a placeholder
+_CLOSE_PAREN_RE = re.compile(r'\s*\)')
+
+IN_BINDINGS = ('expand', 'array')
 
 # Placeholder info: position, end, name (for named params), context, already in parens
 PH = namedtuple('PH', 'pos end name ctx in_parens')
 
 
-def prepare_query(sql: str, args: tuple | list | dict | None, dialect: str = 'postgresql') -> tuple[str, Any]:
+class ArrayParam(tuple):
+    """A sequence bound to an IN placeholder as one array parameter.
+
+    Wrapping a value opts that IN clause into array binding regardless
+    of the connection's in_binding option:
+
+        db.select(cn, 'SELECT * FROM t WHERE id IN %s', ArrayParam(ids))
+    """
+
+
+def prepare_query(sql: str, args: tuple | list | dict | None, dialect: str = 'postgresql',
+                  in_binding: str = 'expand') -> tuple[str, Any]:
     """Process SQL query with parameters for the given dialect.
 
     Handles:
@@ -39,6 +69,12 @@ def prepare_query(sql: str, args: tuple | list | dict | None, dialect: str = 'po
     - IS NULL handling: `IS %s` with `None` → `IS NULL`
     - Placeholder conversion: `%s` ↔ `?` based on dialect
     - Percent escaping in string literals for PostgreSQL
+
+    With in_binding='array' (or an ArrayParam value) a non-empty IN list
+    is bound as one parameter instead, so the statement text does not
+    grow with the list and the driver's parameter limit does not apply:
+    - PostgreSQL: `x IN %s` → `x = ANY(%s)`, `NOT IN` → `<> ALL(%s)`
+    - SQLite: `x IN %s` → `x IN (SELECT value FROM json_each(?))`
     """
 
     # Fast path: no placeholders
@@ -52,11 +88,66 @@ def prepare_query(sql: str, args: tuple | list | dict | None, dialect: str = 'po
     args = _normalize(args, phs)
 
     # Transform SQL and args
-    sql, args = _transform(sql, phs, args, dialect)
+    sql, args = _transform(sql, phs, args, dialect, in_binding)
 
     return sql, args
 
 
+def split_in_list(sql: str, args: tuple | list | dict | None, dialect: str = 'postgresql',
+                  size: int = 1000, in_binding: str = 'expand') -> list[tuple | dict] | None:
+    """Split the longest IN list in args into chunks of at most size values.
+
+    Returns one argument set per chunk, each to be run through
+    prepare_query and executed separately, or None when no IN list is
+    longer than size. Duplicate values are dropped first so that no row
+    matches in two chunks. NOT IN lists and array-bound lists (ArrayParam or
+    in_binding='array') are never split. The union of the chunk results
+    equals the full result only for queries that do not aggregate, sort,
+    limit or de-duplicate across the IN values.
+    """
+    if not sql or not args or size <= 0 or not _PH_RE.search(sql):
+        return None
+    phs = _find_contexts(sql, dialect)
+    args = _normalize(args, phs)
+    named = isinstance(args, dict)
+
+    longest = None
+    for i, ph in enumerate(phs):
+        if ph.ctx != 'in' or in_binding == 'array':
+            continue
+        key = ph.name if named else i
+        if (named and key not in args) or (not named and i >= len(args)):
+            continue
+        val = args[key]
+        if isinstance(val, ArrayParam):
+            continue
+        if _isseq(val) and len(val) == 1 and _isseq(val[0]):
+            val = val[0]
+        if not _isseq(val) or len(val) <= size:
+            continue
+        m = _IN_TAIL_RE.search(sql, 0, ph.pos)
+        if m is None or m.group(1):  # NOT IN needs every value at once
+            continue
+        if longest is None or len(val) > len(longest[1]):
+            longest = (key, val)
+
+    if longest is None:
+        return None
+    key, val = longest
+    try:
+        val = list(dict.fromkeys(val))
+    except TypeError:  # unhashable values
+        pass
+    chunks = []
+    for start in range(0, len(val), size):
+        part = list(val[start:start + size])
+        if named:
+            chunks.append({**args, key: part})
+        else:
+            chunks.append((*args[:key], part, *args[key + 1:]))
+    return chunks
+
+
 def quote_identifier(identifier: str, dialect: str = 'postgresql') -> str:
     """Quote a table or column name safely.
 
@@ -240,6 +331,22 @@ def _protected_ranges(sql: str, dialect: str = 'postgresql') -> set[int]:
     - regexp_replace(...) calls.
     """
     protected: set[int] = set()
+    for start, end, _ in _protected_spans(sql, dialect):
+        protected.update(range(start, end))
+    for m in _REGEXP_RE.finditer(sql):
+        if m.start() not in protected:
+            protected.update(range(m.start(), m.end()))
+    return protected
+
+
+def _protected_spans(sql: str, dialect: str = 'postgresql') -> list[tuple[int, int, str]]:
+    """Return (start, end, kind) for each literal, identifier and comment.
+
+    kind is 'string' ('...'), 'identifier' ("..."), 'comment' (-- and
+    /* */) or 'dollar' ($tag$...$tag$, PostgreSQL only), scanned in
+    lexical order so each construct hides the others inside it.
+    """
+    spans: list[tuple[int, int, str]] = []
     n = len(sql)
     i = 0
     while i < n:
@@ -256,20 +363,20 @@ def _protected_ranges(sql: str, dialect: str = 'postgresql') -> set[int]:
                 j += 1
             else:
                 j = n
-            protected.update(range(i, j))
+            spans.append((i, j, 'string' if c == "'" else 'identifier'))
             i = j
             continue
         if c == '-' and i + 1 < n and sql[i + 1] == '-':
             j = sql.find('\n', i + 2)
             if j == -1:
                 j = n
-            protected.update(range(i, j))
+            spans.append((i, j, 'comment'))
             i = j
             continue
         if c == '/' and i + 1 < n and sql[i + 1] == '*':
             j = sql.find('*/', i + 2)
             j = n if j == -1 else j + 2
-            protected.update(range(i, j))
+            spans.append((i, j, 'comment'))
             i = j
             continue
         if dialect == 'postgresql' and c == '$':
@@ -278,14 +385,57 @@ def _protected_ranges(sql: str, dialect: str = 'postgresql') -> set[int]:
                 tag = m.group(0)
                 close = sql.find(tag, m.end())
                 j = n if close == -1 else close + len(tag)
-                protected.update(range(i, j))
+                spans.append((i, j, 'dollar'))
                 i = j
                 continue
         i += 1
-    for m in _REGEXP_RE.finditer(sql):
-        if m.start() not in protected:
-            protected.update(range(m.start(), m.end()))
-    return protected
+    return spans
+
+
+@lru_cache(maxsize=4096)
+def normalize_sql(sql: str, dialect: str = 'postgresql') -> str:
+    """Return the canonical form of a statement for aggregation.
+
+    Statements that differ only in literal values, placeholder style,
+    IN-list length, comments, whitespace or keyword case normalize to the
+    same text:
+    - string, number and dollar-quoted literals and all placeholders
+      become '?'
+    - IN lists of any length become 'in(...)'
+    - comments are dropped, whitespace is collapsed, and everything
+      outside quoted identifiers is lower-cased
+
+    Examples
+        >>> normalize_sql("SELECT * FROM t WHERE id IN (%s, %s) AND name = 'x'")
+        'select * from t where id in(...) and name = ?'
+    """
+    placeholder_re = _FP_PH_RE[dialect] if dialect in _FP_PH_RE else _FP_PH_RE['postgresql']
+    parts: list[str] = []
+    pos = 0
+    for start, end, kind in [*_protected_spans(sql, dialect), (len(sql), len(sql), None)]:
+        code = placeholder_re.sub('?', sql[pos:start])
+        parts.append(_NUMBER_RE.sub('?', code).lower())
+        if kind == 'identifier':
+            parts.append(sql[start:end])
+        elif kind == 'comment':
+            parts.append(' ')
+        elif kind is not None:
+            parts.append('?')
+        pos = end
+
+    text = ' '.join(''.join(parts).split())
+    text = _PUNCT_SPACE_RE.sub(r'\1\2', text).replace(',', ', ')
+    return _IN_LIST_RE.sub('in(...)', text)
+
+
+def fingerprint(sql: str, dialect: str = 'postgresql') -> str:
+    """Return a stable 16-hex-digit hash of normalize_sql(sql).
+
+    Unlike hash(), the value is the same across processes, so it can be
+    used as a metrics label or cache key.
+    """
+    normalized = normalize_sql(sql, dialect)
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
 
 
 def _is_jsonb_op(sql: str, pos: int) -> bool:
@@ -365,7 +515,8 @@ def _normalize(args: tuple | list | dict | None, phs: list[PH]) -> tuple | dict
     return tuple(args) if isinstance(args, list) else args
 
 
-def _transform(sql: str, phs: list[PH], args: tuple | dict | None, dialect: str) -> tuple[str, Any]:
+def _transform(sql: str, phs: list[PH], args: tuple | dict | None, dialect: str,
+               in_binding: str = 'expand') -> tuple[str, Any]:
     """Transform SQL and args in single pass."""
     parts = []
     new_args = {} if isinstance(args, dict) else []
@@ -376,12 +527,31 @@ def _transform(sql: str, phs: list[PH], args: tuple | dict | None, dialect: str)
     for i, ph in enumerate(phs):
         # Text segment before placeholder
         seg = sql[pos:ph.pos]
+        end = ph.end
+
+        array_in = None
+        if ph.ctx == 'in':
+            if isinstance(args, dict):
+                val = args.get(ph.name)
+            else:
+                val = args[i] if args and i < len(args) else None
+            array_in = _match_array_in(sql, seg, ph, val, dialect, in_binding)
+
+        if array_in is not None:
+            seg, end, sql_part, value = array_in
         if is_pg:
             seg = _escape_percents(seg)
         parts.append(seg)
 
         # Process placeholder
-        if isinstance(args, dict):
+        if array_in is not None:
+            if isinstance(args, dict):
+                parts.append(sql_part.format(_named_ph(ph.name, dialect)))
+                new_args[ph.name] = value
+            else:
+                parts.append(sql_part.format(marker))
+                new_args.append(value)
+        elif isinstance(args, dict):
             sql_part, arg_upd = _proc_named(ph, args, dialect)
             parts.append(sql_part)
             new_args.update(arg_upd)
@@ -391,7 +561,7 @@ def _transform(sql: str, phs: list[PH], args: tuple | dict | None, dialect: str)
             parts.append(sql_part)
             new_args.extend(arg_list)
 
-        pos = ph.end
+        pos = end
 
     # Final segment
     seg = sql[pos:]
@@ -433,6 +603,44 @@ def _expand_in(val: Any, marker: str, in_parens: bool) -> tuple[str, list]:
     return marker if in_parens else f'({marker})', [val]
 
 
+def _match_array_in(sql: str, seg: str, ph: PH, val: Any, dialect: str,
+                    in_binding: str) -> tuple[str, int, str, Any] | None:
+    """Plan an IN placeholder as a single array parameter.
+
+    Returns (segment without the IN keyword, end of the IN clause in sql,
+    replacement SQL with {} for the placeholder, bound value), or None to
+    fall back to expansion. Scalars and empty lists always expand so
+    NULL semantics match the expanded form; so do SQLite lists holding
+    bytes, which JSON cannot carry.
+    """
+    if in_binding != 'array' and not isinstance(val, ArrayParam):
+        return None
+    if _isseq(val) and len(val) == 1 and _isseq(val[0]):
+        val = val[0]
+    if not _isseq(val) or not val:
+        return None
+
+    m = _IN_TAIL_RE.search(seg)
+    if m is None or bool(m.group(2)) != ph.in_parens:
+        return None
+    end = ph.end
+    if ph.in_parens:
+        close = _CLOSE_PAREN_RE.match(sql, ph.end)
+        if close is None:  # IN (%s, ...) with further items
+            return None
+        end = close.end()
+
+    negated = bool(m.group(1))
+    if dialect == 'sqlite':
+        if any(isinstance(v, (bytes, bytearray, memoryview)) for v in val):
+            return None
+        keyword = 'NOT IN' if negated else 'IN'
+        value = json.dumps(list(val), default=str, separators=(',', ':'))
+        return seg[:m.start()], end, f'{keyword} (SELECT value FROM json_each({{}}))', value
+    operator = '<> ALL' if negated else '= ANY'
+    return seg[:m.start()], end, f'{operator}({{}})', list(val)
+
+
 def _named_ph(name: str, dialect: str) -> str:
     """Return the named-placeholder syntax for the dialect.
 
@@ -8,13 +8,17 @@ behaviors while presenting a consistent interface to the rest of the application
 Each concrete strategy implements operations with database-specific SQL and techniques,
 but clients can work with any database through this consistent interface.
 """
+import csv
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
 from contextlib import contextmanager
+from itertools import chain
 from typing import TYPE_CHECKING, Any, TextIO
 
 from database.cache import cacheable_strategy
 from database.exceptions import ValidationError
 from database.sql import quote_identifier as sql_quote_identifier
+from database.types import TypeConverter
 
 if TYPE_CHECKING:
     from database.connection import ConnectionWrapper
@@ -24,6 +28,10 @@ if TYPE_CHECKING:
 # Defined here to avoid circular imports (concrete strategies import from base)
 _STRATEGY_REGISTRY: dict[str, type['DatabaseStrategy']] = {}
 
+# Anything copy_from accepts: a CSV text stream, an iterable of tuples or
+# dicts, a pandas DataFrame, or a pyarrow Table / RecordBatchReader.
+CopySource = TextIO | Iterable[Any]
+
 
 def register_strategy(dialect: str):
     """Decorator to register a strategy class for a dialect.
@@ -39,6 +47,61 @@ def register_strategy(dialect: str):
     return decorator
 
 
+def _iter_copy_rows(source: CopySource, columns: list[str] | None = None,
+                    ) -> tuple[list[str] | None, Iterator[tuple]]:
+    """Normalize a copy_from source into (columns, row tuples).
+
+    Rows are produced lazily so generators and Arrow readers are streamed
+    rather than materialized. Column names default to the DataFrame
+    columns, the Arrow schema, or the keys of the first dict row; for
+    plain tuples (and CSV text) they stay None, meaning table order.
+    Values pass through TypeConverter so NumPy/Arrow scalars and NaN
+    reach the driver as plain Python values or NULL.
+
+    Types are detected by duck typing so pandas and pyarrow are never
+    imported here.
+    """
+    convert = TypeConverter.convert_value
+
+    if hasattr(source, 'read'):
+        reader = csv.reader(source)
+        rows = (tuple(None if v == '' else v for v in row) for row in reader if row)
+        return columns, rows
+
+    if hasattr(source, 'itertuples'):
+        columns = list(columns) if columns else [str(c) for c in source.columns]
+        frame = source[columns]
+        rows = (tuple(convert(v) for v in row)
+                for row in frame.itertuples(index=False, name=None))
+        return columns, rows
+
+    if hasattr(source, 'schema') and (hasattr(source, 'read_next_batch')
+                                      or hasattr(source, 'to_batches')):
+        columns = list(columns) if columns else list(source.schema.names)
+        batches = source.to_batches() if hasattr(source, 'to_batches') else source
+
+        def arrow_rows() -> Iterator[tuple]:
+            for batch in batches:
+                arrays = [batch.column(name).to_pylist() for name in columns]
+                for row in zip(*arrays):
+                    yield tuple(convert(v) for v in row)
+
+        return columns, arrow_rows()
+
+    it = iter(source)
+    first = next(it, None)
+    if first is None:
+        return columns, iter(())
+
+    if isinstance(first, Mapping):
+        columns = list(columns) if columns else list(first.keys())
+        rows = (tuple(convert(row.get(c)) for c in columns) for row in chain([first], it))
+        return columns, rows
+
+    rows = (tuple(convert(v) for v in row) for row in chain([first], it))
+    return columns, rows
+
+
 class DatabaseStrategy(ABC):
     """Base class for database-specific operations.
     """
@@ -129,8 +192,55 @@ class DatabaseStrategy(ABC):
 
     @abstractmethod
     def copy_from(self, cn: 'ConnectionWrapper', table: str,
-                  file: TextIO, columns: list[str] | None = None) -> int:
-        """Bulk load data from a file-like object using COPY.
+                  source: CopySource, columns: list[str] | None = None) -> int:
+        """Bulk load data from a CSV stream or an iterable of rows.
+
+        Args:
+            cn: Database connection object
+            table: Target table name
+            source: CSV text stream, iterable of tuples or dicts,
+                DataFrame, or Arrow Table / RecordBatchReader
+            columns: Target columns, by default inferred from the source
+
+        Returns
+            int: Number of rows loaded
+        """
+
+    @abstractmethod
+    def copy_rows(self, cn: 'ConnectionWrapper', table: str, columns: list[str] | None,
+                  rows: Iterable[tuple]) -> int:
+        """Bulk load row tuples as they are, without TypeConverter.
+
+        This is the loading half of copy_from, for rows already typed by a
+        driver (e.g. read from another table), where strings like '' or
+        'NaN' must not turn into NULL.
+
+        Args:
+            cn: Database connection object
+            table: Target table name
+            columns: Target columns, by default table order
+            rows: Row tuples, consumed lazily
+
+        Returns
+            int: Number of rows loaded
+        """
+
+    @abstractmethod
+    def bulk_load(self, cn: 'ConnectionWrapper', defer_indexes: list[str] | None = None,
+                  cache_size: int | None = None,
+                  journal_mode: str | None = None) -> Iterator[None]:
+        """Context manager running a bulk load inside one transaction.
+
+        Concrete implementations are generator-based context managers that
+        commit on clean exit, roll back on error, and restore any session
+        settings they changed.
+
+        Args:
+            cn: Database connection object
+            defer_indexes: Tables whose secondary indexes are dropped for
+                the load and rebuilt before commit
+            cache_size: Page cache size to use during the load
+            journal_mode: Journal mode to use during the load
         """
 
     @abstractmethod
@@ -236,6 +346,32 @@ class DatabaseStrategy(ABC):
             Dictionary of keyword arguments for create_engine
         """
 
+    def configure_engine(self, engine: Any, options: 'DatabaseOptions') -> None:
+        """Attach dialect-specific hooks to a newly created engine.
+
+        Default implementation is a no-op. Override to configure each
+        physical connection once (e.g., via the pool 'connect' event)
+        instead of on every checkout.
+
+        Args:
+            engine: Newly created SQLAlchemy engine
+            options: DatabaseOptions the engine was created from
+        """
+
+    def build_readonly_connection_url(self, options: 'DatabaseOptions') -> str | None:
+        """Build a URL for a separate pool of read-only connections.
+
+        Default implementation returns None, meaning reads share the
+        primary connection.
+
+        Args:
+            options: DatabaseOptions with connection parameters
+
+        Returns
+            SQLAlchemy URL string, or None when unsupported
+        """
+        return None
+
     @abstractmethod
     def register_type_adapters(self, connection: Any) -> None:
         """Register dialect-specific type adapters.
@@ -255,6 +391,20 @@ class DatabaseStrategy(ABC):
             Cursor configured to return dict-like rows
         """
 
+    @abstractmethod
+    def create_tuple_cursor(self, raw_conn: Any) -> Any:
+        """Create a cursor that returns rows as plain tuples.
+
+        Used by the single-row and single-column fast paths, which
+        index by position and never need per-row dicts.
+
+        Args:
+            raw_conn: Raw DBAPI connection
+
+        Returns
+            Cursor configured to return tuple rows
+        """
+
     @abstractmethod
     def get_type_map(self) -> dict:
         """Return mapping of database type codes to Python types.
@@ -366,6 +516,9 @@ class DatabaseStrategy(ABC):
         constraint_expr: str | None = None,
         update_cols_always: list[str] | None = None,
         update_cols_ifnull: list[str] | None = None,
+        only_if_changed: bool = False,
+        returning: list[str] | None = None,
+        column_types: dict[str, str] | None = None,
     ) -> str:
         """Generate dialect-specific upsert SQL.
 
@@ -376,11 +529,161 @@ class DatabaseStrategy(ABC):
             constraint_expr: Pre-resolved constraint expression (PostgreSQL only)
             update_cols_always: Columns to always update on conflict
             update_cols_ifnull: Columns to update only if target is NULL
+            only_if_changed: Skip the update when it would not change any
+                column, so unchanged rows are neither rewritten nor counted
+            returning: Columns to return for each inserted or updated row,
+                in the form upsert_returning expects
+            column_types: Column types from get_column_types, used by the
+                only_if_changed guard
 
         Returns
             str: Complete upsert SQL statement
         """
 
+    @abstractmethod
+    def update_rows(self, cn: 'ConnectionWrapper', cursor: Any, table: str,
+                    keyfields: list[str], datafields: list[str],
+                    rows: list[tuple], batch_size: int) -> int:
+        """Update many rows by key with set-based UPDATE ... FROM statements.
+
+        Args:
+            cn: Database connection object
+            cursor: Tuple cursor wrapper on cn
+            table: Target table name
+            keyfields: Columns identifying the rows to update
+            datafields: Columns to set
+            rows: One tuple per row, keyfields values then datafields values
+            batch_size: Rows per statement
+
+        Returns
+            int: Number of table rows updated
+        """
+
+    @abstractmethod
+    def delete_rows(self, cn: 'ConnectionWrapper', cursor: Any, table: str,
+                    keyfields: list[str], keys: list[tuple], batch_size: int) -> int:
+        """Delete many rows by key without one placeholder per key value.
+
+        Args:
+            cn: Database connection object
+            cursor: Tuple cursor wrapper on cn
+            table: Target table name
+            keyfields: Columns identifying the rows to delete
+            keys: One tuple of keyfields values per row
+            batch_size: Keys per statement
+
+        Returns
+            int: Number of table rows deleted
+        """
+
+    @abstractmethod
+    def row_hash_sql(self, columns: list[str], column_types: list[str]) -> str:
+        """Build an expression hashing a row's values to a non-negative 32-bit integer.
+
+        Both dialects hash the same text rendering of the values, with
+        booleans, numbers and timestamps put in one canonical form by
+        column type, so sums of row hashes can be compared across databases.
+
+        Args:
+            columns: Quoted column names
+            column_types: Declared type of each column from get_column_types
+
+        Returns
+            str: SQL expression
+        """
+
+    @abstractmethod
+    def binary_collation_sql(self, column: str, column_type: str) -> str:
+        """Make a column compare and sort by byte order, like SQLite's BINARY.
+
+        Key ranges built from one database's values then select the same
+        rows on the other, whatever collation either database defaults to.
+
+        Args:
+            column: Quoted column name
+            column_type: Declared type from get_column_types
+
+        Returns
+            str: SQL expression
+        """
+
+    @abstractmethod
+    def get_column_types(self, cn: 'ConnectionWrapper', table: str,
+                         bypass_cache: bool = False) -> dict[str, str]:
+        """Map each column of a table to its declared SQL type.
+
+        Args:
+            cn: Database connection object
+            table: Table name
+            bypass_cache: If True, bypass the cache and query directly
+
+        Returns
+            dict: Column name to type, e.g. 'numeric(10,2)'
+        """
+
+    @abstractmethod
+    def get_column_type_codes(self, cn: 'ConnectionWrapper', table: str) -> list[tuple[str, Any]]:
+        """Get (column, type code) pairs for a table in column order.
+
+        Type codes are the keys of get_type_map (OIDs for PostgreSQL,
+        declared type names for SQLite).
+
+        Args:
+            cn: Database connection object
+            table: Table name
+
+        Returns
+            list: (column name, type code) pairs
+        """
+
+    @abstractmethod
+    def column_type_sql(self, python_type: type) -> str:
+        """Column type used to store values of a Python type, e.g. in CREATE TABLE.
+
+        Args:
+            python_type: Python type resolved from a source column
+
+        Returns
+            str: SQL type name
+        """
+
+    @abstractmethod
+    def copy_to(self, cn: 'ConnectionWrapper', table: str, columns: list[str],
+                batch_size: int) -> Iterator[list[tuple]]:
+        """Stream a table's rows out in batches, the counterpart of copy_from.
+
+        Args:
+            cn: Database connection object
+            table: Source table name
+            columns: Columns to read, in order
+            batch_size: Rows per yielded batch
+
+        Returns
+            Iterator of lists of row tuples
+        """
+
+    @abstractmethod
+    def upsert_returning(self, cursor: Any, sql: str, params: list[list[Any]],
+                         table: str, key_columns: list[str],
+                         key_positions: list[int] | None,
+                         batch_size: int) -> tuple[list[tuple], int]:
+        """Run an upsert built with returning= and collect its rows.
+
+        Args:
+            cursor: Tuple cursor wrapper on the target connection
+            sql: Statement from build_upsert_sql(..., returning=...)
+            params: One parameter list per row, in column order
+            table: Target table name
+            key_columns: Conflict columns, in the order of key_positions
+            key_positions: Index of each key column within a parameter
+                list, or None when the conflict target is a constraint
+            batch_size: Rows per round trip
+
+        Returns
+            tuple: (returned rows holding the requested columns, number of
+            those rows that were inserted rather than updated)
+        """
+
     def get_placeholder_style(self) -> str:
         """Return the placeholder marker for this database.
 
@@ -448,15 +751,13 @@ class DatabaseStrategy(ABC):
 
         return 'id'
 
-    def _build_update_exprs(
+    def _build_update_values(
         self,
         table: str,
         update_cols_always: list[str] | None,
         update_cols_ifnull: list[str] | None,
-    ) -> list[str]:
-        """Build UPDATE SET expressions for upsert operations.
-
-        Shared helper used by both PostgreSQL and SQLite strategies.
+    ) -> list[tuple[str, str]]:
+        """Pair each updated column with the value it is set to on conflict.
 
         Args:
             table: Target table name (for COALESCE expressions)
@@ -464,19 +765,40 @@ class DatabaseStrategy(ABC):
             update_cols_ifnull: Columns to update only if target is NULL
 
         Returns
-            List of SET expressions like 'col = excluded.col'
+            List of (quoted column, value expression) tuples
         """
         quoted_table = self.quote_identifier(table)
-        update_exprs = []
+        values = []
 
         if update_cols_always:
             for col in update_cols_always:
                 qc = self.quote_identifier(col)
-                update_exprs.append(f'{qc} = excluded.{qc}')
+                values.append((qc, f'excluded.{qc}'))
 
         if update_cols_ifnull:
             for col in update_cols_ifnull:
                 qc = self.quote_identifier(col)
-                update_exprs.append(f'{qc} = COALESCE({quoted_table}.{qc}, excluded.{qc})')
+                values.append((qc, f'COALESCE({quoted_table}.{qc}, excluded.{qc})'))
 
-        return update_exprs
+        return values
+
+    def _build_update_exprs(
+        self,
+        table: str,
+        update_cols_always: list[str] | None,
+        update_cols_ifnull: list[str] | None,
+    ) -> list[str]:
+        """Build UPDATE SET expressions for upsert operations.
+
+        Shared helper used by both PostgreSQL and SQLite strategies.
+
+        Args:
+            table: Target table name (for COALESCE expressions)
+            update_cols_always: Columns to always update
+            update_cols_ifnull: Columns to update only if target is NULL
+
+        Returns
+            List of SET expressions like 'col = excluded.col'
+        """
+        return [f'{qc} = {value}' for qc, value in
+                self._build_update_values(table, update_cols_always, update_cols_ifnull)]
@@ -11,19 +11,35 @@ It handles PostgreSQL's unique features such as:
 """
 import logging
 import re
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, TextIO
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any
 from urllib.parse import quote, quote_plus
 
 from database.cache import cacheable_strategy
 from database.exceptions import QueryError
-from database.row import DictRowFactory
+from database.row import DictRowFactory, TupleRowFactory
 from database.sql import _split_qualified_identifier, make_placeholders
-from database.strategy.base import DatabaseStrategy, register_strategy
-from database.types import postgres_types
+from database.strategy.base import CopySource, DatabaseStrategy
+from database.strategy.base import _iter_copy_rows, register_strategy
+from database.types import postgres_type_names, postgres_types
+from database.types import register_numeric_float_loaders
 
 logger = logging.getLogger(__name__)
 
+# Row count from which update_rows loads the rows with COPY into a
+# temporary table instead of sending VALUES lists
+UPDATE_COPY_THRESHOLD = 50_000
+
+# Key count from which delete_rows loads the keys with COPY into a
+# temporary table instead of sending arrays
+DELETE_COPY_THRESHOLD = 100_000
+
+# Types without an equality operator; the only_if_changed guard compares
+# them as text
+NO_EQUALITY_TYPES = ('json', 'xml', 'point', 'line', 'lseg', 'box', 'path', 'polygon', 'circle')
+
 
 @contextmanager
 def temporary_autocommit(connection):
@@ -57,6 +73,21 @@ def _split_schema_table(table: str) -> tuple[str | None, str]:
     return None, parts[-1]
 
 
+def _hash_text_sql(column: str, column_type: str) -> str:
+    """Render a column as the text row_hash_sql hashes for its type."""
+    if column_type == 'boolean':
+        return f'{column}::int::text'
+    if column_type.startswith(('numeric', 'real', 'double precision')):
+        return f"encode(float8send({column}::float8), 'hex')"
+    if column_type.startswith('timestamp'):
+        if column_type.endswith('with time zone'):
+            column = f"({column} AT TIME ZONE 'UTC')"
+        return f"to_char({column}, 'YYYY-MM-DD HH24:MI:SS.US')"
+    if column_type == 'bytea':
+        return f"encode({column}, 'hex')"
+    return f'{column}::text'
+
+
 if TYPE_CHECKING:
     from database.connection import ConnectionWrapper
     from database.options import DatabaseOptions
@@ -120,8 +151,11 @@ class PostgresStrategy(DatabaseStrategy):
     def register_type_adapters(self, connection: Any) -> None:
         """Register dialect-specific type adapters for PostgreSQL.
 
-        PostgreSQL with psycopg doesn't need special adapters.
+        Loads numeric as float inside psycopg's loaders so row factories
+        skip per-cell casting.
         """
+        raw_conn = getattr(connection, 'driver_connection', connection)
+        register_numeric_float_loaders(raw_conn.adapters)
 
     def create_dict_cursor(self, raw_conn: Any) -> Any:
         """Create a cursor that returns rows as dictionaries.
@@ -130,6 +164,24 @@ class PostgresStrategy(DatabaseStrategy):
         """
         return raw_conn.cursor(row_factory=DictRowFactory)
 
+    def create_tuple_cursor(self, raw_conn: Any) -> Any:
+        """Create a cursor that returns rows as tuples.
+
+        Uses TupleRowFactory, which applies the same casts as
+        DictRowFactory.
+        """
+        return raw_conn.cursor(row_factory=TupleRowFactory)
+
+    def create_server_cursor(self, raw_conn: Any, tuples: bool = False) -> Any:
+        """Create a named (server-side) cursor with a unique name.
+
+        Each fetch is a FETCH round trip instead of a slice of a result
+        already held by the client. Without WITH HOLD the cursor only
+        lives until the end of the current transaction.
+        """
+        row_factory = TupleRowFactory if tuples else DictRowFactory
+        return raw_conn.cursor(name=f'_cursor_{uuid.uuid4().hex[:12]}', row_factory=row_factory)
+
     def get_type_map(self) -> dict[int, type]:
         """Return mapping of PostgreSQL type codes to Python types."""
         return postgres_types
@@ -190,25 +242,61 @@ from
         logger.debug(f'Reset sequence for {table=} using {identity=}')
 
     def copy_from(self, cn: 'ConnectionWrapper', table: str,
-                  file: TextIO, columns: list[str] | None = None) -> int:
+                  source: CopySource, columns: list[str] | None = None) -> int:
         """Bulk load using PostgreSQL COPY.
-        """
-        quoted_table = self.quote_identifier(table)
 
-        if columns:
-            quoted_cols = ','.join(self.quote_identifier(c) for c in columns)
-            sql = f"COPY {quoted_table} ({quoted_cols}) FROM STDIN WITH (FORMAT csv, NULL '')"
-        else:
-            sql = f"COPY {quoted_table} FROM STDIN WITH (FORMAT csv, NULL '')"
+        File-like sources are streamed as CSV in 8 KB chunks. Any other
+        source (iterable of tuples or dicts, DataFrame, Arrow reader) is
+        streamed row by row with copy.write_row, so rows generated on the
+        fly never need to be serialized to CSV first.
+        """
+        if not hasattr(source, 'read'):
+            columns, rows = _iter_copy_rows(source, columns)
+            return self.copy_rows(cn, table, columns, rows)
 
+        sql = f"COPY {self._copy_target(table, columns)} FROM STDIN WITH (FORMAT csv, NULL '')"
         cursor = cn.dbapi_connection.cursor()
-        with cursor.copy(sql) as copy:
-            while data := file.read(8192):
-                copy.write(data)
-
-        rowcount = cursor.rowcount
-        cursor.close()
-        return rowcount
+        try:
+            with cursor.copy(sql) as copy:
+                while data := source.read(8192):
+                    copy.write(data)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def _copy_target(self, table: str, columns: list[str] | None) -> str:
+        quoted_table = self.quote_identifier(table)
+        if not columns:
+            return quoted_table
+        quoted_cols = ','.join(self.quote_identifier(c) for c in columns)
+        return f'{quoted_table} ({quoted_cols})'
+
+    def copy_rows(self, cn: 'ConnectionWrapper', table: str, columns: list[str] | None,
+                  rows: Iterable[tuple]) -> int:
+        """Write row tuples with COPY ... FROM STDIN and copy.write_row.
+        """
+        cursor = cn.dbapi_connection.cursor()
+        try:
+            with cursor.copy(f'COPY {self._copy_target(table, columns)} FROM STDIN') as copy:
+                for row in rows:
+                    copy.write_row(row)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def bulk_load(self, cn: 'ConnectionWrapper', defer_indexes: list[str] | None = None,
+                  cache_size: int | None = None,
+                  journal_mode: str | None = None) -> Iterator[None]:
+        """Run a bulk load inside a single PostgreSQL transaction.
+
+        Index deferral and cache/journal tuning are SQLite-specific and
+        are ignored here.
+        """
+        if defer_indexes or cache_size is not None or journal_mode is not None:
+            logger.debug('bulk_load tuning options are ignored on PostgreSQL')
+        with cn.dbapi_connection.driver_connection.transaction():
+            yield
 
     @cacheable_strategy('primary_keys', ttl=300, maxsize=50)
     def get_primary_keys(self, cn: 'ConnectionWrapper', table: str,
@@ -330,6 +418,23 @@ select skeys(hstore(null::{quoted_table})) as column
 
         raise QueryError(f'Failed to extract regex from definition: {definition}')
 
+    def get_constraint_columns(self, cn: 'ConnectionWrapper', table: str,
+                               constraint_name: str) -> list[str]:
+        """Get the columns of a unique constraint or unique index by name.
+
+        Returns an empty list when the index has expression columns.
+        """
+        sql = """
+select a.attname as column
+from pg_index i
+join pg_class c on c.oid = i.indexrelid
+cross join unnest(i.indkey) with ordinality k(attnum, ord)
+join pg_attribute a on a.attrelid = i.indrelid and a.attnum = k.attnum
+where c.relname = %s and i.indrelid = %s::regclass and i.indexprs is null
+order by k.ord
+"""
+        return [row['column'] for row in self._select_raw(cn, sql, (constraint_name, table))]
+
     def get_default_columns(self, cn: 'ConnectionWrapper', table: str,
                             bypass_cache: bool = False) -> list[str]:
         """Get columns suitable for general data display.
@@ -383,6 +488,9 @@ t.ordinal_position
         constraint_expr: str | None = None,
         update_cols_always: list[str] | None = None,
         update_cols_ifnull: list[str] | None = None,
+        only_if_changed: bool = False,
+        returning: list[str] | None = None,
+        column_types: dict[str, str] | None = None,
     ) -> str:
         """Generate PostgreSQL upsert SQL using INSERT ... ON CONFLICT.
 
@@ -393,6 +501,12 @@ t.ordinal_position
             constraint_expr: Pre-resolved constraint expression from get_constraint_definition()
             update_cols_always: Columns to always update on conflict
             update_cols_ifnull: Columns to update only if target is NULL
+            only_if_changed: Guard the update with WHERE (target columns)
+                IS DISTINCT FROM (new values)
+            returning: Columns to return, followed by (xmax = 0), which is
+                true for inserted rows and false for updated ones
+            column_types: Column types; columns in the guard whose type has
+                no equality operator (json, xml, geometric) compare as text
         """
         quoted_table = self.quote_identifier(table)
         quoted_columns = [self.quote_identifier(col) for col in columns]
@@ -406,11 +520,222 @@ t.ordinal_position
             quoted_keys = [self.quote_identifier(k) for k in key_columns]
             conflict_sql = f"ON CONFLICT ({', '.join(quoted_keys)})"
 
+        if returning is not None:
+            returned = [self.quote_identifier(col) for col in returning] + ['(xmax = 0)']
+            returning_sql = f" RETURNING {', '.join(returned)}"
+        else:
+            returning_sql = ''
+
         if not (update_cols_always or update_cols_ifnull):
-            return f'{insert_sql} {conflict_sql} DO NOTHING'
+            return f'{insert_sql} {conflict_sql} DO NOTHING{returning_sql}'
 
         update_exprs = self._build_update_exprs(table, update_cols_always, update_cols_ifnull)
-        return f"{insert_sql} {conflict_sql} DO UPDATE SET {', '.join(update_exprs)}"
+        upsert_sql = f"{insert_sql} {conflict_sql} DO UPDATE SET {', '.join(update_exprs)}"
+        if only_if_changed:
+            values = self._build_update_values(table, update_cols_always, update_cols_ifnull)
+            updated = (update_cols_always or []) + (update_cols_ifnull or [])
+            types = {c.lower(): t for c, t in (column_types or {}).items()}
+            as_text = [types.get(col.lower(), '').removesuffix('[]') in NO_EQUALITY_TYPES
+                       for col in updated]
+            targets = ', '.join(f'{quoted_table}.{qc}::text' if text else f'{quoted_table}.{qc}'
+                                for (qc, _), text in zip(values, as_text))
+            new_values = ', '.join(f'({value})::text' if text else value
+                                   for (_, value), text in zip(values, as_text))
+            upsert_sql = f'{upsert_sql} WHERE ({targets}) IS DISTINCT FROM ({new_values})'
+        return f'{upsert_sql}{returning_sql}'
+
+    @cacheable_strategy('column_types', ttl=300, maxsize=50)
+    def get_column_types(self, cn: 'ConnectionWrapper', table: str,
+                         bypass_cache: bool = False) -> dict[str, str]:
+        """Map each column of a table to its SQL type name, e.g. 'numeric(10,2)'.
+        """
+        sql = """
+select a.attname as column, format_type(a.atttypid, a.atttypmod) as type
+from pg_attribute a
+where a.attrelid = %s::regclass and a.attnum > 0 and not a.attisdropped
+"""
+        return {row['column']: row['type'] for row in self._select_raw(cn, sql, (table,))}
+
+    def _copy_to_temp_table(self, dbapi_cursor: Any, table: str, fields: list[str],
+                            rows: list[tuple]) -> str:
+        """COPY rows into a new temporary table shaped like table's fields.
+
+        The table is dropped on commit at the latest. Returns its quoted name.
+        """
+        quoted_fields = ', '.join(self.quote_identifier(f) for f in fields)
+        temp = self.quote_identifier(f'_bulk_{uuid.uuid4().hex[:12]}')
+        dbapi_cursor.execute(f'CREATE TEMP TABLE {temp} ON COMMIT DROP AS '
+                             f'SELECT {quoted_fields} FROM {self.quote_identifier(table)} '
+                             f'WITH NO DATA')
+        with dbapi_cursor.copy(f'COPY {temp} ({quoted_fields}) FROM STDIN') as copy:
+            for row in rows:
+                copy.write_row(row)
+        return temp
+
+    def update_rows(self, cn: 'ConnectionWrapper', cursor: Any, table: str,
+                    keyfields: list[str], datafields: list[str],
+                    rows: list[tuple], batch_size: int) -> int:
+        """Update rows with UPDATE ... FROM (VALUES ...), or COPY for large inputs.
+
+        Each batch is one statement joining a VALUES list on the key
+        columns. The first VALUES row carries casts to the table's column
+        types so that text and NULL parameters take the right types.
+        From UPDATE_COPY_THRESHOLD rows on, the rows are COPY'd into a
+        temporary table instead and applied with a single join update.
+        All statements run in one transaction unless the caller holds one.
+        """
+        fields = keyfields + datafields
+        quoted_table = self.quote_identifier(table)
+        quoted_fields = ', '.join(self.quote_identifier(f) for f in fields)
+        set_sql = ', '.join(f'{self.quote_identifier(f)} = v.{self.quote_identifier(f)}'
+                            for f in datafields)
+        where_sql = ' AND '.join(f't.{self.quote_identifier(k)} = v.{self.quote_identifier(k)}'
+                                 for k in keyfields)
+        dbapi_cursor = cursor.dbapi_cursor
+        driver_connection = cn.dbapi_connection.driver_connection
+
+        in_transaction = getattr(cn, 'in_transaction', False)
+        with nullcontext() if in_transaction else driver_connection.transaction():
+            if len(rows) >= UPDATE_COPY_THRESHOLD:
+                temp = self._copy_to_temp_table(dbapi_cursor, table, fields, rows)
+                dbapi_cursor.execute(f'UPDATE {quoted_table} AS t SET {set_sql} '
+                                     f'FROM {temp} AS v WHERE {where_sql}')
+                updated = dbapi_cursor.rowcount
+                dbapi_cursor.execute(f'DROP TABLE {temp}')
+                return updated
+
+            types = self.get_column_types(cn, table)
+            typed_row = '(' + ', '.join(f'%s::{types[f]}' for f in fields) + ')'
+            plain_row = f"({make_placeholders(len(fields), 'postgresql')})"
+            updated = 0
+            for i in range(0, len(rows), batch_size):
+                batch = rows[i:i + batch_size]
+                values_sql = ', '.join([typed_row] + [plain_row] * (len(batch) - 1))
+                dbapi_cursor.execute(f'UPDATE {quoted_table} AS t SET {set_sql} '
+                                     f'FROM (VALUES {values_sql}) AS v ({quoted_fields}) '
+                                     f'WHERE {where_sql}',
+                                     [value for row in batch for value in row])
+                updated += dbapi_cursor.rowcount
+            return updated
+
+    def delete_rows(self, cn: 'ConnectionWrapper', cursor: Any, table: str,
+                    keyfields: list[str], keys: list[tuple], batch_size: int) -> int:
+        """Delete rows with = ANY(array) or an unnest join, or COPY for large inputs.
+
+        A single key column is matched with k = ANY(%s::type[]); composite
+        keys join unnest() of one array per column. Each batch binds one
+        parameter per key column however many keys it holds. From
+        DELETE_COPY_THRESHOLD keys on, the keys are COPY'd into a temporary
+        table instead and deleted with a single join.
+        """
+        quoted_table = self.quote_identifier(table)
+        quoted_keys = [self.quote_identifier(k) for k in keyfields]
+        where_sql = ' AND '.join(f't.{k} = v.{k}' for k in quoted_keys)
+        dbapi_cursor = cursor.dbapi_cursor
+        driver_connection = cn.dbapi_connection.driver_connection
+
+        in_transaction = getattr(cn, 'in_transaction', False)
+        with nullcontext() if in_transaction else driver_connection.transaction():
+            if len(keys) >= DELETE_COPY_THRESHOLD:
+                temp = self._copy_to_temp_table(dbapi_cursor, table, keyfields, keys)
+                dbapi_cursor.execute(f'DELETE FROM {quoted_table} AS t USING {temp} AS v '
+                                     f'WHERE {where_sql}')
+                deleted = dbapi_cursor.rowcount
+                dbapi_cursor.execute(f'DROP TABLE {temp}')
+                return deleted
+
+            types = self.get_column_types(cn, table)
+            if len(keyfields) == 1:
+                sql = f'DELETE FROM {quoted_table} WHERE {quoted_keys[0]} = ANY(%s::{types[keyfields[0]]}[])'
+            else:
+                arrays = ', '.join(f'%s::{types[k]}[]' for k in keyfields)
+                sql = (f'DELETE FROM {quoted_table} AS t USING unnest({arrays}) '
+                       f"AS v ({', '.join(quoted_keys)}) WHERE {where_sql}")
+            deleted = 0
+            for i in range(0, len(keys), batch_size):
+                dbapi_cursor.execute(sql, [list(col) for col in zip(*keys[i:i + batch_size])])
+                deleted += dbapi_cursor.rowcount
+            return deleted
+
+    def get_column_type_codes(self, cn: 'ConnectionWrapper', table: str) -> list[tuple[str, Any]]:
+        """Get (column, type OID) pairs for a table in column order.
+        """
+        sql = """
+select a.attname as column, a.atttypid::int as oid
+from pg_attribute a
+where a.attrelid = %s::regclass and a.attnum > 0 and not a.attisdropped
+order by a.attnum
+"""
+        return [(row['column'], row['oid']) for row in self._select_raw(cn, sql, (table,))]
+
+    def column_type_sql(self, python_type: type) -> str:
+        """Map a Python type to a PostgreSQL column type (text when unknown).
+        """
+        return postgres_type_names.get(python_type, 'text')
+
+    def copy_to(self, cn: 'ConnectionWrapper', table: str, columns: list[str],
+                batch_size: int) -> Iterator[list[tuple]]:
+        """Stream rows through a server-side cursor, batch_size rows per fetch.
+
+        The cursor is not holdable and lives in a transaction held for the
+        life of the generator (or the caller's), so the server produces
+        rows as they are fetched rather than materializing the whole
+        result first. It outpaces COPY ... TO STDOUT here because psycopg
+        parses COPY rows in Python, while fetched rows go through its C
+        loaders. Reading and loading still share the GIL, so the overlap
+        with the destination is limited to time spent waiting on I/O.
+        """
+        quoted_cols = ', '.join(self.quote_identifier(c) for c in columns)
+        driver_connection = cn.dbapi_connection.driver_connection
+        with nullcontext() if getattr(cn, 'in_transaction', False) else driver_connection.transaction():
+            cursor = self.create_server_cursor(driver_connection, tuples=True)
+            try:
+                cursor.execute(f'SELECT {quoted_cols} FROM {self.quote_identifier(table)}')
+                while batch := cursor.fetchmany(batch_size):
+                    yield batch
+            finally:
+                cursor.close()
+
+    def row_hash_sql(self, columns: list[str], column_types: list[str]) -> str:
+        """Hash rows as the first 32 bits of md5 of their '|'-joined text values.
+
+        Booleans render as 0/1, numeric and floating-point values as the hex
+        of their float8 bits, timestamps as 'YYYY-MM-DD HH:MI:SS.US' (UTC
+        for timestamptz) and bytea as hex, matching SQLite's db_row_hash().
+        """
+        values = ', '.join(f"coalesce({_hash_text_sql(c, t)}, '\\N')"
+                           for c, t in zip(columns, column_types))
+        return f"('x' || lpad(substr(md5(concat_ws('|', {values})), 1, 8), 16, '0'))::bit(64)::bigint"
+
+    def binary_collation_sql(self, column: str, column_type: str) -> str:
+        """Apply the "C" collation to text columns; other types have none.
+        """
+        if column_type.startswith(('text', 'character', 'name')):
+            return f'{column} COLLATE "C"'
+        return column
+
+    def upsert_returning(self, cursor: Any, sql: str, params: list[list[Any]],
+                         table: str, key_columns: list[str],
+                         key_positions: list[int] | None,
+                         batch_size: int) -> tuple[list[tuple], int]:
+        """Collect RETURNING rows with psycopg's pipelined executemany.
+
+        executemany(returning=True) sends each batch in one pipeline and
+        keeps one result set per row; the trailing xmax = 0 flag of each
+        returned row tells inserts from updates.
+        """
+        dbapi_cursor = cursor.dbapi_cursor
+        rows: list[tuple] = []
+        inserted = 0
+        for i in range(0, len(params), batch_size):
+            dbapi_cursor.executemany(sql, params[i:i + batch_size], returning=True)
+            while True:
+                for *values, was_inserted in dbapi_cursor.fetchall():
+                    rows.append(tuple(values))
+                    inserted += was_inserted
+                if not dbapi_cursor.nextset():
+                    break
+        return rows, inserted
 
 
 def extract_index_definition(definition: str) -> str:
@@ -9,17 +9,30 @@ It handles SQLite's unique features and limitations such as:
 - Automatic rowid management (no explicit sequence resetting needed)
 - Metadata retrieval using SQLite PRAGMA statements
 """
+import datetime
+import hashlib
 import json
 import logging
+import re
 import sqlite3
-from typing import TYPE_CHECKING, Any, TextIO
-
+import struct
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+import sqlalchemy as sa
 from database.cache import cacheable_strategy
-from database.exceptions import QueryError
+from database.exceptions import QueryError, ValidationError
 from database.sql import make_placeholders, quote_identifier
 from database.sql import standardize_placeholders
-from database.strategy.base import DatabaseStrategy, register_strategy
-from database.types import convert_date, convert_datetime, sqlite_types
+from database.strategy.base import CopySource, DatabaseStrategy
+from database.strategy.base import _iter_copy_rows, register_strategy
+from database.types import convert_date, convert_datetime, sqlite_type_names
+from database.types import sqlite_types
 
 if TYPE_CHECKING:
     from database.connection import ConnectionWrapper
@@ -27,6 +40,80 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany call when emulating COPY
+COPY_BATCH_SIZE = 5000
+
+# Default SQLITE_MAX_VARIABLE_NUMBER since SQLite 3.32
+SQLITE_MAX_VARIABLES = 32766
+
+JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+
+# PRAGMAs applied to every physical connection; profiles and the
+# sqlite_pragmas option are layered on top of these.
+DEFAULT_PRAGMAS: dict[str, Any] = {
+    'foreign_keys': 'ON',
+    'busy_timeout': 5000,
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+}
+
+PRAGMA_PROFILES: dict[str, dict[str, Any]] = {
+    'default': {},
+    'read_heavy': {
+        'mmap_size': 268435456,
+        'cache_size': -65536,
+        'temp_store': 'MEMORY',
+    },
+    'bulk_write': {
+        'synchronous': 'OFF',
+        'cache_size': -262144,
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 10000,
+    },
+    'low_memory': {
+        'cache_size': -512,
+        'mmap_size': 0,
+        'temp_store': 'FILE',
+    },
+}
+
+# Supported PRAGMAs in application order: page_size must run before
+# journal_mode=WAL, which freezes the page size of a new database.
+PRAGMA_NAMES = (
+    'page_size', 'foreign_keys', 'busy_timeout', 'journal_mode', 'synchronous',
+    'cache_size', 'mmap_size', 'temp_store', 'wal_autocheckpoint',
+)
+
+# Skipped for ':memory:', which has no file to journal, sync or map
+_FILE_ONLY_PRAGMAS = {'journal_mode', 'synchronous', 'mmap_size', 'wal_autocheckpoint'}
+
+# Skipped for mode=ro reader connections, which cannot change the file
+_WRITE_ONLY_PRAGMAS = {'page_size', 'journal_mode', 'wal_autocheckpoint'}
+
+_PRAGMA_VALUE_RE = re.compile(r'-?\w+')
+
+
+def resolve_pragmas(profile: str | None = None,
+                    pragmas: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Merge defaults, a named profile and explicit overrides.
+
+    Returns the PRAGMAs in the order they must be applied.
+    """
+    if (profile or 'default') not in PRAGMA_PROFILES:
+        raise ValidationError(
+            f'sqlite_profile must be one of: {sorted(PRAGMA_PROFILES)}')
+
+    merged = {**DEFAULT_PRAGMAS, **PRAGMA_PROFILES[profile or 'default']}
+    for name, value in (pragmas or {}).items():
+        name = name.lower()
+        if name not in PRAGMA_NAMES:
+            raise ValidationError(f'Unsupported SQLite PRAGMA: {name}')
+        if not _PRAGMA_VALUE_RE.fullmatch(str(value)):
+            raise ValidationError(f'Invalid value for PRAGMA {name}: {value!r}')
+        merged[name] = value
+
+    return {name: merged[name] for name in PRAGMA_NAMES if name in merged}
+
 
 def _is_memory_db(sqlite_conn: Any) -> bool:
     """Return True when the 'main' database is backed by ':memory:'.
@@ -41,6 +128,48 @@ def _is_memory_db(sqlite_conn: Any) -> bool:
     return False
 
 
+def _hash_kind(column_type: str) -> str:
+    """One-letter kind db_row_hash() canonicalizes a declared type's values by."""
+    column_type = column_type.upper()
+    if column_type.startswith(('TIMESTAMP', 'DATETIME')):
+        return 't'
+    if any(name in column_type for name in ('REAL', 'FLOA', 'DOUB', 'NUMERIC', 'DECIMAL')):
+        return 'f'
+    return '-'
+
+
+def _hash_text(kind: str, value: Any) -> str:
+    """Text db_row_hash() hashes for one value of a column of the given kind."""
+    if value is None:
+        return '\\N'
+    if kind == 'f' and isinstance(value, int | float):
+        return struct.pack('>d', value).hex()
+    if kind == 't' and isinstance(value, str):
+        try:
+            moment = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return value
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return moment.isoformat(sep=' ', timespec='microseconds')
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+def _row_hash(kinds: str, *values: Any) -> int:
+    """db_row_hash(kinds, ...): 32-bit md5 prefix of a row's values joined by '|'.
+
+    Matches PostgresStrategy.row_hash_sql: values of 'f' columns render as
+    the hex of their float8 bits, ISO timestamps of 't' columns as
+    'YYYY-MM-DD HH:MM:SS.ffffff' in UTC, blobs as hex and NULL as \\N.
+    """
+    text = '|'.join(_hash_text(kind, v) for kind, v in zip(kinds, values))
+    return int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+
+
 @register_strategy('sqlite')
 class SQLiteStrategy(DatabaseStrategy):
     """SQLite-specific operations.
@@ -63,6 +192,44 @@ class SQLiteStrategy(DatabaseStrategy):
             }
         }
 
+    def build_readonly_connection_url(self, options: 'DatabaseOptions') -> str | None:
+        """Build a mode=ro URI URL for the reader pool, if enabled.
+
+        Returns None unless sqlite_readers is set.
+        """
+        if not options.sqlite_readers:
+            return None
+        path = quote(str(Path(options.database).resolve()))
+        return f'sqlite:///file:{path}?mode=ro&uri=true'
+
+    def configure_engine(self, engine: Any, options: 'DatabaseOptions') -> None:
+        """Apply the resolved PRAGMA profile once per physical connection.
+
+        PRAGMAs are set from the pool 'connect' event rather than on every
+        checkout, so pooled connections are not reconfigured (and
+        journal_mode is not re-asserted under a write lock) each time.
+        Read-only engines skip the PRAGMAs that would write to the file.
+        """
+        pragmas = resolve_pragmas(options.sqlite_profile, options.sqlite_pragmas)
+        if engine.url.query.get('mode') == 'ro':
+            pragmas = {k: v for k, v in pragmas.items() if k not in _WRITE_ONLY_PRAGMAS}
+
+        def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+            self.apply_pragmas(dbapi_connection, pragmas)
+            dbapi_connection.create_function('db_row_hash', -1, _row_hash, deterministic=True)
+
+        sa.event.listen(engine, 'connect', on_connect)
+
+    def apply_pragmas(self, sqlite_conn: Any, pragmas: dict[str, Any]) -> None:
+        """Execute resolved PRAGMAs on a raw sqlite3 connection.
+        """
+        is_memory = _is_memory_db(sqlite_conn)
+        for name, value in pragmas.items():
+            if is_memory and name in _FILE_ONLY_PRAGMAS:
+                continue
+            sqlite_conn.execute(f'PRAGMA {name} = {value}')
+        logger.debug(f'Applied SQLite PRAGMAs: {pragmas}')
+
     def register_type_adapters(self, connection: Any) -> None:
         """Register dialect-specific type adapters and converters for SQLite.
 
@@ -89,6 +256,19 @@ class SQLiteStrategy(DatabaseStrategy):
         sqlite_conn.row_factory = sqlite3.Row
         return sqlite_conn.cursor()
 
+    def create_tuple_cursor(self, raw_conn: Any) -> Any:
+        """Create a cursor that returns rows as tuples.
+
+        The row factory is cleared on the cursor only, so dict cursors
+        created from the same connection are unaffected.
+        """
+        sqlite_conn = raw_conn
+        if hasattr(raw_conn, 'dbapi_connection'):
+            sqlite_conn = raw_conn.dbapi_connection
+        cursor = sqlite_conn.cursor()
+        cursor.row_factory = None
+        return cursor
+
     def get_type_map(self) -> dict[str, type]:
         """Return mapping of SQLite type names to Python types."""
         return sqlite_types
@@ -98,6 +278,17 @@ class SQLiteStrategy(DatabaseStrategy):
         """Return required options for SQLite connections."""
         return ['database']
 
+    @classmethod
+    def validate_options(cls, options: 'DatabaseOptions') -> None:
+        """Validate required fields, the PRAGMA profile and reader pool.
+        """
+        super().validate_options(options)
+        resolve_pragmas(options.sqlite_profile, options.sqlite_pragmas)
+        if not isinstance(options.sqlite_readers, int) or options.sqlite_readers < 0:
+            raise ValidationError('sqlite_readers must be a non-negative integer')
+        if options.sqlite_readers and options.database == ':memory:':
+            raise ValidationError('sqlite_readers requires a file-backed database')
+
     def vacuum_table(self, cn: 'ConnectionWrapper', table: str) -> None:
         """Optimize a table with VACUUM.
         """
@@ -124,11 +315,121 @@ class SQLiteStrategy(DatabaseStrategy):
             identity = self.find_sequence_column(cn, table)
 
     def copy_from(self, cn: 'ConnectionWrapper', table: str,
-                  file: TextIO, columns: list[str] | None = None) -> int:
-        """SQLite doesn't support COPY.
+                  source: CopySource, columns: list[str] | None = None) -> int:
+        """Emulate COPY with chunked executemany inside one transaction.
+
+        The source is consumed lazily in COPY_BATCH_SIZE chunks, so
+        generators are never fully materialized. When the caller already
+        holds a transaction the rows join it; otherwise the load is
+        wrapped in BEGIN/COMMIT and rolled back as a whole on error.
         """
-        logger.warning('COPY operation not supported in SQLite, use insert_rows instead')
-        return 0
+        columns, rows = _iter_copy_rows(source, columns)
+        return self.copy_rows(cn, table, columns, rows)
+
+    def copy_rows(self, cn: 'ConnectionWrapper', table: str, columns: list[str] | None,
+                  rows: Iterable[tuple]) -> int:
+        """Insert row tuples with chunked executemany on the raw cursor.
+
+        Joins the caller's transaction or wraps the load in its own, like
+        copy_from.
+        """
+        rows = iter(rows)
+        chunk = list(islice(rows, COPY_BATCH_SIZE))
+        if not chunk:
+            return 0
+
+        quoted_table = self.quote_identifier(table)
+        placeholders = make_placeholders(len(columns or chunk[0]), 'sqlite')
+        if columns:
+            quoted_cols = ', '.join(self.quote_identifier(c) for c in columns)
+            sql = f'INSERT INTO {quoted_table} ({quoted_cols}) VALUES ({placeholders})'
+        else:
+            sql = f'INSERT INTO {quoted_table} VALUES ({placeholders})'
+
+        owns_transaction = not getattr(cn, 'in_transaction', False)
+        cursor = cn.cursor()
+        if owns_transaction:
+            cursor.dbapi_cursor.execute('BEGIN')
+
+        total = 0
+        try:
+            while chunk:
+                cursor.dbapi_cursor.executemany(sql, chunk)
+                total += cursor.dbapi_cursor.rowcount
+                chunk = list(islice(rows, COPY_BATCH_SIZE))
+            if owns_transaction:
+                cursor.dbapi_cursor.execute('COMMIT')
+        except Exception:
+            if owns_transaction:
+                cursor.dbapi_cursor.execute('ROLLBACK')
+            raise
+
+        logger.debug(f'Loaded {total} rows into {table} via executemany')
+        return total
+
+    @contextmanager
+    def bulk_load(self, cn: 'ConnectionWrapper', defer_indexes: list[str] | None = None,
+                  cache_size: int | None = None,
+                  journal_mode: str | None = None) -> Iterator[None]:
+        """Run a bulk load in one transaction with fsync-free PRAGMAs.
+
+        Switches to synchronous=OFF, the requested cache_size and
+        journal_mode, opens an explicit transaction, and drops the
+        non-unique indexes of the defer_indexes tables. On clean exit the
+        indexes are rebuilt and the transaction committed; on error it is
+        rolled back (DDL included). The original PRAGMA values are
+        restored either way.
+        """
+        if journal_mode is not None and journal_mode.upper() not in JOURNAL_MODES:
+            raise ValidationError(f'journal_mode must be one of: {sorted(JOURNAL_MODES)}')
+
+        cursor = cn.dbapi_connection.cursor()
+        saved = {
+            name: cursor.execute(f'PRAGMA {name}').fetchone()[0]
+            for name in ('journal_mode', 'synchronous', 'cache_size')
+        }
+        try:
+            if journal_mode is not None:
+                cursor.execute(f'PRAGMA journal_mode = {journal_mode.upper()}')
+            cursor.execute('PRAGMA synchronous = OFF')
+            if cache_size is not None:
+                cursor.execute(f'PRAGMA cache_size = {int(cache_size)}')
+
+            cursor.execute('BEGIN')
+            try:
+                deferred = self._drop_secondary_indexes(cursor, defer_indexes or [])
+                yield
+                for index_sql in deferred:
+                    cursor.execute(index_sql)
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                raise
+            cursor.execute('COMMIT')
+            logger.debug(f'Bulk load committed, rebuilt {len(deferred)} deferred indexes')
+        finally:
+            cursor.execute(f"PRAGMA journal_mode = {saved['journal_mode']}")
+            cursor.execute(f"PRAGMA synchronous = {int(saved['synchronous'])}")
+            cursor.execute(f"PRAGMA cache_size = {int(saved['cache_size'])}")
+            cursor.close()
+
+    def _drop_secondary_indexes(self, cursor: Any, tables: list[str]) -> list[str]:
+        """Drop explicitly created non-unique indexes and return their DDL.
+
+        Unique indexes are kept because they enforce constraints (and
+        ON CONFLICT targets) during the load.
+        """
+        deferred = []
+        for table in tables:
+            rows = cursor.execute(
+                "select m.name, m.sql from sqlite_master m"
+                " join pragma_index_list(?) l on l.name = m.name"
+                " where m.type = 'index' and m.sql is not null and l.\"unique\" = 0",
+                (table,)).fetchall()
+            for name, index_sql in rows:
+                cursor.execute(f'DROP INDEX {quote_identifier(name, "sqlite")}')
+                deferred.append(index_sql)
+                logger.debug(f'Deferred index {name} on {table}')
+        return deferred
 
     @cacheable_strategy('primary_keys', ttl=300, maxsize=50)
     def get_primary_keys(self, cn: 'ConnectionWrapper', table: str,
@@ -162,19 +463,14 @@ select name as column from pragma_table_info({quoted_table})
     def configure_connection(self, conn: Any) -> None:
         """Configure connection settings for SQLite.
 
-        Sets foreign_keys, an explicit busy_timeout, and WAL journal mode
-        on file-based databases. WAL is skipped for ':memory:' since it
-        has no on-disk log to write ahead of.
+        Only per-checkout Python state (row factory, autocommit) is set
+        here; PRAGMAs are applied once per physical connection by
+        configure_engine.
         """
         sqlite_conn = conn
         if hasattr(conn, 'dbapi_connection'):
             sqlite_conn = conn.dbapi_connection
 
-        sqlite_conn.execute('PRAGMA foreign_keys = ON')
-        sqlite_conn.execute('PRAGMA busy_timeout = 5000')
-        if not _is_memory_db(sqlite_conn):
-            sqlite_conn.execute('PRAGMA journal_mode = WAL')
-            sqlite_conn.execute('PRAGMA synchronous = NORMAL')
         sqlite_conn.row_factory = sqlite3.Row
         self.enable_autocommit(sqlite_conn)
 
@@ -274,10 +570,17 @@ ORDER BY cid
         constraint_expr: str | None = None,
         update_cols_always: list[str] | None = None,
         update_cols_ifnull: list[str] | None = None,
+        only_if_changed: bool = False,
+        returning: list[str] | None = None,
+        column_types: dict[str, str] | None = None,
     ) -> str:
         """Generate SQLite upsert SQL using INSERT ... ON CONFLICT.
 
         Note: constraint_expr is ignored for SQLite (only PostgreSQL supports named constraints).
+        With only_if_changed the update is guarded by a WHERE that any
+        column IS NOT its new value (SQLite's NULL-safe inequality).
+        returning adds a RETURNING clause (a constant when empty, so rows
+        can still be counted).
         """
         quoted_table = self.quote_identifier(table)
         quoted_columns = [self.quote_identifier(col) for col in columns]
@@ -288,8 +591,178 @@ ORDER BY cid
         quoted_keys = [self.quote_identifier(k) for k in key_columns]
         conflict_sql = f"ON CONFLICT ({', '.join(quoted_keys)})"
 
+        if returning is not None:
+            returned = [self.quote_identifier(col) for col in returning] or ['1']
+            returning_sql = f" RETURNING {', '.join(returned)}"
+        else:
+            returning_sql = ''
+
         if not (update_cols_always or update_cols_ifnull):
-            return f'{insert_sql} {conflict_sql} DO NOTHING'
+            return f'{insert_sql} {conflict_sql} DO NOTHING{returning_sql}'
 
         update_exprs = self._build_update_exprs(table, update_cols_always, update_cols_ifnull)
-        return f"{insert_sql} {conflict_sql} DO UPDATE SET {', '.join(update_exprs)}"
+        upsert_sql = f"{insert_sql} {conflict_sql} DO UPDATE SET {', '.join(update_exprs)}"
+        if only_if_changed:
+            values = self._build_update_values(table, update_cols_always, update_cols_ifnull)
+            changed = ' OR '.join(f'{quoted_table}.{qc} IS NOT {value}' for qc, value in values)
+            upsert_sql = f'{upsert_sql} WHERE {changed}'
+        return f'{upsert_sql}{returning_sql}'
+
+    def update_rows(self, cn: 'ConnectionWrapper', cursor: Any, table: str,
+                    keyfields: list[str], datafields: list[str],
+                    rows: list[tuple], batch_size: int) -> int:
+        """Update rows with UPDATE ... FROM (VALUES ...) (SQLite 3.33+).
+
+        VALUES columns are named column1, column2, ... in SQLite; the key
+        columns come first. Batches are capped by the bound-parameter
+        limit and run in one transaction unless the caller holds one.
+        """
+        fields = keyfields + datafields
+        batch_size = max(1, min(batch_size, SQLITE_MAX_VARIABLES // len(fields)))
+        quoted_table = self.quote_identifier(table)
+        set_sql = ', '.join(f'{self.quote_identifier(f)} = v.column{i}'
+                            for i, f in enumerate(fields, 1) if f in datafields)
+        where_sql = ' AND '.join(f't.{self.quote_identifier(k)} = v.column{i}'
+                                 for i, k in enumerate(keyfields, 1))
+        group = f"({make_placeholders(len(fields), 'sqlite')})"
+        dbapi_cursor = cursor.dbapi_cursor
+
+        owns_transaction = not getattr(cn, 'in_transaction', False)
+        if owns_transaction:
+            dbapi_cursor.execute('BEGIN')
+        updated = 0
+        try:
+            for i in range(0, len(rows), batch_size):
+                batch = rows[i:i + batch_size]
+                dbapi_cursor.execute(f'UPDATE {quoted_table} AS t SET {set_sql} '
+                                     f"FROM (VALUES {', '.join([group] * len(batch))}) AS v "
+                                     f'WHERE {where_sql}',
+                                     [value for row in batch for value in row])
+                updated += dbapi_cursor.rowcount
+            if owns_transaction:
+                dbapi_cursor.execute('COMMIT')
+        except Exception:
+            if owns_transaction:
+                dbapi_cursor.execute('ROLLBACK')
+            raise
+        return updated
+
+    def delete_rows(self, cn: 'ConnectionWrapper', cursor: Any, table: str,
+                    keyfields: list[str], keys: list[tuple], batch_size: int) -> int:
+        """Delete rows by joining on a temporary table of keys.
+
+        The keys are inserted with executemany into a temp table whose
+        columns take the key columns' affinity, then one DELETE ... WHERE
+        (keys) IN (SELECT ...) removes the matches. batch_size is the
+        executemany chunk. Runs in one transaction unless the caller
+        holds one.
+        """
+        quoted_table = self.quote_identifier(table)
+        quoted_keys = ', '.join(self.quote_identifier(k) for k in keyfields)
+        temp = self.quote_identifier(f'_bulk_{uuid.uuid4().hex[:12]}')
+        insert_sql = f"INSERT INTO temp.{temp} VALUES ({make_placeholders(len(keyfields), 'sqlite')})"
+        dbapi_cursor = cursor.dbapi_cursor
+
+        owns_transaction = not getattr(cn, 'in_transaction', False)
+        if owns_transaction:
+            dbapi_cursor.execute('BEGIN')
+        try:
+            dbapi_cursor.execute(f'CREATE TEMP TABLE {temp} AS '
+                                 f'SELECT {quoted_keys} FROM {quoted_table} WHERE 0')
+            it = iter(keys)
+            while batch := list(islice(it, batch_size)):
+                dbapi_cursor.executemany(insert_sql, batch)
+            dbapi_cursor.execute(f'DELETE FROM {quoted_table} WHERE ({quoted_keys}) IN '
+                                 f'(SELECT {quoted_keys} FROM temp.{temp})')
+            deleted = dbapi_cursor.rowcount
+            dbapi_cursor.execute(f'DROP TABLE temp.{temp}')
+            if owns_transaction:
+                dbapi_cursor.execute('COMMIT')
+        except Exception:
+            if owns_transaction:
+                dbapi_cursor.execute('ROLLBACK')
+            raise
+        return deleted
+
+    @cacheable_strategy('column_types', ttl=300, maxsize=50)
+    def get_column_types(self, cn: 'ConnectionWrapper', table: str,
+                         bypass_cache: bool = False) -> dict[str, str]:
+        """Map each column of a table to its declared type ('' when none).
+        """
+        return dict(self.get_column_type_codes(cn, table))
+
+    def get_column_type_codes(self, cn: 'ConnectionWrapper', table: str) -> list[tuple[str, Any]]:
+        """Get (column, declared type) pairs for a table in column order.
+        """
+        sql = f'PRAGMA table_info({self.quote_identifier(table)})'
+        return [(row['name'], row['type']) for row in self._select_raw(cn, sql)]
+
+    def column_type_sql(self, python_type: type) -> str:
+        """Map a Python type to a SQLite declared type (TEXT when unknown).
+        """
+        return sqlite_type_names.get(python_type, 'TEXT')
+
+    def copy_to(self, cn: 'ConnectionWrapper', table: str, columns: list[str],
+                batch_size: int) -> Iterator[list[tuple]]:
+        """Stream rows with fetchmany on a tuple cursor.
+        """
+        quoted_cols = ', '.join(self.quote_identifier(c) for c in columns)
+        cursor = self.create_tuple_cursor(cn.dbapi_connection)
+        try:
+            cursor.execute(f'SELECT {quoted_cols} FROM {self.quote_identifier(table)}')
+            while batch := cursor.fetchmany(batch_size):
+                yield batch
+        finally:
+            cursor.close()
+
+    def row_hash_sql(self, columns: list[str], column_types: list[str]) -> str:
+        """Hash rows with the db_row_hash() function registered on connect.
+        """
+        kinds = ''.join(_hash_kind(t) for t in column_types)
+        return f"db_row_hash('{kinds}', {', '.join(columns)})"
+
+    def binary_collation_sql(self, column: str, column_type: str) -> str:
+        """Override any declared collation (e.g. NOCASE) with BINARY.
+        """
+        return f'{column} COLLATE BINARY'
+
+    def upsert_returning(self, cursor: Any, sql: str, params: list[list[Any]],
+                         table: str, key_columns: list[str],
+                         key_positions: list[int] | None,
+                         batch_size: int) -> tuple[list[tuple], int]:
+        """Collect RETURNING rows with one multi-row VALUES statement per batch.
+
+        sqlite3's executemany discards returned rows, so each batch is
+        sent as a single INSERT with one VALUES group per row (capped by
+        the bound-parameter limit). SQLite has no equivalent of xmax, so
+        the conflict keys of each batch that already exist are counted
+        first; every other distinct key in the batch, and every row with
+        a NULL in its key, is an insert.
+        """
+        ncols = len(params[0])
+        batch_size = max(1, min(batch_size, SQLITE_MAX_VARIABLES // max(ncols, len(key_columns))))
+        group = f"({make_placeholders(ncols, 'sqlite')})"
+        key_group = f"({make_placeholders(len(key_columns), 'sqlite')})"
+        quoted_keys = ', '.join(self.quote_identifier(k) for k in key_columns)
+        quoted_table = self.quote_identifier(table)
+        dbapi_cursor = cursor.dbapi_cursor
+
+        rows: list[tuple] = []
+        inserted = 0
+        for i in range(0, len(params), batch_size):
+            batch = params[i:i + batch_size]
+            batch_keys = [tuple(p[k] for k in key_positions) for p in batch]
+            # A NULL key never conflicts, so each such row is an insert
+            keys = list(dict.fromkeys(key for key in batch_keys if None not in key))
+            inserted += len(batch_keys) - sum(1 for key in batch_keys if None not in key)
+            if keys:
+                dbapi_cursor.execute(
+                    f"SELECT COUNT(*) FROM {quoted_table} WHERE ({quoted_keys}) "
+                    f"IN (VALUES {', '.join([key_group] * len(keys))})",
+                    [value for key in keys for value in key])
+                inserted += len(keys) - dbapi_cursor.fetchone()[0]
+
+            batch_sql = sql.replace(group, ', '.join([group] * len(batch)), 1)
+            dbapi_cursor.execute(batch_sql, [value for p in batch for value in p])
+            rows.extend(dbapi_cursor.fetchall())
+        return rows, inserted
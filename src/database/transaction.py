@@ -3,15 +3,18 @@ Transaction handling and auto-commit management for database operations.
 """
 import logging
 import threading
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 from database.cursor import get_dict_cursor
+from database.row import Row
 from database.sql import prepare_query
 from database.strategy import get_db_strategy
 from database.utils import get_raw_connection
 
-from libb import attrdict, isiterable
+from libb import isiterable
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -145,9 +148,17 @@ class Transaction:
         return get_dict_cursor(self.connection)
 
     def __enter__(self):
-        _local.active_transactions[id(self.connection)] = True
-
-        disable_auto_commit(self.connection)
+        self._write_lock = self.connection.write_lock()
+        self._write_lock.__enter__()
+        try:
+            _local.active_transactions[id(self.connection)] = True
+            disable_auto_commit(self.connection)
+        except Exception:
+            _local.active_transactions.pop(id(self.connection), None)
+            if hasattr(self.connection, 'in_transaction'):
+                self.connection.in_transaction = False
+            self._write_lock.__exit__(None, None, None)
+            raise
         logger.debug(f'Started transaction for connection {id(self.connection)}')
 
         return self
@@ -169,6 +180,8 @@ class Transaction:
             if hasattr(self.connection, 'in_transaction'):
                 self.connection.in_transaction = False
 
+            self._write_lock.__exit__(None, None, None)
+
             logger.debug(f'Transaction cleanup complete for connection {id(self.connection)}')
 
     def execute(self, sql: str, *args, returnid: str | list[str] | None = None) -> Any:
@@ -178,7 +191,8 @@ class Transaction:
             return self.connection.execute(sql, *args)
 
         cursor = self.cursor
-        processed_sql, processed_args = prepare_query(sql, args, self.connection.dialect)
+        processed_sql, processed_args = prepare_query(sql, args, self.connection.dialect,
+                                                      self.connection.in_binding)
         cursor.execute(processed_sql, processed_args)
 
         results = None
@@ -200,7 +214,7 @@ class Transaction:
             return [[row[r] for r in returnid] for row in results]
         return [row[returnid] for row in results]
 
-    def select(self, sql: str, *args, **kwargs) -> pd.DataFrame:
+    def select(self, sql: str, *args, **kwargs) -> 'pd.DataFrame':
         """Execute SELECT query within transaction context.
         """
         return self.connection.select(sql, *args, **kwargs)
@@ -210,12 +224,12 @@ class Transaction:
         """
         return self.connection.select_column(sql, *args)
 
-    def select_row(self, sql: str, *args) -> attrdict:
+    def select_row(self, sql: str, *args) -> Row:
         """Execute a query and return a single row.
         """
         return self.connection.select_row(sql, *args)
 
-    def select_row_or_none(self, sql: str, *args) -> attrdict | None:
+    def select_row_or_none(self, sql: str, *args) -> Row | None:
         """Execute a query and return a single row or None if no rows found.
         """
         return self.connection.select_row_or_none(sql, *args)
@@ -0,0 +1,149 @@
+"""
+Streaming table copies between connections, e.g. PostgreSQL <-> SQLite.
+
+The source is read in bounded batches (a server-side cursor on PostgreSQL)
+on a worker thread while the destination loads them unchanged with
+copy_rows on the calling thread, so memory stays constant and the two
+sides overlap.
+"""
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import TYPE_CHECKING, Any
+
+from database.exceptions import ValidationError
+from database.sql import quote_identifier
+from database.strategy import get_db_strategy
+from database.types import resolve_type
+
+if TYPE_CHECKING:
+    from database.connection import ConnectionWrapper
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+def _create_table(src_cn: 'ConnectionWrapper', src_table: str, dst_cn: 'ConnectionWrapper',
+                  dst_table: str, columns: list[str], type_codes: dict[str, Any]) -> None:
+    """Create dst_table if missing.
+
+    Within one dialect the source's declared types are reused as they are
+    (keeping e.g. timestamptz and numeric(10,2)); across dialects they are
+    mapped through Python types by both strategies.
+    """
+    src_strategy = get_db_strategy(src_cn)
+    dst_strategy = get_db_strategy(dst_cn)
+    type_map = src_strategy.get_type_map()
+    declared = {}
+    if src_cn.dialect == dst_cn.dialect:
+        declared = src_strategy.get_column_types(src_cn, src_table)
+    definitions = []
+    for column in columns:
+        column_type = declared.get(column)
+        if not column_type:
+            python_type = resolve_type(src_cn.dialect, type_codes.get(column),
+                                       column_name=column, type_map=type_map)
+            column_type = dst_strategy.column_type_sql(python_type)
+        definitions.append(f'{quote_identifier(column, dst_cn.dialect)} {column_type}')
+    keys = [k for k in src_cn.get_table_primary_keys(src_table) if k in columns]
+    if keys:
+        definitions.append(f"primary key ({', '.join(quote_identifier(k, dst_cn.dialect) for k in keys)})")
+    dst_cn.execute(f'create table if not exists {quote_identifier(dst_table, dst_cn.dialect)} '
+                   f"({', '.join(definitions)})")
+
+
+def transfer_table(src_cn: 'ConnectionWrapper', src_table: str, dst_cn: 'ConnectionWrapper',
+                   dst_table: str | None = None, create: bool = True,
+                   columns: list[str] | None = None, batch_size: int = 10000,
+                   queue_size: int = 4) -> int:
+    """Copy a table's rows from one connection to another in bounded batches.
+
+    A worker thread streams the source with the strategy's copy_to (a
+    server-side cursor on PostgreSQL) into a queue of at most queue_size
+    batches while the calling thread loads them with the destination's
+    copy_rows, so at most about (queue_size + 2) * batch_size rows are held
+    in memory. Values are loaded as read, without copy_from's NULL
+    conversion of '' or 'NaN'. With create, a missing destination table is
+    created with the source's primary key and column types: copied
+    verbatim within one dialect, mapped through Python types across
+    dialects.
+
+    Args:
+        src_cn: Source connection
+        src_table: Source table
+        dst_cn: Destination connection, different from src_cn
+        dst_table: Destination table (default: src_table)
+        create: Create the destination table when it does not exist
+        columns: Columns to copy (default: all, in table order)
+        batch_size: Rows per batch
+        queue_size: Batches buffered between the two threads
+
+    Returns
+        int: Number of rows loaded
+    """
+    if src_cn is dst_cn:
+        raise ValidationError('transfer_table needs two connections; use INSERT ... SELECT')
+    if batch_size < 1 or queue_size < 1:
+        raise ValidationError('batch_size and queue_size must be at least 1')
+    dst_table = dst_table or src_table
+    src_strategy = get_db_strategy(src_cn)
+
+    type_codes = dict(src_strategy.get_column_type_codes(src_cn, src_table))
+    if not type_codes:
+        raise ValidationError(f'Table {src_table} not found or has no columns')
+    if columns is None:
+        columns = list(type_codes)
+    else:
+        case_map = {c.lower(): c for c in type_codes}
+        missing = [c for c in columns if c.lower() not in case_map]
+        if missing:
+            raise ValidationError(f'Columns {missing} are not in {src_table}')
+        columns = [case_map[c.lower()] for c in columns]
+    if create:
+        _create_table(src_cn, src_table, dst_cn, dst_table, columns, type_codes)
+
+    batches: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put(item: Any) -> None:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        try:
+            with closing(src_strategy.copy_to(src_cn, src_table, columns, batch_size)) as source:
+                for batch in source:
+                    put(batch)
+                    if stop.is_set():
+                        return
+        except BaseException as e:
+            put(e)
+            return
+        put(_DONE)
+
+    def rows() -> Iterator[tuple]:
+        while (item := batches.get()) is not _DONE:
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+
+    dst_strategy = get_db_strategy(dst_cn)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(produce)
+        try:
+            with dst_cn.write_lock():
+                count = dst_strategy.copy_rows(dst_cn, dst_table, columns, rows())
+        finally:
+            stop.set()
+        future.result()
+
+    logger.debug(f'Transferred {count} rows from {src_table} to {dst_table}')
+    return count
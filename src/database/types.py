@@ -11,21 +11,13 @@ import datetime
 import logging
 import math
 import sqlite3
+import sys
+from decimal import Decimal
+from functools import cache
 from typing import Any, Self, TypeVar
 
-import dateutil.parser
-import numpy as np
-import pandas as pd
-
 from libb import attrdict
 
-try:
-    import pyarrow as pa
-    PYARROW_AVAILABLE = True
-except ImportError:
-    pa = None
-    PYARROW_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
 # Type definitions
@@ -33,22 +25,20 @@ SQLiteConnection = TypeVar('SQLiteConnection')
 
 # Constants for type conversion
 SPECIAL_STRINGS: set[str] = {'null', 'nan', 'none', 'na', 'nat'}
-NUMPY_FLOAT_TYPES = (np.floating,)
-NUMPY_INT_TYPES = (np.integer, np.unsignedinteger)
-PANDAS_NULLABLE_TYPES = (
-    pd.Int64Dtype, pd.Int32Dtype, pd.Int16Dtype, pd.Int8Dtype,
-    pd.UInt64Dtype, pd.UInt32Dtype, pd.UInt16Dtype, pd.UInt8Dtype,
-    pd.Float64Dtype
-)
-PYARROW_FLOAT_TYPES = (
-    (pa.FloatScalar, pa.DoubleScalar, pa.Int8Scalar, pa.Int16Scalar,
-     pa.Int32Scalar, pa.Int64Scalar, pa.UInt8Scalar, pa.UInt16Scalar,
-     pa.UInt32Scalar, pa.UInt64Scalar, pa.StringScalar)
-    if PYARROW_AVAILABLE else ()
-)
+PANDAS_NULLABLE_DTYPES = ('Int64Dtype', 'Int32Dtype', 'Int16Dtype', 'Int8Dtype',
+                          'UInt64Dtype', 'UInt32Dtype', 'UInt16Dtype', 'UInt8Dtype',
+                          'Float64Dtype')
+PYARROW_SCALARS = ('FloatScalar', 'DoubleScalar', 'Int8Scalar', 'Int16Scalar',
+                   'Int32Scalar', 'Int64Scalar', 'UInt8Scalar', 'UInt16Scalar',
+                   'UInt32Scalar', 'UInt64Scalar', 'StringScalar')
 
 
 # Type Converter - Handles Python -> Database value conversion
+#
+# numpy, pandas and pyarrow are never imported here: a value of one of
+# their types can only exist once its library has been imported by the
+# caller, so the converters look the module up in sys.modules and skip
+# its checks when it is absent.
 
 def _check_special_string(value: str) -> None:
     """Check if a string value should be converted to NULL."""
@@ -64,6 +54,16 @@ def _normalize_special_string(py_value: Any) -> Any:
     return py_value
 
 
+@cache
+def _pandas_nullable_types(pd: Any) -> tuple[type, ...]:
+    return tuple(getattr(pd, name) for name in PANDAS_NULLABLE_DTYPES)
+
+
+@cache
+def _pyarrow_scalar_types(pa: Any) -> tuple[type, ...]:
+    return tuple(getattr(pa, name) for name in PYARROW_SCALARS)
+
+
 def _convert_pyarrow_value(value: Any) -> Any:
     """Convert PyArrow value to Python type.
 
@@ -75,12 +75,14 @@ def _convert_pyarrow_value(value: Any) -> Any:
     5. Use to_pandas() for tables
     6. Fall back to str()
     """
-    if not PYARROW_AVAILABLE or value is None:
+    pa = sys.modules.get('pyarrow')
+    if pa is None or value is None:
         return value
 
     # Check for null
     try:
-        if pa.compute.is_null(value).as_py():
+        import pyarrow.compute
+        if pyarrow.compute.is_null(value).as_py():
             return None
     except (AttributeError, TypeError, ValueError):
         pass
@@ -93,21 +95,21 @@ def _convert_pyarrow_value(value: Any) -> Any:
             pass
 
     # Scalar fallback: .value property
-    if pa and isinstance(value, pa.Scalar):
+    if isinstance(value, pa.Scalar):
         try:
             return _normalize_special_string(value.value)
         except (ValueError, TypeError, AttributeError):
             pass
 
     # Array types
-    if pa and isinstance(value, pa.Array | pa.ChunkedArray):
+    if isinstance(value, pa.Array | pa.ChunkedArray):
         try:
             return value.to_pylist()
         except (ValueError, TypeError, AttributeError):
             pass
 
     # Table type
-    if pa and isinstance(value, pa.Table):
+    if isinstance(value, pa.Table):
         try:
             return value.to_pandas()
         except (ValueError, TypeError, AttributeError):
@@ -122,8 +124,9 @@ def _convert_pyarrow_value(value: Any) -> Any:
 
 def _convert_numpy_value(val: Any) -> float | int | datetime.datetime | None:
     """Convert NumPy value to Python type."""
-    if val is None:
-        return None
+    np = sys.modules.get('numpy')
+    if val is None or np is None:
+        return val
 
     if isinstance(val, np.floating) and np.isnan(val):
         return None
@@ -143,7 +146,7 @@ def _convert_numpy_value(val: Any) -> float | int | datetime.datetime | None:
 
 def _convert_pandas_nullable(val: Any) -> Any:
     """Convert Pandas nullable value to Python type."""
-    if pd.isna(val):
+    if sys.modules['pandas'].isna(val):
         return None
     if isinstance(val, str) and _check_special_string(val) is None:
         return None
@@ -153,7 +156,7 @@ def _convert_pandas_nullable(val: Any) -> Any:
 class TypeConverter:
     """Universal type conversion for database parameters.
 
-    Handles NumPy, Pandas, and PyArrow types.
+    Handles NumPy, Pandas, and PyArrow types without importing them.
     """
 
     @staticmethod
@@ -166,7 +169,8 @@ class TypeConverter:
         numpy/pandas/pyarrow isinstance chain, which is significantly
         more expensive on every call. Subclasses (numpy/pandas types
         that inherit from Python builtins) fall through to the slow
-        path so their special handling still runs.
+        path so their special handling still runs. Each library's checks
+        only run once the library has been imported.
         """
         if value is None:
             return None
@@ -188,26 +192,34 @@ class TypeConverter:
         if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
             return None
 
-        if pd and hasattr(pd, 'NaT') and isinstance(value, type(pd.NaT)):
+        if isinstance(value, Decimal) and value.is_nan():
+            return None
+
+        pd = sys.modules.get('pandas')
+        if pd is not None and isinstance(value, type(pd.NaT)):
             return None
 
         if isinstance(value, str) and _check_special_string(value) is None:
             return None
 
-        if isinstance(value, (*NUMPY_FLOAT_TYPES, *NUMPY_INT_TYPES, np.datetime64)):
+        np = sys.modules.get('numpy')
+        if np is not None and isinstance(value, (np.floating, np.integer, np.unsignedinteger,
+                                                 np.datetime64)):
             return _convert_numpy_value(value)
 
-        if pd.api.types.is_scalar(value) and pd.isna(value):
-            return None
+        if pd is not None:
+            if pd.api.types.is_scalar(value) and pd.isna(value):
+                return None
 
-        if hasattr(value, 'dtype') and pd.api.types.is_dtype_equal(value.dtype, 'object') and pd.isna(value):
-            return None
+            if hasattr(value, 'dtype') and pd.api.types.is_dtype_equal(value.dtype, 'object') and pd.isna(value):
+                return None
 
-        if isinstance(value, PANDAS_NULLABLE_TYPES):
-            return _convert_pandas_nullable(value)
+            if isinstance(value, _pandas_nullable_types(pd)):
+                return _convert_pandas_nullable(value)
 
-        if PYARROW_AVAILABLE:
-            if isinstance(value, PYARROW_FLOAT_TYPES):
+        pa = sys.modules.get('pyarrow')
+        if pa is not None:
+            if isinstance(value, _pyarrow_scalar_types(pa)):
                 return _convert_pyarrow_value(value)
             if isinstance(value, pa.Scalar) or hasattr(value, '_is_arrow_scalar') or \
                isinstance(value, pa.Array | pa.ChunkedArray | pa.Table):
@@ -234,7 +246,10 @@ class TypeConverter:
 
 # Type Resolution - Database type codes -> Python types
 
+import psycopg
 from psycopg.postgres import types as pg_types
+from psycopg.pq import Format
+from psycopg.types.numeric import FloatLoader, NumericBinaryLoader
 
 
 def _safe_oid(type_name: str) -> int | None:
@@ -288,6 +303,41 @@ def _build_postgres_types() -> dict[int, type]:
 
 postgres_types: dict[int, type] = _build_postgres_types()
 
+# psycopg loads numeric as Decimal; every other type in postgres_types
+# already loads as its mapped Python type, so numeric is the only cast.
+NUMERIC_OID = _safe_oid('numeric')
+
+
+class NumericFloatBinaryLoader(NumericBinaryLoader):
+    """Load binary-format numeric values as float instead of Decimal."""
+
+    def load(self, data: Any) -> float:
+        return float(super().load(data))
+
+
+# Resolves to psycopg's C FloatLoader when the binary package is installed
+_FLOAT_LOADERS = {
+    psycopg.adapters.get_loader(_safe_oid('float8'), Format.TEXT),
+    NumericFloatBinaryLoader,
+}
+
+
+def register_numeric_float_loaders(adapters: Any) -> None:
+    """Load numeric as float inside psycopg for a connection or cursor.
+
+    Args:
+        adapters: psycopg AdaptersMap, e.g. connection.adapters
+    """
+    adapters.register_loader('numeric', FloatLoader)
+    adapters.register_loader('numeric', NumericFloatBinaryLoader)
+
+
+def numeric_loads_as_float(adapters: Any, fmt: Format = Format.TEXT) -> bool:
+    """Return True if numeric values already load as float.
+    """
+    loader = adapters.get_loader(NUMERIC_OID, fmt)
+    return loader is not None and loader in _FLOAT_LOADERS
+
 
 sqlite_types: dict[str, type] = {
     'INTEGER': int,
@@ -301,6 +351,34 @@ sqlite_types: dict[str, type] = {
     'TIME': datetime.time,
 }
 
+# Python type -> column type used when creating tables; unlisted types
+# fall back to text
+postgres_type_names: dict[type, str] = {
+    int: 'bigint',
+    float: 'double precision',
+    Decimal: 'numeric',
+    str: 'text',
+    bool: 'boolean',
+    datetime.date: 'date',
+    datetime.datetime: 'timestamp',
+    datetime.time: 'time',
+    bytes: 'bytea',
+    dict: 'jsonb',
+}
+
+sqlite_type_names: dict[type, str] = {
+    int: 'INTEGER',
+    float: 'REAL',
+    Decimal: 'NUMERIC',
+    str: 'TEXT',
+    bool: 'BOOLEAN',
+    datetime.date: 'DATE',
+    datetime.datetime: 'DATETIME',
+    datetime.time: 'TIME',
+    bytes: 'BLOB',
+    dict: 'TEXT',
+}
+
 
 def resolve_type(
     db_type: str,
@@ -573,14 +651,21 @@ class RowAdapter:
 
 # SQLite Adapters - Database value converters
 
+@cache
+def _isoparse() -> Any:
+    """Return dateutil's isoparse, importing dateutil on first use."""
+    from dateutil.parser import isoparse
+    return isoparse
+
+
 def convert_date(val: bytes) -> datetime.date:
     """Convert ISO 8601 date string to date object."""
-    return dateutil.parser.isoparse(val.decode()).date()
+    return _isoparse()(val.decode()).date()
 
 
 def convert_datetime(val: bytes) -> datetime.datetime:
     """Convert ISO 8601 datetime string to datetime object."""
-    return dateutil.parser.isoparse(val.decode())
+    return _isoparse()(val.decode())
 
 
 class AdapterRegistry:
@@ -0,0 +1,102 @@
+"""
+Watermark storage for incremental extracts.
+
+A watermark is the highest value of a monotonic column (updated_at, a
+version number) that a sync job has processed. select_since reads the rows
+past it; WatermarkStore keeps it between runs in a small table, either in
+the source database or in any other connection such as a local SQLite file.
+"""
+import datetime
+import json
+import logging
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from database.exceptions import ValidationError
+from database.sql import quote_identifier
+from database.types import TypeConverter
+
+if TYPE_CHECKING:
+    from database.connection import ConnectionWrapper
+
+logger = logging.getLogger(__name__)
+
+# (kind, type, decoder); order matters since bool is an int and
+# datetime is a date
+_KINDS: list[tuple[str, type, Any]] = [
+    ('bool', bool, lambda s: s == 'True'),
+    ('int', int, int),
+    ('float', float, float),
+    ('decimal', Decimal, Decimal),
+    ('datetime', datetime.datetime, datetime.datetime.fromisoformat),
+    ('date', datetime.date, datetime.date.fromisoformat),
+    ('str', str, str),
+]
+_DECODERS = {kind: decode for kind, _, decode in _KINDS}
+_DECODERS['tuple'] = lambda s: tuple(_DECODERS[kind](text) for kind, text in json.loads(s))
+
+
+def _encode(value: Any) -> tuple[str, str]:
+    """Return (kind, text) for a watermark value or a scan token of them."""
+    value = TypeConverter.convert_value(value)
+    if isinstance(value, tuple):
+        return 'tuple', json.dumps([_encode(v) for v in value])
+    for kind, type_, _ in _KINDS:
+        if isinstance(value, type_):
+            if kind in {'datetime', 'date'}:
+                return kind, value.isoformat()
+            return kind, repr(value) if kind == 'float' else str(value)
+    raise ValidationError(f'Unsupported watermark type {type(value).__name__}')
+
+
+class WatermarkStore:
+    """Named watermarks kept in a table of a connection.
+
+    The table (default _watermarks) is created when missing. Values
+    keep their type: int, float, Decimal, str, bool, date and datetime
+    round-trip exactly, as do tuples of them such as a scan's token.
+    set is a single upsert, so a watermark advances atomically; called
+    inside a transaction on the same connection it commits together
+    with the data the consumer wrote.
+
+    Examples
+        store = WatermarkStore(cn)
+        scan = cn.select_since('events', 'updated_at', store.get('events'))
+        for page in scan:
+            load(page)
+        store.set('events', scan.token)
+    """
+
+    def __init__(self, cn: 'ConnectionWrapper', table: str = '_watermarks') -> None:
+        self.cn = cn
+        self.table = table
+        self._quoted_table = quote_identifier(table, cn.dialect)
+        cn.execute(f'create table if not exists {self._quoted_table} ('
+                   'name varchar(255) primary key, kind varchar(16) not null, '
+                   'value text not null, updated_at varchar(32) not null)')
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return the stored watermark for name, or default when there is none.
+        """
+        row = self.cn.select_row_or_none(
+            f'select kind, value from {self._quoted_table} where name = %s', name)
+        if row is None:
+            return default
+        return _DECODERS[row['kind']](row['value'])
+
+    def set(self, name: str, value: Any) -> None:
+        """Store value as the watermark for name. None leaves it unchanged.
+        """
+        if value is None:
+            return
+        kind, text = _encode(value)
+        updated_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+        self.cn.upsert_rows(self.table, [{'name': name, 'kind': kind, 'value': text,
+                                          'updated_at': updated_at}],
+                            update_cols_always=['kind', 'value', 'updated_at'])
+        logger.debug(f'Watermark {name} advanced to {text}')
+
+    def delete(self, name: str) -> None:
+        """Forget the watermark for name so the next run reads everything.
+        """
+        self.cn.execute(f'delete from {self._quoted_table} where name = %s', name)
@@ -5,6 +5,8 @@ Violations indicate someone broke a layering contract.
 """
 import ast
 import pathlib
+import subprocess
+import sys
 
 _SRC = pathlib.Path(__file__).parent.parent.parent / 'src' / 'database'
 _STRATEGY_SRC = _SRC / 'strategy'
@@ -118,32 +120,75 @@ def test_all_registered_strategies_are_concrete():
     )
 
 
+_HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'dateutil')
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """`import database` and DataFrame-free queries must not import
+    pandas, numpy, pyarrow or dateutil.
+
+    CLI tools and serverless handlers pay for every module imported at
+    startup. These libraries are loaded by the data loaders and type
+    converters on first use instead.
+    """
+    code = f"""
+import sys
+import database as db
+from database.options import iterdict_data_loader
+cn = db.connect({{'drivername': 'sqlite', 'database': ':memory:',
+                 'data_loader': iterdict_data_loader}})
+db.execute(cn, 'CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, amount REAL)')
+db.insert_rows(cn, 't', [{{'id': 1, 'name': 'a', 'amount': 1.5}}])
+assert db.select_scalar(cn, 'SELECT name FROM t WHERE id = %s', 1) == 'a'
+assert db.select(cn, 'SELECT * FROM t')[0]['amount'] == 1.5
+print(','.join(m for m in {_HEAVY_MODULES!r} if m in sys.modules))
+"""
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                            text=True, check=True, cwd=_SRC.parent)
+    loaded = result.stdout.strip()
+    assert not loaded, f'import database loaded heavy modules: {loaded}'
+
+
 # Snapshot of the public API. Update this set whenever a name is
 # intentionally added or removed from `database.__all__`; the test will
 # fail to force a deliberate review of the API change.
 _EXPECTED_ALL: frozenset[str] = frozenset({
     'Column',
+    'QueryHook',
+    'QueryStats',
+    'add_query_hook',
+    'remove_query_hook',
+    'Row',
+    'ArrayParam',
     'ConnectionFailure',
     'ConnectionWrapper',
     'DatabaseError',
     'DatabaseOptions',
     'DbConnectionError',
+    'IncrementalScan',
     'IntegrityError',
     'IntegrityViolationError',
     'OperationalError',
     'ProgrammingError',
     'QueryError',
+    'TableDiff',
+    'TableScan',
     'TypeConversionError',
     'UniqueViolation',
+    'UpsertResult',
     'ValidationError',
+    'WatermarkStore',
     'cluster_table',
     'connect',
     'copy_from',
     'delete',
+    'delete_rows',
+    'diff_tables',
     'execute',
     'insert',
     'insert_row',
     'insert_rows',
+    'iter_table',
     'reindex_table',
     'reset_table_sequence',
     'select',
@@ -152,10 +197,13 @@ _EXPECTED_ALL: frozenset[str] = frozenset({
     'select_row_or_none',
     'select_scalar',
     'select_scalar_or_none',
+    'select_since',
     'transaction',
+    'transfer_table',
     'update',
     'update_or_insert',
     'update_row',
+    'update_rows',
     'upsert_rows',
     'vacuum_table',
 })
@@ -0,0 +1,58 @@
+"""
+Database-agnostic tests for bulk delete_rows.
+
+These tests run against both PostgreSQL and SQLite to verify
+consistent delete-by-key behavior across backends.
+"""
+import database as db
+import pytest
+
+
+class TestDeleteRows:
+    """Deleting rows by a list of keys."""
+
+    def test_single_key(self, db_conn):
+        """Scalar keys match a single keyfield; unknown keys are ignored."""
+        count = db.delete_rows(db_conn, 'test_table', ['name'], ['Alice', 'Charlie', 'Nobody'])
+
+        assert count == 2
+        assert db.select_column(db_conn, 'SELECT name FROM test_table') == ['Bob']
+
+    def test_composite_key(self, db_conn):
+        """Tuples match composite keys column by column."""
+        keys = [('Alice', 10), ('Bob', 99), ('Charlie', 30)]
+        assert db.delete_rows(db_conn, 'test_table', ['name', 'value'], keys) == 2
+        assert db.select_column(db_conn, 'SELECT name FROM test_table') == ['Bob']
+
+    def test_dict_keys_across_batches(self, db_conn):
+        """Dict keys are read by keyfield name, in any casing, over several batches."""
+        keys = [{'NAME': name, 'value': 0} for name in ('Alice', 'Bob', 'Charlie')]
+        assert db.delete_rows(db_conn, 'test_table', ['Name'], keys, batch_size=2) == 3
+        assert db.select_scalar(db_conn, 'SELECT count(*) FROM test_table') == 0
+
+    def test_rolls_back_with_transaction(self, db_conn):
+        """Inside a transaction the delete is not committed on its own."""
+        with pytest.raises(RuntimeError), db.transaction(db_conn):
+            db.delete_rows(db_conn, 'test_table', ['name'], ['Alice'])
+            raise RuntimeError('abort')
+        assert db.select_scalar(db_conn, 'SELECT count(*) FROM test_table') == 3
+
+    def test_empty_keys(self, db_conn):
+        """No keys is a no-op."""
+        assert db.delete_rows(db_conn, 'test_table', ['name'], []) == 0
+
+    @pytest.mark.parametrize(('keyfields', 'keys'), [
+        ([], ['Alice']),
+        (['missing'], ['Alice']),
+        (['name', 'value'], ['Alice']),
+        (['name'], [('Alice', 10)]),
+    ], ids=['no-keys', 'unknown-column', 'scalar-for-composite', 'tuple-too-long'])
+    def test_validation(self, db_conn, keyfields, keys):
+        """Keys that do not line up with the keyfields raise before deleting."""
+        with pytest.raises(db.ValidationError):
+            db.delete_rows(db_conn, 'test_table', keyfields, keys)
+        assert db.select_scalar(db_conn, 'SELECT count(*) FROM test_table') == 3
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
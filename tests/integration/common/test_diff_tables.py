@@ -0,0 +1,171 @@
+"""
+Database-agnostic tests for hash-based diff_tables.
+
+These tests run against both PostgreSQL and SQLite, and across the two,
+to verify that only differing key ranges are fetched.
+"""
+import datetime
+
+import database as db
+import pytest
+
+ROWS = 2000
+
+
+def _stage(cn, table, rows=ROWS):
+    db.execute(cn, f'DROP TABLE IF EXISTS {table}')
+    db.execute(cn, f'CREATE TABLE {table} (id INTEGER PRIMARY KEY, name TEXT, qty INTEGER)')
+    db.copy_from(cn, table, ((i, f'item{i}', i % 7) for i in range(rows)), ['id', 'name', 'qty'])
+
+
+class RowCounter(db.QueryHook):
+    def __init__(self):
+        self.rows = 0
+
+    def after_execute(self, event):
+        self.rows += event.rows_fetched or 0
+
+
+@pytest.fixture
+def tables(db_conn):
+    _stage(db_conn, 'test_diff_a')
+    _stage(db_conn, 'test_diff_b')
+    yield db_conn
+    db.execute(db_conn, 'DROP TABLE test_diff_a')
+    db.execute(db_conn, 'DROP TABLE test_diff_b')
+
+
+class TestDiffTables:
+    """Finding differing keys by range hashes."""
+
+    def test_identical_tables(self, tables):
+        """Equal tables are settled by one summary query per side."""
+        counter = RowCounter()
+        db.add_query_hook(counter)
+        try:
+            diff = db.diff_tables(tables, 'test_diff_a', tables, 'test_diff_b')
+        finally:
+            db.remove_query_hook(counter)
+
+        assert not diff
+        assert counter.rows == 2
+
+    def test_reports_inserts_deletes_and_changes(self, tables):
+        """Keys are classified by which side has them and whether values match."""
+        db.execute(tables, 'DELETE FROM test_diff_b WHERE id IN (5, 1500)')
+        db.execute(tables, "UPDATE test_diff_b SET name = 'changed' WHERE id = 777")
+        db.execute(tables, 'UPDATE test_diff_b SET qty = NULL WHERE id = 1999')
+        db.insert_rows(tables, 'test_diff_b', [{'id': 5000, 'name': 'new', 'qty': 1}])
+
+        counter = RowCounter()
+        db.add_query_hook(counter)
+        try:
+            diff = db.diff_tables(tables, 'test_diff_a', tables, 'test_diff_b',
+                                  segments=4, leaf_size=50)
+        finally:
+            db.remove_query_hook(counter)
+
+        assert diff.only_a == [(5,), (1500,)]
+        assert diff.only_b == [(5000,)]
+        assert diff.changed == [(777,), (1999,)]
+        assert counter.rows < ROWS / 2
+
+    def test_composite_key_and_columns(self, tables):
+        """Composite keys split by row value; columns limit what is compared."""
+        db.execute(tables, "UPDATE test_diff_b SET name = 'ignored' WHERE id = 10")
+        db.execute(tables, 'UPDATE test_diff_b SET qty = 99 WHERE id = 20')
+
+        diff = db.diff_tables(tables, 'test_diff_a', tables, 'test_diff_b',
+                              key_columns=['qty', 'id'], columns=[], leaf_size=100)
+        assert (diff.only_a, diff.only_b, diff.changed) == ([(6, 20)], [(99, 20)], [])
+
+    def test_validation(self, tables):
+        with pytest.raises(db.ValidationError):
+            db.diff_tables(tables, 'test_diff_a', tables, 'test_diff_b', segments=1)
+
+
+def test_diff_across_databases(pg_conn, sl_conn):
+    """PostgreSQL and SQLite hash integer and text rows identically"""
+    _stage(pg_conn, 'test_diff_a')
+    _stage(sl_conn, 'test_diff_b')
+    db.execute(sl_conn, "UPDATE test_diff_b SET name = 'changed' WHERE id = 1234")
+
+    counter = RowCounter()
+    db.add_query_hook(counter)
+    try:
+        diff = db.diff_tables(pg_conn, 'test_diff_a', sl_conn, 'test_diff_b', leaf_size=100)
+    finally:
+        db.remove_query_hook(counter)
+        db.execute(pg_conn, 'DROP TABLE test_diff_a')
+
+    assert diff.changed == [(1234,)]
+    assert counter.rows < ROWS / 4
+
+
+def _stage_typed(cn, table):
+    db.execute(cn, f'DROP TABLE IF EXISTS {table}')
+    db.execute(cn, f'CREATE TABLE {table} (id INTEGER PRIMARY KEY, price NUMERIC(10, 2), '
+                   'ratio DOUBLE PRECISION, active BOOLEAN, seen TIMESTAMP)')
+    start = datetime.datetime(2024, 1, 1, 8, 30)
+    rows = ((i, i / 4, i / 3, i % 2 == 0, start + datetime.timedelta(seconds=i, microseconds=i))
+            for i in range(ROWS))
+    db.copy_from(cn, table, rows, ['id', 'price', 'ratio', 'active', 'seen'])
+
+
+def test_diff_typed_columns_across_databases(pg_conn, sl_conn):
+    """Numeric, boolean and timestamp values hash alike on both dialects"""
+    _stage_typed(pg_conn, 'test_diff_typed_a')
+    _stage_typed(sl_conn, 'test_diff_typed_b')
+    db.execute(sl_conn, 'UPDATE test_diff_typed_b SET price = 0.5 WHERE id = 1234')
+
+    counter = RowCounter()
+    db.add_query_hook(counter)
+    try:
+        diff = db.diff_tables(pg_conn, 'test_diff_typed_a', sl_conn, 'test_diff_typed_b',
+                              leaf_size=100)
+    finally:
+        db.remove_query_hook(counter)
+        db.execute(pg_conn, 'DROP TABLE test_diff_typed_a')
+
+    assert diff.changed == [(1234,)]
+    assert counter.rows < ROWS / 4
+
+
+def _stage_text_keys(cn, table, collate=''):
+    db.execute(cn, f'DROP TABLE IF EXISTS {table}')
+    db.execute(cn, f'CREATE TABLE {table} (code TEXT {collate} PRIMARY KEY, qty INTEGER)')
+    db.copy_from(cn, table, ((f"{'aBcXyZ_'[i % 7]}{i:03d}", i) for i in range(400)),
+                 ['code', 'qty'])
+
+
+def _pg_linguistic_collation(pg_conn):
+    return db.select_scalar_or_none(pg_conn, 'SELECT collname FROM pg_collation WHERE collname '
+                                             "IN ('en_US.utf8', 'en_US', 'und-x-icu') LIMIT 1")
+
+
+@pytest.mark.parametrize('collated_side', ['sl', 'pg'])
+def test_diff_text_keys_across_collations(pg_conn, sl_conn, collated_side):
+    """Mixed-case text keys land in the same ranges whatever each side's collation"""
+    pg_collate, sl_collate = '', ''
+    if collated_side == 'sl':
+        sl_collate = 'COLLATE NOCASE'
+    else:
+        collation = _pg_linguistic_collation(pg_conn)
+        if collation is None:
+            pytest.skip('no linguistic collation installed')
+        pg_collate = f'COLLATE "{collation}"'
+    _stage_text_keys(pg_conn, 'test_diff_text_a', pg_collate)
+    _stage_text_keys(sl_conn, 'test_diff_text_b', sl_collate)
+    db.execute(sl_conn, "UPDATE test_diff_text_b SET qty = -1 WHERE code = 'B204'")
+
+    try:
+        diff = db.diff_tables(pg_conn, 'test_diff_text_a', sl_conn, 'test_diff_text_b',
+                              segments=4, leaf_size=10)
+    finally:
+        db.execute(pg_conn, 'DROP TABLE test_diff_text_a')
+
+    assert (diff.only_a, diff.only_b, diff.changed) == ([], [], [('B204',)])
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
@@ -0,0 +1,65 @@
+"""
+Database-agnostic tests for keyset-paginated iter_table.
+
+These tests run against both PostgreSQL and SQLite to verify
+consistent paging and resume behavior across backends.
+"""
+import database as db
+import pytest
+from tests.integration.common.conftest import col
+
+
+def _stage_pairs(cn, count):
+    """Table with a composite primary key whose second part restarts per group."""
+    db.execute(cn, 'DROP TABLE IF EXISTS test_pairs')
+    db.execute(cn, 'CREATE TABLE test_pairs (grp INTEGER, seq INTEGER, label TEXT, PRIMARY KEY (grp, seq))')
+    db.insert_rows(cn, 'test_pairs', [{'grp': i // 3, 'seq': i % 3, 'label': f'row{i}'}
+                                      for i in range(count)])
+
+
+class TestIterTable:
+    """Paging through a table by its key."""
+
+    def test_pages_by_primary_key(self, db_conn):
+        """The primary key orders the pages; the last page may be short."""
+        pages = list(db.iter_table(db_conn, 'test_table', page_size=2))
+
+        assert [len(page) for page in pages] == [2, 1]
+        assert [name for page in pages for name in col(page, 'name')] == ['Alice', 'Bob', 'Charlie']
+
+    def test_exact_multiple_ends_with_empty_query(self, db_conn):
+        """A full last page is followed by a query that finds nothing."""
+        pages = list(db.iter_table(db_conn, 'test_table', page_size=3))
+        assert [len(page) for page in pages] == [3]
+
+    def test_composite_key_resumes_from_token(self, db_conn):
+        """A new scan started after a token continues with the next row."""
+        _stage_pairs(db_conn, 10)
+        scan = db.iter_table(db_conn, 'test_pairs', page_size=4)
+        first = next(iter(scan))
+        assert scan.token == (1, 0)
+
+        rest = db.iter_table(db_conn, 'test_pairs', page_size=4, after=scan.token)
+        labels = col(first, 'label') + [label for page in rest for label in col(page, 'label')]
+        assert labels == [f'row{i}' for i in range(10)]
+        db.execute(db_conn, 'DROP TABLE test_pairs')
+
+    def test_explicit_key_and_columns(self, db_conn):
+        """Any unique column can order the scan, and columns limit the select."""
+        pages = list(db.iter_table(db_conn, 'test_table', key_columns=['value'],
+                                   columns=['value'], page_size=2, after=[10]))
+        assert [v for page in pages for v in col(page, 'value')] == [20, 30]
+
+    @pytest.mark.parametrize('kwargs', [
+        {'page_size': 0},
+        {'columns': ['value']},
+        {'after': ('Alice', 10)},
+    ], ids=['page-size', 'columns-without-key', 'token-length'])
+    def test_validation(self, db_conn, kwargs):
+        """Bad arguments raise before any query runs."""
+        with pytest.raises(db.ValidationError):
+            db.iter_table(db_conn, 'test_table', **kwargs)
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
@@ -67,6 +67,25 @@ def test_direct_list_parameters(db_conn):
     assert wrapped == [101]
 
 
+def test_array_bound_in_lists(db_conn, monkeypatch):
+    """Array binding handles IN / NOT IN lists past the drivers' parameter
+    limits, per value with ArrayParam or per connection with in_binding.
+    """
+    ids = list(range(1000, 71000))  # more than 65535 (PG) bind parameters
+    count = db.select_scalar(
+        db_conn, 'SELECT COUNT(*) FROM test_table WHERE value IN %s', db.ArrayParam(ids))
+    assert count == 0
+
+    names = db.select_column(db_conn, 'SELECT name FROM test_table ORDER BY name')
+    monkeypatch.setattr(db_conn.options, 'in_binding', 'array')
+    found = db.select_column(
+        db_conn, 'SELECT name FROM test_table WHERE name IN %s ORDER BY name', names[:2])
+    assert found == names[:2]
+    rest = db.select_column(
+        db_conn, 'SELECT name FROM test_table WHERE name NOT IN (%s) ORDER BY name', names[:2])
+    assert rest == names[2:]
+
+
 def test_direct_lists_for_multiple_in_clauses(db_conn, dialect):
     """Two IN clauses in one query, each fed by a direct list."""
     if dialect == 'postgresql':
@@ -93,6 +93,55 @@ class TestSelectWithMultipleParams:
         assert col(result, 'name') == ['Alice', 'Charlie']
 
 
+class TestChunkedInSelect:
+    """Tests for splitting oversized IN lists into per-chunk queries."""
+
+    def test_chunked_matches_single_query(self, db_conn):
+        """Chunked results equal the single-query result and keep column types."""
+        names = ['Alice', 'Bob', 'Charlie', 'Nobody', 'Alice']
+        sql = 'SELECT name, value FROM test_table WHERE name IN %s AND value > %s'
+        expected = db.select(db_conn, sql, names, 0)
+        chunked = db.select(db_conn, sql, names, 0, in_chunk_size=2)
+
+        assert sorted(col(chunked, 'name')) == sorted(col(expected, 'name'))
+        if hasattr(chunked, 'attrs'):
+            assert chunked.attrs['column_types'] == expected.attrs['column_types']
+
+    def test_chunked_in_parallel(self, db_conn):
+        """Concurrent chunks return the same rows as sequential ones."""
+        sql = 'SELECT name FROM test_table WHERE name IN %(names)s'
+        names = {'names': ['Alice', 'Bob', 'Charlie']}
+        result = db.select(db_conn, sql, names, in_chunk_size=1, in_chunk_workers=3)
+        assert sorted(col(result, 'name')) == ['Alice', 'Bob', 'Charlie']
+
+    def test_chunked_empty_result(self, db_conn):
+        """Chunks with no rows still load an empty result with columns."""
+        result = db.select(db_conn, 'SELECT name FROM test_table WHERE name IN %s',
+                           ['X', 'Y', 'Z'], in_chunk_size=2)
+        assert len(result) == 0
+
+
+class TestPipelinedFetch:
+    """Tests for loading results in fetchmany batches."""
+
+    def test_batches_match_single_fetch(self, db_conn):
+        """Batched loading returns the same result as one fetchall."""
+        sql = 'SELECT name, value FROM test_table ORDER BY name'
+        expected = db.select(db_conn, sql)
+        for size in (1, 2, 100):
+            batched = db.select(db_conn, sql, fetch_batch_size=size)
+            assert col(batched, 'name') == col(expected, 'name')
+            assert col(batched, 'value') == col(expected, 'value')
+            if hasattr(batched, 'attrs'):
+                assert batched.attrs['column_types'] == expected.attrs['column_types']
+
+    def test_batches_empty_result(self, db_conn):
+        """An empty batched result still carries its columns."""
+        result = db.select(db_conn, "SELECT name FROM test_table WHERE name = 'Nobody'",
+                           fetch_batch_size=2)
+        assert len(result) == 0
+
+
 class TestEmptyResults:
     """Tests for handling empty result sets."""
 
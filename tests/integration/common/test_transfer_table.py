@@ -0,0 +1,118 @@
+"""
+Streaming transfer_table copies between PostgreSQL and SQLite in both
+directions, creating the destination table with mapped column types.
+"""
+import datetime
+
+import database as db
+import pytest
+
+ROWS = [
+    (i, f'name{i}', i * 1.5, i % 2 == 0, datetime.date(2024, 1, 1) + datetime.timedelta(days=i))
+    for i in range(1, 26)
+] + [(26, None, None, None, None)]
+
+
+def _drop(cn, table):
+    db.execute(cn, f'DROP TABLE IF EXISTS {table}')
+
+
+@pytest.fixture
+def source_pg(pg_conn, sl_conn):
+    _drop(pg_conn, 'test_transfer_src')
+    _drop(sl_conn, 'test_transfer_dst')
+    db.execute(pg_conn, """
+        CREATE TABLE test_transfer_src (
+            id INTEGER PRIMARY KEY, name TEXT, price NUMERIC(10, 2), active BOOLEAN, day DATE)
+    """)
+    db.copy_from(pg_conn, 'test_transfer_src', ROWS, ['id', 'name', 'price', 'active', 'day'])
+    yield pg_conn, sl_conn
+    _drop(pg_conn, 'test_transfer_src')
+    _drop(sl_conn, 'test_transfer_dst')
+
+
+@pytest.fixture
+def source_sl(pg_conn, sl_conn):
+    _drop(sl_conn, 'test_transfer_src')
+    _drop(pg_conn, 'test_transfer_dst')
+    db.execute(sl_conn, """
+        CREATE TABLE test_transfer_src (
+            id INTEGER PRIMARY KEY, name TEXT, price REAL, active BOOLEAN, day DATE)
+    """)
+    db.copy_from(sl_conn, 'test_transfer_src', ROWS, ['id', 'name', 'price', 'active', 'day'])
+    yield sl_conn, pg_conn
+    _drop(sl_conn, 'test_transfer_src')
+    _drop(pg_conn, 'test_transfer_dst')
+
+
+class TestTransferTable:
+    """Copying tables across dialects."""
+
+    @pytest.mark.parametrize('direction', ['source_pg', 'source_sl'])
+    def test_creates_and_loads_destination(self, request, direction):
+        """Rows arrive intact across several batches in a created table."""
+        src, dst = request.getfixturevalue(direction)
+        count = db.transfer_table(src, 'test_transfer_src', dst, 'test_transfer_dst', batch_size=4)
+
+        assert count == len(ROWS)
+        assert dst.get_table_primary_keys('test_transfer_dst', bypass_cache=True) == ['id']
+        first = db.select_row(dst, 'SELECT * FROM test_transfer_dst WHERE id = 2')
+        assert (first.name, first.price, bool(first.active)) == ('name2', 3.0, True)
+        assert str(first.day)[:10] == '2024-01-03'
+        empty = db.select_row(dst, 'SELECT * FROM test_transfer_dst WHERE id = 26')
+        assert (empty.name, empty.price, empty.active, empty.day) == (None, None, None, None)
+
+    def test_maps_column_types(self, source_pg):
+        """PostgreSQL types map through Python types to SQLite declared types."""
+        src, dst = source_pg
+        db.transfer_table(src, 'test_transfer_src', dst, 'test_transfer_dst')
+
+        declared = dict(db.select(dst, 'SELECT name, type FROM pragma_table_info(%s)',
+                                  'test_transfer_dst').itertuples(index=False, name=None))
+        assert declared == {'id': 'INTEGER', 'name': 'TEXT', 'price': 'REAL',
+                            'active': 'BOOLEAN', 'day': 'DATE'}
+
+    def test_existing_table_and_column_subset(self, source_sl):
+        """create=False loads an existing table; columns picks what is copied."""
+        src, dst = source_sl
+        db.execute(dst, 'CREATE TABLE test_transfer_dst (id INTEGER PRIMARY KEY, name TEXT)')
+
+        count = db.transfer_table(src, 'test_transfer_src', dst, 'test_transfer_dst',
+                                  create=False, columns=['ID', 'name'])
+        assert count == len(ROWS)
+        assert db.select_scalar(dst, 'SELECT name FROM test_transfer_dst WHERE id = 25') == 'name25'
+
+    def test_load_failure_stops_reader(self, source_pg):
+        """A failing destination load raises and leaves nothing behind."""
+        src, dst = source_pg
+        db.execute(dst, 'CREATE TABLE test_transfer_dst (id INTEGER PRIMARY KEY, name TEXT NOT NULL)')
+
+        with pytest.raises(db.IntegrityError):
+            db.transfer_table(src, 'test_transfer_src', dst, 'test_transfer_dst',
+                              columns=['id', 'name'], batch_size=2, queue_size=1)
+        assert db.select_scalar(dst, 'SELECT count(*) FROM test_transfer_dst') == 0
+
+    @pytest.mark.parametrize('direction', ['source_pg', 'source_sl'])
+    def test_values_are_not_converted(self, request, direction):
+        """Strings copy_from would read as NULL arrive unchanged."""
+        src, dst = request.getfixturevalue(direction)
+        db.execute(src, 'DELETE FROM test_transfer_src')
+        db.execute(src, "INSERT INTO test_transfer_src (id, name) VALUES (1, ''), (2, 'NaN'), "
+                        "(3, 'null'), (4, 'ok')")
+        db.execute(dst, 'CREATE TABLE test_transfer_dst (id INTEGER PRIMARY KEY, name TEXT NOT NULL)')
+
+        db.transfer_table(src, 'test_transfer_src', dst, 'test_transfer_dst',
+                          create=False, columns=['id', 'name'])
+        assert db.select_column(dst, 'SELECT name FROM test_transfer_dst ORDER BY id') == [
+            '', 'NaN', 'null', 'ok']
+
+    def test_validation(self, source_pg):
+        src, dst = source_pg
+        with pytest.raises(db.ValidationError):
+            db.transfer_table(src, 'test_transfer_src', src, 'test_transfer_dst')
+        with pytest.raises(db.ValidationError):
+            db.transfer_table(src, 'test_transfer_src', dst, columns=['missing'])
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
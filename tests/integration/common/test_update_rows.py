@@ -0,0 +1,70 @@
+"""
+Database-agnostic tests for batched update_rows.
+
+These tests run against both PostgreSQL and SQLite to verify
+consistent UPDATE ... FROM (VALUES ...) behavior across backends.
+"""
+import database as db
+import pytest
+
+
+class TestUpdateRows:
+    """Updating many rows by key in set-based statements."""
+
+    def test_updates_matching_rows(self, db_conn):
+        """Rows are matched on the keyfields; unknown keys are ignored."""
+        rows = [{'name': 'Alice', 'value': 11}, {'name': 'Bob', 'value': 21},
+                {'name': 'Nobody', 'value': 99}]
+        count = db.update_rows(db_conn, 'test_table', ['name'], rows, ['value'])
+
+        assert count == 2
+        assert db.select_column(db_conn, 'SELECT value FROM test_table ORDER BY name') == [11, 21, 30]
+
+    def test_updates_across_batches(self, db_conn):
+        """Inputs larger than batch_size run as several statements."""
+        rows = [{'name': name, 'value': i} for i, name in enumerate(['Alice', 'Bob', 'Charlie'])]
+        count = db.update_rows(db_conn, 'test_table', ['name'], rows, batch_size=2)
+
+        assert count == 3
+        assert db.select_column(db_conn, 'SELECT value FROM test_table ORDER BY name') == [0, 1, 2]
+
+    def test_datafields_default_to_non_key_columns(self, db_conn):
+        """Without datafields every non-key column of the rows is set."""
+        rows = [{'name': 'Alice', 'id': 7, 'value': 12}]
+        assert db.update_rows(db_conn, 'test_table', ['name'], rows) == 1
+
+        result = db.select_row(db_conn, 'SELECT id, value FROM test_table WHERE name = %s', 'Alice')
+        assert (result.id, result.value) == (7, 12)
+
+    def test_case_insensitive_fields(self, db_conn):
+        """Key and data field names are matched to the schema's casing."""
+        rows = [{'NAME': 'Charlie', 'Value': 33}]
+        assert db.update_rows(db_conn, 'test_table', ['Name'], rows, ['VALUE']) == 1
+        assert db.select_scalar(db_conn, 'SELECT value FROM test_table WHERE name = %s', 'Charlie') == 33
+
+    def test_rolls_back_with_transaction(self, db_conn):
+        """Inside a transaction the update is not committed on its own."""
+        with pytest.raises(RuntimeError), db.transaction(db_conn):
+            db.update_rows(db_conn, 'test_table', ['name'], [{'name': 'Bob', 'value': 0}])
+            raise RuntimeError('abort')
+        assert db.select_scalar(db_conn, 'SELECT value FROM test_table WHERE name = %s', 'Bob') == 20
+
+    def test_empty_rows(self, db_conn):
+        """No rows is a no-op."""
+        assert db.update_rows(db_conn, 'test_table', ['name'], []) == 0
+
+    @pytest.mark.parametrize(('keyfields', 'rows', 'datafields'), [
+        ([], [{'name': 'Alice', 'value': 1}], ['value']),
+        (['name'], [{'name': 'Alice', 'value': 1}], ['name', 'value']),
+        (['name'], [{'name': 'Alice'}], None),
+        (['name'], [{'name': 'Alice', 'value': 1}, {'name': 'Bob'}], ['value']),
+    ], ids=['no-keys', 'key-in-data', 'no-data', 'missing-value'])
+    def test_validation(self, db_conn, keyfields, rows, datafields):
+        """Invalid key/data field combinations raise before writing."""
+        with pytest.raises(db.ValidationError):
+            db.update_rows(db_conn, 'test_table', keyfields, rows, datafields)
+        assert db.select_scalar(db_conn, 'SELECT value FROM test_table WHERE name = %s', 'Alice') == 10
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
@@ -122,6 +122,125 @@ class TestUpsertMixedOperations:
         assert row(result, 2)['value'] == 600
 
 
+class TestUpsertOnlyIfChanged:
+    """Tests for skipping no-op updates with only_if_changed."""
+
+    def test_unchanged_rows_are_not_counted(self, db_conn):
+        """Only inserted and actually changed rows are counted."""
+        rows = [{'name': 'Alice', 'value': 10}, {'name': 'Bob', 'value': 25},
+                {'name': 'Dave', 'value': 40}]
+        count = db.upsert_rows(db_conn, 'test_table', rows, update_cols_always=['value'],
+                               only_if_changed=True)
+        assert count == 2
+
+        result = db.select(db_conn, 'SELECT name, value FROM test_table ORDER BY name')
+        assert [row(result, i)['value'] for i in range(4)] == [10, 25, 30, 40]
+
+        again = db.upsert_rows(db_conn, 'test_table', rows, update_cols_always=['value'],
+                               only_if_changed=True)
+        assert again == 0
+
+    def test_nulls_compare_as_values(self, db_conn):
+        """NULL to value and value to NULL are changes; NULL to NULL is not."""
+        db.execute(db_conn, 'DROP TABLE IF EXISTS test_changed')
+        db.execute(db_conn, 'CREATE TABLE test_changed (name VARCHAR(50) PRIMARY KEY, value INTEGER, note VARCHAR(50))')
+        try:
+            db.insert_rows(db_conn, 'test_changed', [{'name': 'a', 'value': None, 'note': None},
+                                                     {'name': 'b', 'value': 1, 'note': None},
+                                                     {'name': 'c', 'value': None, 'note': None}])
+            rows = [{'name': 'a', 'value': 1, 'note': 'x'}, {'name': 'b', 'value': None, 'note': 'y'},
+                    {'name': 'c', 'value': None, 'note': 'z'}]
+            count = db.upsert_rows(db_conn, 'test_changed', rows, update_cols_always=['value'],
+                                   update_cols_ifnull=['note'], only_if_changed=True)
+            assert count == 3
+
+            rows = [{'name': 'a', 'value': 1, 'note': 'other'}, {'name': 'c', 'value': None, 'note': None}]
+            count = db.upsert_rows(db_conn, 'test_changed', rows, update_cols_always=['value'],
+                                   update_cols_ifnull=['note'], only_if_changed=True)
+            assert count == 0
+        finally:
+            db.execute(db_conn, 'DROP TABLE IF EXISTS test_changed')
+
+
+class TestUpsertReturning:
+    """Tests for upsert_rows(..., returning=...)."""
+
+    def test_result_breaks_down_rows(self, db_conn):
+        """Inserted, updated and unchanged rows are counted separately."""
+        rows = [{'name': 'Alice', 'value': 10}, {'name': 'Bob', 'value': 25},
+                {'name': 'Dave', 'value': 40}]
+        result = db.upsert_rows(db_conn, 'test_table', rows, update_cols_always=['value'],
+                                only_if_changed=True, returning=['name', 'value'])
+
+        assert isinstance(result, db.UpsertResult)
+        assert (result.inserted, result.updated, result.unchanged) == (1, 1, 1)
+        assert result.rowcount == 2
+        assert sorted((r['name'], r['value']) for r in result.rows) == [('Bob', 25), ('Dave', 40)]
+
+    def test_returning_across_batches(self, db_conn):
+        """Rows are collected from every batch."""
+        rows = [{'name': name, 'value': i} for i, name in
+                enumerate(['Alice', 'Bob', 'Eve', 'Frank', 'Grace'])]
+        result = db.upsert_rows(db_conn, 'test_table', rows, update_cols_always=['value'],
+                                returning=['name'], batch_size=2)
+
+        assert (result.inserted, result.updated, result.unchanged) == (3, 2, 0)
+        assert sorted(r['name'] for r in result.rows) == ['Alice', 'Bob', 'Eve', 'Frank', 'Grace']
+
+    def test_do_nothing_counts_conflicts_as_unchanged(self, db_conn):
+        """Without update columns, conflicting rows are unchanged."""
+        rows = [{'name': 'Alice', 'value': 99}, {'name': 'Zed', 'value': 1}]
+        result = db.upsert_rows(db_conn, 'test_table', rows, returning=[])
+
+        assert (result.inserted, result.updated, result.unchanged) == (1, 0, 1)
+        assert db.select_scalar(db_conn, 'SELECT value FROM test_table WHERE name = %s', 'Alice') == 10
+
+    def test_empty_rows_return_empty_result(self, db_conn):
+        """No rows give an empty result rather than 0."""
+        assert db.upsert_rows(db_conn, 'test_table', [], returning=['name']) == db.UpsertResult()
+
+
+class TestUpsertDedupe:
+    """Tests for collapsing duplicate conflict keys with dedupe."""
+
+    rows = [{'name': 'Dup', 'value': 1}, {'name': 'Alice', 'value': 2}, {'name': 'Dup', 'value': 3}]
+
+    @pytest.mark.parametrize(('keep', 'expected'), [('last', 3), ('first', 1)])
+    def test_dedupe_keeps_one_row_per_key(self, db_conn, keep, expected):
+        """Only the kept row for a duplicated key is written."""
+        result = db.upsert_rows(db_conn, 'test_table', self.rows, update_cols_always=['value'],
+                                dedupe=keep, returning=['name'])
+
+        assert (result.inserted, result.updated, result.unchanged) == (1, 1, 0)
+        assert db.select_scalar(db_conn, 'SELECT value FROM test_table WHERE name = %s', 'Dup') == expected
+
+    def test_dedupe_error_rejects_duplicates(self, db_conn):
+        """dedupe='error' raises before anything is written."""
+        with pytest.raises(db.ValidationError, match='Dup'):
+            db.upsert_rows(db_conn, 'test_table', self.rows, update_cols_always=['value'],
+                           dedupe='error')
+        assert db.select_scalar(db_conn, 'SELECT value FROM test_table WHERE name = %s', 'Alice') == 10
+
+    def test_dedupe_keeps_rows_with_null_keys(self, db_conn):
+        """NULL keys never conflict, so none of those rows are collapsed."""
+        db.execute(db_conn, 'DROP TABLE IF EXISTS test_dedupe_nulls')
+        db.execute(db_conn, 'CREATE TABLE test_dedupe_nulls (id INTEGER PRIMARY KEY, email TEXT UNIQUE)')
+        rows = [{'id': 1, 'email': 'a@x'}, {'id': 2, 'email': None}, {'id': 3, 'email': None},
+                {'id': 4, 'email': 'a@x'}]
+        try:
+            db.upsert_rows(db_conn, 'test_dedupe_nulls', rows, conflict_columns=['email'],
+                           update_cols_always=['id'], dedupe='first')
+            ids = db.select_column(db_conn, 'SELECT id FROM test_dedupe_nulls ORDER BY id')
+        finally:
+            db.execute(db_conn, 'DROP TABLE test_dedupe_nulls')
+        assert ids == [1, 2, 3]
+
+    def test_dedupe_rejects_unknown_mode(self, db_conn):
+        """Only first, last and error are accepted."""
+        with pytest.raises(db.ValidationError):
+            db.upsert_rows(db_conn, 'test_table', self.rows, dedupe='newest')
+
+
 class TestUpsertInvalidColumns:
     """Tests for handling invalid columns."""
 
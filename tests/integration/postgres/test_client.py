@@ -1,13 +1,14 @@
 import datetime
 
 import database as db
+import pytest
 
 
 def test_select(psql_docker, pg_conn):
     """Verify basic SELECT query returns proper results and structure.
 
     Tests that db.select correctly retrieves data and returns it as a list
-    of dictionaries with expected values.
+    of Row mappings with expected values.
     """
     query = 'select name, value from test_table order by value'
     result = db.select(pg_conn, query)
@@ -22,9 +23,9 @@ def test_select(psql_docker, pg_conn):
     ]
     assert result == expected_data, 'The select query did not return the expected results.'
 
-    assert isinstance(result, list), 'Result should be a list of dictionaries'
+    assert isinstance(result, list), 'Result should be a list of rows'
     assert len(result) == 6, 'Should return 6 rows'
-    assert all(isinstance(row, dict) for row in result), 'Each row should be a dictionary'
+    assert all(isinstance(row, db.Row) for row in result), 'Each row should be a Row'
 
 
 def test_select_numeric(psql_docker, pg_conn):
@@ -156,6 +157,24 @@ def test_select_column(psql_docker, pg_conn):
     assert names == expected_names
 
 
+def test_select_scalar_numeric_cast(psql_docker, pg_conn):
+    """Verify the tuple fast path keeps numeric-to-float casting.
+
+    select_scalar, select_row and select_column read tuple rows directly,
+    so they must apply the same casts as dict rows.
+    """
+    value = db.select_scalar(pg_conn, 'select 1.5::numeric')
+    assert value == 1.5 and isinstance(value, float)
+
+    row = db.select_row(pg_conn, 'select 2.5::numeric as amount, 3 as qty')
+    assert isinstance(row.amount, float) and row.qty == 3
+
+    assert db.select_column(pg_conn, 'select x::numeric from generate_series(1, 3) x') == [1.0, 2.0, 3.0]
+
+    with pytest.raises(db.ValidationError, match='got 3'):
+        db.select_scalar(pg_conn, 'select x from generate_series(1, 3) x')
+
+
 def test_insert_rows_bulk(psql_docker, pg_conn):
     """Verify insert_rows correctly handles bulk insertion of many records.
 
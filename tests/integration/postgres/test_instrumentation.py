@@ -0,0 +1,40 @@
+"""
+QueryStats row counts on PostgreSQL, where psycopg reports the result
+size of a SELECT as its rowcount.
+"""
+import database as db
+import pytest
+
+
+@pytest.fixture
+def stats():
+    hook = db.QueryStats()
+    db.add_query_hook(hook)
+    yield hook
+    db.remove_query_hook(hook)
+
+
+@pytest.mark.postgres
+@pytest.mark.integration
+def test_query_stats_counts_selected_rows_once(psql_docker, pg_conn, stats):
+    """An N-row select adds N rows, not rowcount plus rows fetched"""
+    db.select(pg_conn, 'SELECT name, value FROM test_table')
+
+    report = stats.report()
+    assert report[0]['statement'] == 'select name, value from test_table'
+    assert report[0]['rows'] == db.select_scalar(pg_conn, 'SELECT count(*) FROM test_table')
+
+
+@pytest.mark.postgres
+@pytest.mark.integration
+def test_query_stats_counts_written_rows(psql_docker, pg_conn, stats):
+    """Statements without a result set add their rowcount"""
+    db.execute(pg_conn, 'UPDATE test_table SET value = value + 1 WHERE value < 40')
+
+    report = stats.report()
+    assert report[0]['statement'].startswith('update test_table')
+    assert report[0]['rows'] == 3
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
@@ -102,5 +102,35 @@ def test_numpy_pandas_types_iterdict_loader(psql_docker, pg_conn):
         assert row['null_col'] is None
 
 
+
+def test_pandas_loader_dtypes_follow_columns(psql_docker, pg_conn):
+    """Integer, numeric, date and boolean columns keep typed dtypes with NULLs"""
+    pg_conn.options.data_loader = pandas_numpy_data_loader
+
+    with db.transaction(pg_conn) as tx:
+        tx.execute("""
+        CREATE TEMPORARY TABLE typed_load (
+            qty INTEGER, price NUMERIC(10, 2), trade_date DATE,
+            created TIMESTAMP, settled BOOLEAN, side TEXT
+        )
+        """)
+        tx.execute("""
+        INSERT INTO typed_load VALUES
+            (1, 1.50, '2024-01-02', '2024-01-02 10:00', true, 'buy'),
+            (NULL, NULL, NULL, NULL, NULL, 'sell'),
+            (3, 2.25, '2024-01-03', '2024-01-03 11:30', false, 'buy')
+        """)
+        result = tx.select('SELECT * FROM typed_load', category_threshold=0.7)
+
+    assert str(result['qty'].dtype) == 'Int64'
+    assert result['price'].dtype == np.float64
+    assert str(result['trade_date'].dtype) == 'datetime64[ns]'
+    assert str(result['created'].dtype) == 'datetime64[ns]'
+    assert str(result['settled'].dtype) == 'boolean'
+    assert str(result['side'].dtype) == 'category'
+    assert result['qty'].tolist() == [1, pd.NA, 3]
+    assert result['trade_date'].iloc[0] == pd.Timestamp('2024-01-02')
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
@@ -0,0 +1,69 @@
+"""
+Pipelined selects on PostgreSQL fetch each batch from a server-side
+cursor, so fetching overlaps with the conversion of the previous batch.
+"""
+import database as db
+import pytest
+from database.strategy import PostgresStrategy
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Record each fetchmany batch and whether the cursor was still open on the server."""
+    calls = []
+    create = PostgresStrategy.create_server_cursor
+
+    class RecordingCursor:
+        def __init__(self, cursor, raw_conn):
+            self._cursor = cursor
+            self._raw_conn = raw_conn
+
+        def __getattr__(self, name):
+            return getattr(self._cursor, name)
+
+        def fetchmany(self, size):
+            rows = self._cursor.fetchmany(size)
+            open_cursors = self._raw_conn.execute('SELECT count(*) FROM pg_cursors').fetchone()[0]
+            calls.append((len(rows), open_cursors))
+            return rows
+
+    def create_recording(self, raw_conn, tuples=False):
+        return RecordingCursor(create(self, raw_conn, tuples), raw_conn)
+
+    monkeypatch.setattr(PostgresStrategy, 'create_server_cursor', create_recording)
+    return calls
+
+
+@pytest.mark.postgres
+@pytest.mark.integration
+def test_batches_come_from_server_cursor(psql_docker, pg_conn, fetches):
+    """Each batch is a FETCH from a cursor that stays open between batches"""
+    sql = 'SELECT i FROM generate_series(1, 7) i ORDER BY i'
+    result = db.select(pg_conn, sql, fetch_batch_size=3)
+
+    assert [row[0] for row in fetches] == [3, 3, 1]
+    assert all(open_cursors == 1 for _, open_cursors in fetches)
+    assert len(result) == 7
+    assert db.select_scalar(pg_conn, 'SELECT count(*) FROM pg_cursors') == 0
+
+
+@pytest.mark.postgres
+@pytest.mark.integration
+def test_server_cursor_inside_transaction(psql_docker, pg_conn, fetches):
+    """A batched select inside a transaction sees its uncommitted writes"""
+    with db.transaction(pg_conn) as tx:
+        tx.execute("INSERT INTO test_table (name, value) VALUES ('Pending', 1)")
+        result = tx.select('SELECT name FROM test_table ORDER BY name', fetch_batch_size=2)
+        assert 'Pending' in [row['name'] for row in result]
+    assert fetches
+
+
+@pytest.mark.postgres
+@pytest.mark.integration
+def test_unbatched_select_uses_client_cursor(psql_docker, pg_conn, fetches):
+    db.select(pg_conn, 'SELECT 1 AS x')
+    assert fetches == []
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
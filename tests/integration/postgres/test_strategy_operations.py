@@ -1,7 +1,9 @@
 import io
 
+import config
 import database as db
-from database.strategy import PostgresStrategy
+import pytest
+from database.strategy import PostgresStrategy, get_db_strategy
 
 
 def test_vacuum_table(psql_docker, pg_conn):
@@ -152,5 +154,152 @@ def test_copy_from_empty_file(psql_docker, pg_conn):
     assert count == 0
 
 
+def test_copy_from_generator(psql_docker, pg_conn):
+    """Test COPY streams a generator of tuples with write_row."""
+    db.execute(pg_conn, """
+        CREATE TEMPORARY TABLE test_copy_gen (
+            name TEXT,
+            value INTEGER
+        )
+    """)
+
+    rows = ((f'row_{i}', i) for i in range(1000))
+    rowcount = db.copy_from(pg_conn, 'test_copy_gen', rows, ['name', 'value'])
+
+    assert rowcount == 1000
+    assert db.select_scalar(pg_conn, 'SELECT SUM(value) FROM test_copy_gen') == sum(range(1000))
+
+
+def test_copy_from_dicts_with_nulls(psql_docker, pg_conn):
+    """Test COPY infers columns from dict rows and writes None as NULL."""
+    db.execute(pg_conn, """
+        CREATE TEMPORARY TABLE test_copy_dict (
+            name TEXT,
+            value INTEGER
+        )
+    """)
+
+    rows = [{'name': 'David', 'value': 40}, {'name': 'Eva', 'value': None}]
+    rowcount = db.copy_from(pg_conn, 'test_copy_dict', rows)
+
+    assert rowcount == 2
+    assert db.select_scalar(pg_conn, 'SELECT COUNT(*) FROM test_copy_dict WHERE value IS NULL') == 1
+
+
+def test_copy_from_dataframe(psql_docker, pg_conn):
+    """Test COPY from a DataFrame converts NumPy scalars and NaN."""
+    import numpy as np
+    import pandas as pd
+
+    db.execute(pg_conn, """
+        CREATE TEMPORARY TABLE test_copy_df (
+            name TEXT,
+            value DOUBLE PRECISION
+        )
+    """)
+
+    df = pd.DataFrame({'name': ['David', 'Eva'], 'value': [1.5, np.nan]})
+    rowcount = db.copy_from(pg_conn, 'test_copy_df', df)
+
+    assert rowcount == 2
+    row = db.select_row(pg_conn, "SELECT value FROM test_copy_df WHERE name = 'Eva'")
+    assert row.value is None
+
+
+def test_copy_from_arrow_reader(psql_docker, pg_conn):
+    """Test COPY from an Arrow RecordBatchReader."""
+    import pyarrow as pa
+
+    db.execute(pg_conn, """
+        CREATE TEMPORARY TABLE test_copy_arrow (
+            name TEXT,
+            value INTEGER
+        )
+    """)
+
+    table = pa.table({'name': ['a', 'b', 'c'], 'value': [1, 2, 3]})
+    reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches(max_chunksize=2))
+    rowcount = db.copy_from(pg_conn, 'test_copy_arrow', reader)
+
+    assert rowcount == 3
+
+
+def test_update_rows_casts_values(psql_docker, pg_conn):
+    """VALUES rows are cast to the column types, so NULLs and dates bind"""
+    db.execute(pg_conn, 'DROP TABLE IF EXISTS test_update_types')
+    db.execute(pg_conn, """
+        CREATE TABLE test_update_types (id int PRIMARY KEY, amount numeric(10,2), day date)
+    """)
+    db.insert_rows(pg_conn, 'test_update_types', [{'id': 1, 'amount': 1, 'day': '2024-01-01'},
+                                                  {'id': 2, 'amount': 2, 'day': '2024-01-02'}])
+
+    rows = [{'id': 1, 'amount': None, 'day': '2025-06-30'}, {'id': 2, 'amount': 2.5, 'day': None}]
+    assert db.update_rows(pg_conn, 'test_update_types', ['id'], rows) == 2
+
+    first = db.select_row(pg_conn, 'SELECT amount, day::text AS day FROM test_update_types WHERE id = 1')
+    second = db.select_row(pg_conn, 'SELECT amount, day FROM test_update_types WHERE id = 2')
+    assert (first.amount, first.day) == (None, '2025-06-30')
+    assert (second.amount, second.day) == (2.5, None)
+    db.execute(pg_conn, 'DROP TABLE test_update_types')
+
+
+def test_update_rows_copies_large_inputs(psql_docker, pg_conn, monkeypatch):
+    """From UPDATE_COPY_THRESHOLD rows on, the rows go through a COPY'd temp table"""
+    from database.strategy import postgres
+    monkeypatch.setattr(postgres, 'UPDATE_COPY_THRESHOLD', 2)
+
+    rows = [{'name': 'Alice', 'value': 101}, {'name': 'Bob', 'value': 202}]
+    assert db.update_rows(pg_conn, 'test_table', ['name'], rows, ['value']) == 2
+    assert db.select_column(pg_conn, "SELECT value FROM test_table WHERE name IN ('Alice', 'Bob') ORDER BY name") == [101, 202]
+    assert not db.select_scalar(pg_conn, "SELECT count(*) FROM pg_class WHERE relname LIKE '_bulk_%%'")
+
+
+@pytest.mark.parametrize('keyfields', [['name'], ['name', 'value']])
+def test_delete_rows_copies_large_inputs(psql_docker, pg_conn, monkeypatch, keyfields):
+    """From DELETE_COPY_THRESHOLD keys on, the keys go through a COPY'd temp table"""
+    from database.strategy import postgres
+    monkeypatch.setattr(postgres, 'DELETE_COPY_THRESHOLD', 2)
+
+    keys = [{'name': f'Delete{i}', 'value': i} for i in range(3)]
+    db.insert_rows(pg_conn, 'test_table', keys)
+    assert db.delete_rows(pg_conn, 'test_table', keyfields, keys) == 3
+    assert not db.select_scalar(pg_conn, "SELECT count(*) FROM test_table WHERE name LIKE 'Delete%%'")
+
+
+def test_copy_to_streams_from_open_cursor(psql_docker, pg_conn):
+    """copy_to fetches from a non-holdable cursor that stays open between batches"""
+    strategy = get_db_strategy(pg_conn)
+    driver_connection = pg_conn.dbapi_connection.driver_connection
+    batches = strategy.copy_to(pg_conn, 'test_table', ['name', 'value'], 2)
+
+    first = next(batches)
+    cursors = driver_connection.execute('SELECT is_holdable FROM pg_cursors').fetchall()
+    rest = [row for batch in batches for row in batch]
+
+    assert len(first) == 2
+    assert cursors == [(False,)]
+    assert len(first) + len(rest) == db.select_scalar(pg_conn, 'SELECT count(*) FROM test_table')
+    assert driver_connection.execute('SELECT count(*) FROM pg_cursors').fetchone()[0] == 0
+
+
+def test_transfer_table_keeps_postgres_types(psql_docker, pg_conn):
+    """A PostgreSQL to PostgreSQL transfer recreates the declared types."""
+    db.execute(pg_conn, 'DROP TABLE IF EXISTS test_transfer_src, test_transfer_dst')
+    db.execute(pg_conn, 'CREATE TABLE test_transfer_src (id INTEGER PRIMARY KEY, '
+                        'at TIMESTAMPTZ, price NUMERIC(10, 2))')
+    db.execute(pg_conn, "INSERT INTO test_transfer_src VALUES (1, '2024-01-02 03:04:05+02', 1.25)")
+    dst = db.connect('postgresql', config=config)
+    try:
+        db.transfer_table(pg_conn, 'test_transfer_src', dst, 'test_transfer_dst')
+        types = get_db_strategy(dst).get_column_types(dst, 'test_transfer_dst')
+        assert types == {'id': 'integer', 'at': 'timestamp with time zone',
+                         'price': 'numeric(10,2)'}
+        assert db.select_scalar(dst, 'SELECT count(*) FROM test_transfer_dst '
+                                     "WHERE at = '2024-01-02 01:04:05+00'") == 1
+    finally:
+        dst.close()
+        db.execute(pg_conn, 'DROP TABLE IF EXISTS test_transfer_src, test_transfer_dst')
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
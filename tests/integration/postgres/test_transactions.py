@@ -808,5 +808,20 @@ def test_transaction_with_multiple_statement_combinations(psql_docker, pg_conn):
     assert db.select_row_or_none(pg_conn, "SELECT * FROM tx_matrix_test WHERE name = 'tx-mixed-1'") is None
 
 
+def test_bulk_load_single_transaction(psql_docker, pg_conn):
+    """bulk_load on PostgreSQL commits all writes together or none."""
+    with pg_conn.bulk_load() as cn:
+        cn.insert_rows('test_table', [{'name': 'Hannah', 'value': 1}])
+        cn.execute('update test_table set value = %s where name = %s', 2, 'Hannah')
+
+    assert db.select_scalar(pg_conn, 'select value from test_table where name = %s', 'Hannah') == 2
+
+    with pytest.raises(RuntimeError), pg_conn.bulk_load() as cn:
+        cn.insert_rows('test_table', [{'name': 'Ivan', 'value': 3}])
+        raise RuntimeError('abort')
+
+    assert db.select_scalar_or_none(pg_conn, 'select value from test_table where name = %s', 'Ivan') is None
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
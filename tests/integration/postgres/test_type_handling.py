@@ -260,5 +260,24 @@ def test_postgres_cursor_executemany(psql_docker, pg_conn):
         cursor.close()
 
 
+def test_postgres_numeric_loaded_as_float(psql_docker, pg_conn):
+    """Numeric is decoded to float by psycopg loaders, text and binary"""
+    raw = pg_conn.dbapi_connection.driver_connection
+
+    with raw.cursor() as cur:
+        cur.execute('select 1.25::numeric, null::numeric')
+        assert cur.fetchone() == (1.25, None)
+
+    with raw.cursor(binary=True) as cur:
+        cur.execute('select 2.5::numeric')
+        value = cur.fetchone()[0]
+        assert value == 2.5 and isinstance(value, float)
+
+    cursor = get_dict_cursor(pg_conn)
+    cursor.execute('select 3.75::numeric as amount')
+    assert cursor.dbapi_cursor.row_factory.__name__ == 'DictRowFactory'
+    assert cursor.fetchone() == {'amount': 3.75}
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
@@ -637,6 +637,25 @@ def test_upsert_with_constraint_name(psql_docker, pg_conn):
     assert count == 2, 'New row should be inserted'
 
 
+def test_upsert_dedupe_with_constraint_name(psql_docker, pg_conn):
+    """dedupe collapses rows on the named constraint's columns, not the primary key"""
+    db.execute(pg_conn, """
+    CREATE TEMPORARY TABLE test_dedupe_constraint (
+        id SERIAL PRIMARY KEY,
+        code VARCHAR(10),
+        value INTEGER,
+        CONSTRAINT test_dedupe_code_key UNIQUE (code)
+    )
+    """)
+    rows = [{'code': 'a', 'value': 1}, {'code': 'b', 'value': 2}, {'code': 'a', 'value': 3}]
+
+    db.upsert_rows(pg_conn, 'test_dedupe_constraint', rows, constraint_name='test_dedupe_code_key',
+                   update_cols_always=['value'], dedupe='last')
+
+    result = db.select(pg_conn, 'SELECT code, value FROM test_dedupe_constraint ORDER BY code')
+    assert [(r['code'], r['value']) for r in result] == [('a', 3), ('b', 2)]
+
+
 def test_upsert_with_standard_constraint(psql_docker, pg_conn):
     """Test upsert behavior with regular constraint
 
@@ -1072,5 +1091,50 @@ def test_upsert_with_smartcase_update_columns(psql_docker, pg_conn):
     assert result['value'] == 200, 'Row should be updated even when update_cols_always is given in SmartCase'
 
 
+
+def test_upsert_only_if_changed_keeps_row_versions(psql_docker, pg_conn):
+    """Unchanged rows keep their tuple version (no rewrite, WAL or triggers)"""
+    def versions():
+        return {name: db.select_scalar(pg_conn, 'SELECT xmin::text FROM test_table WHERE name = %s', name)
+                for name in ('Alice', 'Bob')}
+
+    before = versions()
+
+    rows = [{'name': 'Alice', 'value': 10}, {'name': 'Bob', 'value': 99}]
+    count = db.upsert_rows(pg_conn, 'test_table', rows, update_cols_always=['value'],
+                           only_if_changed=True)
+    after = versions()
+
+    assert count == 1
+    assert after['Alice'] == before['Alice']
+    assert after['Bob'] != before['Bob']
+
+
+def test_upsert_only_if_changed_with_json_column(psql_docker, pg_conn):
+    """Columns without an equality operator (json) are compared as text"""
+    db.execute(pg_conn, 'CREATE TEMPORARY TABLE test_json_guard '
+                        '(id INTEGER PRIMARY KEY, doc JSON, note TEXT)')
+    db.execute(pg_conn, """INSERT INTO test_json_guard VALUES (1, '{"a": 1}', 'x'), """
+                        """(2, '{"b": 2}', 'y')""")
+
+    rows = [{'id': 1, 'doc': '{"a": 1}', 'note': 'x'}, {'id': 2, 'doc': '{"b": 3}', 'note': 'y'}]
+    count = db.upsert_rows(pg_conn, 'test_json_guard', rows,
+                           update_cols_always=['doc', 'note'], only_if_changed=True)
+
+    assert count == 1
+    assert db.select_scalar(pg_conn, 'SELECT doc::text FROM test_json_guard WHERE id = 2') == '{"b": 3}'
+
+
+def test_upsert_returning_generated_keys(psql_docker, pg_conn):
+    """Generated keys come back with the upsert, no follow-up select"""
+    rows = [{'name': 'Alice', 'value': 11}, {'name': 'Zoe', 'value': 5}]
+    result = db.upsert_rows(pg_conn, 'test_table', rows, update_cols_always=['value'],
+                            returning=['id', 'name'])
+
+    ids = {r['name']: r['id'] for r in result.rows}
+    assert (result.inserted, result.updated) == (1, 1)
+    assert ids['Zoe'] == db.select_scalar(pg_conn, 'SELECT id FROM test_table WHERE name = %s', 'Zoe')
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
@@ -2,6 +2,7 @@ import datetime
 
 import database as db
 import pandas as pd
+import pytest
 
 
 def test_sqlite_select(sl_conn):
@@ -139,5 +140,26 @@ def test_sqlite_adapters(sl_conn):
     assert True  # Ensure the test passes even if we couldn't validate data types
 
 
+def test_sqlite_single_value_helpers_skip_data_loader(sl_conn):
+    """select_row/column/scalar read tuples directly and never swap loaders"""
+    def failing_loader(data, columns, **kwargs):
+        raise AssertionError('data loader should not be called')
+
+    original = sl_conn.options.data_loader
+    sl_conn.options.data_loader = failing_loader
+    try:
+        assert db.select_scalar(sl_conn, 'SELECT value FROM test_table WHERE name = ?', 'Bob') == 20
+        assert db.select_column(sl_conn, 'SELECT name FROM test_table ORDER BY value') == ['Alice', 'Bob', 'Charlie']
+        row = db.select_row(sl_conn, 'SELECT name, value FROM test_table WHERE name = ?', 'Alice')
+        assert row.name == 'Alice' and row['value'] == 10
+        assert db.select_row_or_none(sl_conn, 'SELECT name FROM test_table WHERE name = ?', 'Nobody') is None
+        assert sl_conn.options.data_loader is failing_loader
+    finally:
+        sl_conn.options.data_loader = original
+
+    with pytest.raises(db.ValidationError, match='got 3'):
+        db.select_scalar(sl_conn, 'SELECT value FROM test_table')
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
@@ -0,0 +1,112 @@
+"""
+SQLite bulk_load: one transaction, relaxed PRAGMAs, deferred indexes,
+and full restoration on exit.
+"""
+import database as db
+import pytest
+
+
+@pytest.fixture
+def bulk_conn(tmp_path):
+    """File-backed SQLite connection with an indexed target table."""
+    conn = db.connect({'drivername': 'sqlite', 'database': str(tmp_path / 'bulk.db')})
+    db.execute(conn, """
+    CREATE TABLE events (
+        id INTEGER PRIMARY KEY,
+        kind TEXT NOT NULL,
+        code TEXT UNIQUE,
+        value INTEGER
+    )
+    """)
+    db.execute(conn, 'CREATE INDEX idx_events_kind ON events (kind)')
+    yield conn
+    conn.close()
+
+
+def _index_names(conn):
+    return set(db.select_column(
+        conn, "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"))
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_bulk_load_relaxes_and_restores_pragmas(bulk_conn):
+    """synchronous, cache_size and journal_mode are switched and restored."""
+    before = {p: db.select_scalar(bulk_conn, f'PRAGMA {p}')
+              for p in ('synchronous', 'cache_size', 'journal_mode')}
+
+    with bulk_conn.bulk_load(cache_size=-4096, journal_mode='memory'):
+        assert db.select_scalar(bulk_conn, 'PRAGMA synchronous') == 0
+        assert db.select_scalar(bulk_conn, 'PRAGMA cache_size') == -4096
+        assert str(db.select_scalar(bulk_conn, 'PRAGMA journal_mode')).lower() == 'memory'
+
+    after = {p: db.select_scalar(bulk_conn, f'PRAGMA {p}')
+             for p in ('synchronous', 'cache_size', 'journal_mode')}
+    assert after == before
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_bulk_load_commits_once(bulk_conn):
+    """Writes inside bulk_load join one transaction committed on exit."""
+    rows = [{'kind': 'a', 'code': f'c{i}', 'value': i} for i in range(2000)]
+
+    with bulk_conn.bulk_load() as cn:
+        cn.insert_rows('events', rows[:1000])
+        cn.copy_from('events', rows[1000:])
+        assert bulk_conn.dbapi_connection.in_transaction
+
+    assert not bulk_conn.in_transaction
+    assert db.select_scalar(bulk_conn, 'SELECT COUNT(*) FROM events') == 2000
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_bulk_load_rolls_back_on_error(bulk_conn):
+    """An exception inside bulk_load discards every row of the load."""
+    with pytest.raises(RuntimeError), bulk_conn.bulk_load():
+        bulk_conn.insert_rows('events', [{'kind': 'a', 'code': 'x', 'value': 1}])
+        raise RuntimeError('parser failed')
+
+    assert db.select_scalar(bulk_conn, 'SELECT COUNT(*) FROM events') == 0
+    assert db.select_scalar(bulk_conn, 'PRAGMA synchronous') == 1
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_bulk_load_defers_secondary_indexes(bulk_conn):
+    """Non-unique indexes are dropped during the load and rebuilt after."""
+    with bulk_conn.bulk_load(defer_indexes=['events']):
+        names = _index_names(bulk_conn)
+        assert 'idx_events_kind' not in names
+        bulk_conn.insert_rows('events', [{'kind': 'a', 'code': 'x', 'value': 1}])
+
+    assert 'idx_events_kind' in _index_names(bulk_conn)
+    plan = db.select(bulk_conn, "EXPLAIN QUERY PLAN SELECT * FROM events WHERE kind = 'a'")
+    assert 'idx_events_kind' in str(plan)
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_bulk_load_restores_indexes_after_rollback(bulk_conn):
+    """Index drops are part of the transaction and undone on error."""
+    with pytest.raises(RuntimeError), bulk_conn.bulk_load(defer_indexes=['events']):
+        raise RuntimeError('abort')
+
+    assert 'idx_events_kind' in _index_names(bulk_conn)
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_bulk_load_rejects_invalid_journal_mode(bulk_conn):
+    """journal_mode is validated before being interpolated into a PRAGMA."""
+    with pytest.raises(db.ValidationError), bulk_conn.bulk_load(journal_mode='wal; drop table events'):
+        pass
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_bulk_load_cannot_nest_in_transaction(bulk_conn):
+    """bulk_load owns its transaction and refuses to nest."""
+    with db.transaction(bulk_conn), pytest.raises(db.ValidationError), bulk_conn.bulk_load():
+        pass
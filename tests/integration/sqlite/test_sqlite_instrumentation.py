@@ -0,0 +1,118 @@
+"""
+Query hooks observe statements issued through a ConnectionWrapper with
+execute / fetch / data-loader timings and row counts.
+"""
+import database as db
+import pytest
+from database.instrumentation import QueryHook
+from database.sql import fingerprint
+
+
+class Recorder(QueryHook):
+    def __init__(self):
+        self.before = []
+        self.after = []
+
+    def before_execute(self, event):
+        self.before.append(event.statement)
+
+    def after_execute(self, event):
+        self.after.append(event)
+
+
+@pytest.fixture
+def recorder():
+    hook = Recorder()
+    db.add_query_hook(hook)
+    yield hook
+    db.remove_query_hook(hook)
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_hooks_see_select_timings(sl_conn, recorder):
+    """select reports rows, bytes and the execute/fetch/load split"""
+    db.select(sl_conn, 'SELECT name,  value FROM test_table')
+
+    event = recorder.after[-1]
+    assert recorder.before[-1] == event.statement == 'select name, value from test_table'
+    assert event.fingerprint == fingerprint('select name, value from test_table', 'sqlite')
+    assert event.dialect == 'sqlite'
+    assert event.rows_fetched == 3
+    assert event.bytes_fetched > 0
+    assert event.execute_time > 0 and event.fetch_time > 0 and event.load_time > 0
+    assert event.elapsed >= event.execute_time + event.fetch_time + event.load_time
+    assert event.error is None
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_hooks_see_writes_and_errors(sl_conn, recorder):
+    """execute and insert_rows report rowcounts; failures carry the error"""
+    db.execute(sl_conn, 'UPDATE test_table SET value = value + 1')
+    assert recorder.after[-1].rowcount == 3
+
+    db.insert_rows(sl_conn, 'test_table', [{'name': 'X', 'value': 1}, {'name': 'Y', 'value': 2}])
+    assert recorder.after[-1].rowcount == 2
+
+    with pytest.raises(Exception):
+        db.select_scalar(sl_conn, 'SELECT missing FROM test_table')
+    assert recorder.after[-1].error is not None
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_query_stats_aggregates_per_statement(sl_conn):
+    """QueryStats builds a per-statement report from live traffic"""
+    stats = db.QueryStats()
+    db.add_query_hook(stats)
+    try:
+        for name in ('Alice', 'Bob', 'Charlie'):
+            db.select_row(sl_conn, 'SELECT * FROM test_table WHERE name = ?', name)
+        db.select_column(sl_conn, 'SELECT name FROM test_table')
+    finally:
+        db.remove_query_hook(stats)
+
+    report = stats.report(sort_by='count')
+    assert report[0]['statement'] == 'select * from test_table where name = ?'
+    assert report[0]['count'] == 3
+    assert report[0]['rows'] == 3
+    assert report[0]['p99'] >= report[0]['p50'] > 0
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_query_stats_groups_in_lists_and_literals(sl_conn):
+    """IN lists of any length and inline literals share one statement"""
+    stats = db.QueryStats()
+    db.add_query_hook(stats)
+    try:
+        db.select(sl_conn, 'SELECT * FROM test_table WHERE name IN %s', ('Alice',))
+        db.select(sl_conn, 'SELECT * FROM test_table WHERE name IN %s', ('Alice', 'Bob'))
+        db.select(sl_conn, "select *  from test_table where name in ('Alice', 'Bob', 'Charlie')")
+    finally:
+        db.remove_query_hook(stats)
+
+    report = stats.report()
+    assert len(report) == 1
+    assert report[0]['statement'] == 'select * from test_table where name in(...)'
+    assert report[0]['count'] == 3
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_cursor_exposes_fingerprint(sl_conn):
+    """Each execution updates the cursor's statement fingerprint"""
+    cursor = sl_conn.cursor()
+    assert cursor.fingerprint is None
+
+    cursor.execute('SELECT * FROM test_table WHERE value = 1')
+    first = cursor.fingerprint
+    cursor.execute('SELECT * FROM test_table WHERE value = ?', 2)
+    assert cursor.fingerprint == first
+    cursor.execute('SELECT name FROM test_table')
+    assert cursor.fingerprint != first
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
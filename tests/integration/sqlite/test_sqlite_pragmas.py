@@ -1,6 +1,8 @@
 """
 SQLite connection pragmas: WAL journal mode + explicit busy_timeout.
 File-based connections enable WAL; in-memory connections do not.
+Named profiles and sqlite_pragmas overrides apply once per physical
+connection.
 """
 import database as db
 import pytest
@@ -54,3 +56,67 @@ def test_memory_db_still_sets_busy_timeout():
         assert int(timeout) == 5000
     finally:
         conn.close()
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_read_heavy_profile_enables_mmap(tmp_path):
+    """The read_heavy profile turns on memory-mapped I/O and a larger cache."""
+    db_file = tmp_path / 'pragma_test.db'
+    conn = db.connect({'drivername': 'sqlite', 'database': str(db_file),
+                       'sqlite_profile': 'read_heavy'})
+    try:
+        assert db.select_scalar(conn, 'PRAGMA mmap_size') == 268435456
+        assert db.select_scalar(conn, 'PRAGMA cache_size') == -65536
+        assert db.select_scalar(conn, 'PRAGMA temp_store') == 2
+        assert str(db.select_scalar(conn, 'PRAGMA journal_mode')).lower() == 'wal'
+    finally:
+        conn.close()
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_sqlite_pragmas_override_profile(tmp_path):
+    """Explicit sqlite_pragmas win over the profile and the defaults."""
+    db_file = tmp_path / 'pragma_test.db'
+    conn = db.connect({'drivername': 'sqlite', 'database': str(db_file),
+                       'sqlite_profile': 'bulk_write',
+                       'sqlite_pragmas': {'busy_timeout': 100, 'wal_autocheckpoint': 500}})
+    try:
+        assert db.select_scalar(conn, 'PRAGMA busy_timeout') == 100
+        assert db.select_scalar(conn, 'PRAGMA wal_autocheckpoint') == 500
+        assert db.select_scalar(conn, 'PRAGMA synchronous') == 0
+    finally:
+        conn.close()
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_pragmas_applied_once_per_physical_connection(tmp_path, mocker):
+    """Pooled checkouts reuse the physical connection without re-running PRAGMAs."""
+    from database.strategy import SQLiteStrategy
+
+    spy = mocker.spy(SQLiteStrategy, 'apply_pragmas')
+    options = {'drivername': 'sqlite', 'database': str(tmp_path / 'pool.db'),
+               'use_pool': True, 'pool_max_connections': 1}
+
+    for _ in range(3):
+        conn = db.connect(options)
+        db.select_scalar(conn, 'SELECT 1')
+        conn.close()
+
+    assert spy.call_count == 1
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_page_size_applied_before_wal(tmp_path):
+    """page_size is set before WAL freezes it on a new database."""
+    db_file = tmp_path / 'pragma_test.db'
+    conn = db.connect({'drivername': 'sqlite', 'database': str(db_file),
+                       'sqlite_pragmas': {'page_size': 8192}})
+    try:
+        db.execute(conn, 'CREATE TABLE t (id INTEGER)')
+        assert db.select_scalar(conn, 'PRAGMA page_size') == 8192
+    finally:
+        conn.close()
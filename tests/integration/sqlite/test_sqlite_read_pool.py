@@ -0,0 +1,145 @@
+"""
+SQLite reader pool: select calls use mode=ro connections while writes
+are serialized through one writer at a time.
+"""
+import sys
+import threading
+import time
+
+import database as db
+import pytest
+
+
+@pytest.fixture
+def pooled_conn(tmp_path):
+    """File-backed SQLite connection with a two-connection reader pool."""
+    options = {'drivername': 'sqlite', 'database': str(tmp_path / 'pool.db'),
+               'sqlite_readers': 2, 'sqlite_pragmas': {'busy_timeout': 50}}
+    conn = db.connect(options)
+    db.execute(conn, 'CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)')
+    yield conn, options
+    conn.close()
+    db.connection.dispose_all_engines()
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_select_uses_read_only_pool(pooled_conn):
+    """Selects run on a mode=ro connection and see committed writes."""
+    conn, _ = pooled_conn
+    db.insert_rows(conn, 'items', [{'name': 'a'}, {'name': 'b'}])
+
+    assert db.select_scalar(conn, 'SELECT COUNT(*) FROM items') == 2
+    assert conn.read_engine.pool.checkedin() == 1
+
+    with conn.read_engine.connect() as reader, pytest.raises(Exception, match='readonly'):
+        reader.connection.execute("INSERT INTO items (name) VALUES ('c')")
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_transaction_reads_own_writes(pooled_conn):
+    """Reads inside a transaction stay on the writer connection."""
+    conn, _ = pooled_conn
+    with db.transaction(conn) as tx:
+        tx.execute("INSERT INTO items (name) VALUES ('pending')")
+        assert tx.select_scalar('SELECT COUNT(*) FROM items') == 1
+        assert conn.read_engine.pool.checkedin() == 0
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_failed_transaction_start_releases_writer_lock(pooled_conn, monkeypatch):
+    """A transaction that fails to start does not keep the writer lock."""
+    conn, _ = pooled_conn
+
+    def fail(cn):
+        raise RuntimeError('cannot disable autocommit')
+
+    monkeypatch.setattr(sys.modules['database.transaction'], 'disable_auto_commit', fail)
+    with pytest.raises(RuntimeError), db.transaction(conn):
+        pass
+    assert not conn.in_transaction
+
+    acquired = []
+
+    def other_writer():
+        if conn._writer_lock.acquire(timeout=1):
+            acquired.append(True)
+            conn._writer_lock.release()
+
+    thread = threading.Thread(target=other_writer)
+    thread.start()
+    thread.join()
+    assert acquired == [True]
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_writers_are_serialized(pooled_conn):
+    """A second writer waits for the open transaction instead of failing
+    with 'database is locked' after the short busy_timeout.
+    """
+    conn, options = pooled_conn
+    conn2 = db.connect(options)
+    started = threading.Event()
+    errors = []
+
+    def long_writer():
+        with db.transaction(conn) as tx:
+            tx.execute("INSERT INTO items (name) VALUES ('first')")
+            started.set()
+            time.sleep(0.3)
+
+    def short_writer():
+        started.wait(timeout=1.0)
+        try:
+            db.insert_rows(conn2, 'items', [{'name': 'second'}])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=long_writer), threading.Thread(target=short_writer)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5.0)
+
+    assert errors == []
+    assert db.select_column(conn, 'SELECT name FROM items ORDER BY id') == ['first', 'second']
+    conn2.close()
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_writer_lock_shared_across_paths(pooled_conn, tmp_path, monkeypatch):
+    """A relative path and a symlink to the same file share the writer lock"""
+    conn, options = pooled_conn
+    (tmp_path / 'link.db').symlink_to(tmp_path / 'pool.db')
+    monkeypatch.chdir(tmp_path)
+    relative = db.connect({**options, 'database': 'pool.db'})
+    linked = db.connect({**options, 'database': str(tmp_path / 'link.db')})
+
+    assert relative._writer_lock is conn._writer_lock
+    assert linked._writer_lock is conn._writer_lock
+    relative.close()
+    linked.close()
+
+
+@pytest.mark.sqlite
+@pytest.mark.integration
+def test_concurrent_readers_during_write(pooled_conn):
+    """Readers keep reading the last committed state while a write is open."""
+    conn, options = pooled_conn
+    db.insert_rows(conn, 'items', [{'name': 'a'}])
+    reader = db.connect(options)
+
+    with db.transaction(conn) as tx:
+        tx.execute("INSERT INTO items (name) VALUES ('b')")
+        assert db.select_scalar(reader, 'SELECT COUNT(*) FROM items') == 1
+
+    assert db.select_scalar(reader, 'SELECT COUNT(*) FROM items') == 2
+    reader.close()
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
@@ -119,13 +119,64 @@ def test_sqlite_autoincrement(sqlite_strategy_conn):
     assert row.id >= 4  # Should be at least 4, might be higher
 
 
-def test_sqlite_copy_from_returns_zero(sqlite_strategy_conn, caplog):
-    """Test SQLite copy_from returns 0 and logs warning since COPY not supported."""
+def test_sqlite_copy_from_csv(sqlite_strategy_conn):
+    """Test SQLite copy_from loads CSV text via executemany."""
     csv_data = io.StringIO('David,40\nEva,50\n')
     rowcount = db.copy_from(sqlite_strategy_conn, 'test_table', csv_data, ['name', 'value'])
 
-    assert rowcount == 0
-    assert 'COPY operation not supported in SQLite' in caplog.text
+    assert rowcount == 2
+    row = db.select_row(sqlite_strategy_conn, "SELECT * FROM test_table WHERE name = 'Eva'")
+    assert row.value == 50
+
+
+def test_sqlite_copy_from_generator(sqlite_strategy_conn):
+    """Test SQLite copy_from streams a generator of tuples in chunks."""
+    rows = ((f'gen_{i}', i) for i in range(12000))
+    rowcount = db.copy_from(sqlite_strategy_conn, 'test_table', rows, ['name', 'value'])
+
+    assert rowcount == 12000
+    count = db.select_scalar(sqlite_strategy_conn, "SELECT COUNT(*) FROM test_table WHERE name LIKE 'gen_%'")
+    assert count == 12000
+
+
+def test_sqlite_copy_from_dicts(sqlite_strategy_conn):
+    """Test SQLite copy_from infers columns from dict rows."""
+    rows = [{'name': 'David', 'value': 40}, {'name': 'Eva', 'value': 50}]
+    rowcount = db.copy_from(sqlite_strategy_conn, 'test_table', rows)
+
+    assert rowcount == 2
+    assert db.select_scalar(sqlite_strategy_conn, 'SELECT COUNT(*) FROM test_table') == 5
+
+
+def test_sqlite_copy_from_dataframe_and_arrow(sqlite_strategy_conn):
+    """Test SQLite copy_from accepts DataFrames and Arrow readers."""
+    import pandas as pd
+    import pyarrow as pa
+
+    df = pd.DataFrame({'name': ['David', 'Eva'], 'value': [40, 50]})
+    assert db.copy_from(sqlite_strategy_conn, 'test_table', df) == 2
+
+    table = pa.table({'name': ['Frank', 'Gina'], 'value': [60, 70]})
+    reader = pa.RecordBatchReader.from_batches(table.schema, table.to_batches())
+    assert db.copy_from(sqlite_strategy_conn, 'test_table', reader) == 2
+
+    names = db.select_column(sqlite_strategy_conn, 'SELECT name FROM test_table ORDER BY value')
+    assert names == ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Gina']
+
+
+def test_sqlite_copy_from_rolls_back_on_error(sqlite_strategy_conn):
+    """Test a failing SQLite copy_from leaves no partial rows behind."""
+    rows = [('David', 40), ('Eva', 50), ('Alice', 60)]  # Alice violates UNIQUE
+
+    with pytest.raises(db.IntegrityError):
+        db.copy_from(sqlite_strategy_conn, 'test_table', rows, ['name', 'value'])
+
+    assert db.select_scalar(sqlite_strategy_conn, 'SELECT COUNT(*) FROM test_table') == 3
+
+
+def test_sqlite_copy_from_empty_source(sqlite_strategy_conn):
+    """Test SQLite copy_from with no rows is a no-op."""
+    assert db.copy_from(sqlite_strategy_conn, 'test_table', iter(()), ['name', 'value']) == 0
 
 
 if __name__ == '__main__':
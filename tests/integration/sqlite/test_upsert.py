@@ -57,5 +57,46 @@ def test_upsert_rowid(sl_conn):
         db.execute(sl_conn, 'DROP TABLE IF EXISTS test_rowid_table')
 
 
+
+@pytest.mark.sqlite
+def test_upsert_plan_is_cached_until_schema_refresh(sl_conn, monkeypatch):
+    """Repeated upserts reuse the resolved plan; bypass_cache drops it"""
+    db.execute(sl_conn, 'CREATE TABLE plan_events (code TEXT UNIQUE NOT NULL, seen INTEGER)')
+    strategy = db.connection.get_db_strategy(sl_conn)
+    calls = []
+    original = strategy.get_unique_columns
+    monkeypatch.setattr(strategy, 'get_unique_columns',
+                        lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs))
+
+    for seen in range(3):
+        db.upsert_rows(sl_conn, 'plan_events', [{'code': 'a', 'seen': seen}],
+                       update_cols_always=['seen'])
+    assert len(calls) == 1
+    assert db.select_scalar(sl_conn, 'SELECT seen FROM plan_events') == 2
+
+    db.execute(sl_conn, 'ALTER TABLE plan_events ADD COLUMN note TEXT')
+    sl_conn.get_table_columns('plan_events', bypass_cache=True)
+    db.upsert_rows(sl_conn, 'plan_events', [{'code': 'a', 'seen': 3}],
+                   update_cols_always=['seen'])
+    assert len(calls) == 2
+    db.upsert_rows(sl_conn, 'plan_events', [{'code': 'a', 'seen': 4, 'note': 'x'}],
+                   update_cols_always=['seen', 'note'])
+    assert db.select_scalar(sl_conn, 'SELECT note FROM plan_events') == 'x'
+
+
+@pytest.mark.sqlite
+def test_upsert_returning_counts_null_keys_as_inserts(sl_conn):
+    """Rows with a NULL key never conflict, so each one counts as an insert"""
+    db.execute(sl_conn, 'CREATE TABLE null_keys (id INTEGER PRIMARY KEY, v INTEGER)')
+    db.execute(sl_conn, 'INSERT INTO null_keys VALUES (1, 0)')
+
+    rows = [{'id': None, 'v': 1}, {'id': None, 'v': 2}, {'id': 1, 'v': 3}]
+    result = db.upsert_rows(sl_conn, 'null_keys', rows, update_cols_always=['v'],
+                            returning=['id'])
+
+    assert (result.inserted, result.updated, result.unchanged) == (2, 1, 0)
+    assert db.select_scalar(sl_conn, 'SELECT count(*) FROM null_keys') == 3
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -2,6 +2,7 @@
 Test auto-commit functionality across different database drivers.
 """
 import logging
+from contextlib import nullcontext
 
 from database.transaction import Transaction, diagnose_connection
 from database.transaction import disable_auto_commit, enable_auto_commit
@@ -85,6 +86,7 @@ class TestAutoCommit:
         conn.connection = mocker.Mock()
         conn.connection.autocommit = True
         conn.driver_connection = conn.connection
+        conn.write_lock.return_value = nullcontext()
 
         mock_disable = mocker.Mock()
         mock_enable = mocker.Mock()
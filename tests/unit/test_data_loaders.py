@@ -1,7 +1,9 @@
 import pandas as pd
 import pytest
+from database.options import get_batch_stages, iterdict_data_loader
 from database.options import pandas_numpy_data_loader
 from database.options import pandas_pyarrow_data_loader
+from database.row import as_rows
 from database.types import Column
 
 
@@ -39,5 +41,55 @@ def test_pandas_pyarrow_data_loader():
     assert result.iloc[1]['age'] == 25
 
 
+@pytest.mark.parametrize('loader', [iterdict_data_loader, pandas_numpy_data_loader,
+                                    pandas_pyarrow_data_loader])
+def test_batch_stages_match_whole_result(loader):
+    """Converting batches and finishing equals loading all rows at once"""
+    columns = [Column(name='id', type_code=None), Column(name='score', type_code=None)]
+    rows = [(1, None), (2, None), (3, 1), (4, 2.5), (5, None)]
+    convert, finish = get_batch_stages(loader)
+
+    chunks = [convert(as_rows(rows[i:i + 2], ['id', 'score']), columns) for i in range(0, 5, 2)]
+    batched = finish(chunks, columns)
+    whole = loader(as_rows(rows, ['id', 'score']), columns)
+
+    if isinstance(whole, pd.DataFrame):
+        pd.testing.assert_frame_equal(batched, whole)
+        assert batched.attrs == whole.attrs
+    else:
+        assert batched == whole
+    assert get_batch_stages(lambda data, columns: data) is None
+
+
+
+def test_numpy_loader_dtypes_from_python_type():
+    """Columns take dtypes from python_type only when the values agree"""
+    columns = [Column(name='id', type_code=None, python_type=int),
+               Column(name='order_id', type_code=None, python_type=int),
+               Column(name='flag', type_code=None, python_type=bool),
+               Column(name='missing', type_code=None, python_type=float)]
+    rows = [(1, 'A-1', True, None), (2, None, None, None)]
+
+    result = pandas_numpy_data_loader(as_rows(rows, Column.get_names(columns)), columns)
+
+    assert result['id'].dtype == 'int64'
+    assert result['order_id'].iloc[0] == 'A-1' and pd.isna(result['order_id'].iloc[1])
+    assert str(result['flag'].dtype) == 'boolean'
+    assert result['missing'].dtype == 'float64'
+
+
+def test_pyarrow_loader_types_null_batches():
+    """An all-NULL column keeps its Arrow type instead of null"""
+    columns = [Column(name='qty', type_code=None, python_type=int),
+               Column(name='side', type_code=None, python_type=str)]
+    rows = [(None, 'buy'), (None, 'buy'), (None, 'sell')]
+
+    result = pandas_pyarrow_data_loader(as_rows(rows, ['qty', 'side']), columns,
+                                        category_threshold=0.7)
+
+    assert str(result['qty'].dtype) == 'int64[pyarrow]'
+    assert str(result['side'].dtype) == 'category'
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
@@ -0,0 +1,84 @@
+import pytest
+from database.instrumentation import LatencyHistogram, QueryEvent, QueryHook
+from database.instrumentation import QueryStats, add_query_hook, finish_event
+from database.instrumentation import remove_query_hook, start_event
+from database.sql import fingerprint
+
+
+def test_histogram_percentiles_within_precision():
+    """Percentiles land within the configured relative error"""
+    hist = LatencyHistogram()
+    for micros in range(1, 10001):
+        hist.record(micros / 1_000_000)
+
+    assert hist.count == 10000
+    for pct, expected in ((50, 0.005), (95, 0.0095), (99, 0.0099)):
+        assert hist.percentile(pct) == pytest.approx(expected, rel=1 / 32)
+    assert hist.percentile(100) == hist.max == 0.01
+    assert len(hist.counts) < 400
+
+
+def test_histogram_merge():
+    """Merged histograms report the combined distribution"""
+    fast, slow = LatencyHistogram(), LatencyHistogram()
+    for _ in range(90):
+        fast.record(0.001)
+    for _ in range(10):
+        slow.record(0.1)
+    fast.merge(slow)
+
+    assert fast.count == 100
+    assert fast.percentile(50) == pytest.approx(0.001, rel=1 / 32)
+    assert fast.percentile(99) == pytest.approx(0.1, rel=1 / 32)
+
+    with pytest.raises(ValueError):
+        fast.merge(LatencyHistogram(precision_bits=3))
+
+
+def test_query_stats_report_orders_by_total_time():
+    """QueryStats groups events by statement and reports the top N"""
+    stats = QueryStats()
+    for sql, elapsed, n in (('select  1', 0.002, 5), ('select 1', 0.002, 5),
+                            ('update t set x = 1', 0.05, 1)):
+        for _ in range(n):
+            stats.after_execute(QueryEvent(sql=sql, statement=' '.join(sql.split()),
+                                           elapsed=elapsed, rows_fetched=1))
+
+    report = stats.report(top=1)
+    assert [r['statement'] for r in report] == ['update t set x = 1']
+    by_count = stats.report(sort_by='count')
+    assert by_count[0]['statement'] == 'select 1'
+    assert by_count[0]['count'] == 10 and by_count[0]['rows'] == 10
+    assert 'select 1' in stats.format_report()
+
+    stats.reset()
+    assert stats.report() == []
+
+
+def test_hooks_only_run_when_registered():
+    """No event is created without hooks; failing hooks are isolated"""
+    assert start_event('select 1') is None
+
+    class Failing(QueryHook):
+        def before_execute(self, event):
+            raise RuntimeError('boom')
+
+    stats = QueryStats()
+    failing = Failing()
+    add_query_hook(failing)
+    add_query_hook(stats)
+    try:
+        event = start_event('select   1', 'sqlite', retries=2)
+        assert event.statement == 'select ?'
+        assert event.fingerprint == fingerprint('SELECT 2')
+        finish_event(event)
+    finally:
+        remove_query_hook(failing)
+        remove_query_hook(stats)
+
+    assert stats.report()[0]['retries'] == 2
+    assert start_event('select 1') is None
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
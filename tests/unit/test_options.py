@@ -123,5 +123,59 @@ class TestPasswordRedaction:
         assert 'password=None' in r
 
 
+def test_sqlite_profile_validation():
+    """Unknown SQLite profiles and PRAGMAs are rejected up front"""
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database=':memory:',
+                        sqlite_profile='turbo')
+
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database=':memory:',
+                        sqlite_pragmas={'writable_schema': 'ON'})
+
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database=':memory:',
+                        sqlite_pragmas={'cache_size': '1; drop table t'})
+
+    options = DatabaseOptions(drivername='sqlite', database=':memory:',
+                              sqlite_profile='low_memory',
+                              sqlite_pragmas={'cache_size': -256})
+    assert options.sqlite_profile == 'low_memory'
+
+
+def test_sqlite_readers_validation():
+    """The reader pool needs a file database and a non-negative size"""
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database=':memory:', sqlite_readers=2)
+
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database='test.db', sqlite_readers=-1)
+
+    options = DatabaseOptions(drivername='sqlite', database='test.db', sqlite_readers=4)
+    assert options.sqlite_readers == 4
+
+
+def test_in_binding_validation():
+    """in_binding accepts only the known IN list strategies"""
+    assert DatabaseOptions(drivername='sqlite', database=':memory:').in_binding == 'expand'
+
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database=':memory:', in_binding='any')
+
+    options = DatabaseOptions(drivername='sqlite', database=':memory:', in_binding='array')
+    assert options.in_binding == 'array'
+
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database=':memory:', in_chunk_size=-1)
+
+
+def test_fetch_batch_size_validation():
+    """fetch_batch_size defaults to off and rejects negative sizes"""
+    assert DatabaseOptions(drivername='sqlite', database=':memory:').fetch_batch_size == 0
+
+    with pytest.raises(ValidationError):
+        DatabaseOptions(drivername='sqlite', database=':memory:', fetch_batch_size=-1)
+
+
 if __name__ == '__main__':
     __import__('pytest').main([__file__])
@@ -0,0 +1,103 @@
+import pickle
+import sys
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pandas as pd
+import psycopg
+import pytest
+from database.options import pandas_numpy_data_loader
+from database.options import pandas_pyarrow_data_loader
+from database.row import DictRowFactory, Row, TupleRowFactory, as_rows
+from database.types import NUMERIC_OID, Column, register_numeric_float_loaders
+from psycopg.adapt import AdaptersMap
+
+
+def _rows():
+    index = Row.build_index(['name', 'age'])
+    return [Row(('Alice', 30), index), Row(('Bob', 25), index)]
+
+
+def test_row_access():
+    """Rows support key, attribute and positional access"""
+    row = _rows()[0]
+    assert row['name'] == 'Alice'
+    assert row.age == 30
+    assert row[1] == 30
+    assert list(row.keys()) == ['name', 'age']
+    assert row.get('missing', 'x') == 'x'
+    assert 'name' in row
+    assert len(row) == 2
+
+    with pytest.raises(KeyError):
+        row['missing']
+    with pytest.raises(AttributeError):
+        row.missing
+
+
+def test_row_dict_compatibility():
+    """Rows compare equal to dicts and convert to mutable dicts"""
+    row = _rows()[0]
+    assert row == {'name': 'Alice', 'age': 30}
+    assert dict(row) == row.to_dict() == {'name': 'Alice', 'age': 30}
+    assert pickle.loads(pickle.dumps(row)) == row
+
+
+def test_rows_share_index_and_have_no_dict():
+    """Rows of one result set share the column index and use __slots__"""
+    first, second = _rows()
+    assert first._index is second._index
+    assert not hasattr(first, '__dict__')
+    assert sys.getsizeof(first) < sys.getsizeof(first.to_dict())
+
+
+def test_as_rows_normalizes_inputs():
+    """Tuples and dicts become Rows; duplicate names keep the last value"""
+    rows = as_rows([('a', 1), {'x': 'b', 'y': 2}], ['x', 'y'])
+    assert rows == [{'x': 'a', 'y': 1}, {'x': 'b', 'y': 2}]
+    assert rows[0]._index is rows[1]._index
+
+    dup = as_rows([(1, 2)], ['v', 'v'])[0]
+    assert dup['v'] == 2
+
+
+def test_data_loaders_accept_rows():
+    """Both pandas loaders build frames from Row tuples"""
+    columns = [Column(name='name', type_code=None), Column(name='age', type_code=None)]
+    for loader in (pandas_numpy_data_loader, pandas_pyarrow_data_loader):
+        df = loader(_rows(), columns)
+        assert isinstance(df, pd.DataFrame)
+        assert list(df.columns) == ['name', 'age']
+        assert df.iloc[1]['name'] == 'Bob'
+
+
+def _fake_cursor(adapters=None):
+    description = [SimpleNamespace(name='id', type_code=23),
+                   SimpleNamespace(name='amount', type_code=NUMERIC_OID)]
+    return SimpleNamespace(description=description, adapters=adapters)
+
+
+def test_row_factory_casts_only_numeric_columns():
+    """The cast plan is computed once and only covers numeric columns"""
+    factory = DictRowFactory(_fake_cursor())
+    assert [i for i, _ in factory.casts] == [1]
+
+    row = factory((7, Decimal('1.5')))
+    assert row == {'id': 7, 'amount': 1.5}
+    assert isinstance(row['amount'], float)
+    assert TupleRowFactory(_fake_cursor())((7, None)) == (7, None)
+
+
+def test_row_factory_skips_casts_with_float_loaders():
+    """With numeric loaded as float by psycopg, rows pass through untouched"""
+    adapters = AdaptersMap(psycopg.adapters)
+    register_numeric_float_loaders(adapters)
+    factory = TupleRowFactory(_fake_cursor(adapters))
+    assert factory.casts == []
+
+    values = (7, 1.5)
+    assert factory(values) is values
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])
@@ -5,12 +5,14 @@ Tests the public API:
 - quote_identifier(name, dialect) - Quote table/column names
 - has_placeholders(sql) - Check for parameter placeholders
 - standardize_placeholders(sql, dialect) - Convert %s <-> ?
+- normalize_sql(sql, dialect) / fingerprint(sql, dialect) - Statement identity
 """
 import datetime
 
 import pytest
 from database.sql import has_placeholders, prepare_query, quote_identifier
-from database.sql import standardize_placeholders
+from database.sql import ArrayParam, fingerprint, normalize_sql
+from database.sql import split_in_list, standardize_placeholders
 
 
 class TestPrepareQueryBasic:
@@ -175,6 +177,84 @@ class TestPrepareQueryInClause:
         assert result_args == ('2025-01-01', 'Tenor')
 
 
+class TestPrepareQueryArrayBinding:
+    """Test IN lists bound as a single array parameter."""
+
+    @pytest.mark.parametrize(('sql', 'dialect', 'expected_sql', 'expected_args'), [
+        ('SELECT * FROM t WHERE id IN %s AND x = %s', 'postgresql',
+         'SELECT * FROM t WHERE id = ANY(%s) AND x = %s', ([1, 2, 3], 5)),
+        ('SELECT * FROM t WHERE id NOT IN (%s) AND x = %s', 'postgresql',
+         'SELECT * FROM t WHERE id <> ALL(%s) AND x = %s', ([1, 2, 3], 5)),
+        ('SELECT * FROM t WHERE id in %s AND x = %s', 'sqlite',
+         'SELECT * FROM t WHERE id IN (SELECT value FROM json_each(?)) AND x = ?', ('[1,2,3]', 5)),
+        ('SELECT * FROM t WHERE id NOT IN (%s) AND x = %s', 'sqlite',
+         'SELECT * FROM t WHERE id NOT IN (SELECT value FROM json_each(?)) AND x = ?', ('[1,2,3]', 5)),
+    ], ids=['pg_any', 'pg_not_in_parens', 'sqlite_json_each', 'sqlite_not_in_parens'])
+    def test_array_binding(self, sql, dialect, expected_sql, expected_args):
+        """Test IN and NOT IN rewrite to one array parameter per dialect."""
+        assert prepare_query(sql, ([1, 2, 3], 5), dialect, 'array') == (expected_sql, expected_args)
+
+    def test_array_param_opts_in_per_value(self):
+        """Test ArrayParam selects array binding without the global option."""
+        sql = 'SELECT * FROM t WHERE a IN %s AND b IN %s'
+        result_sql, result_args = prepare_query(sql, (ArrayParam([1, 2]), [3, 4]), 'postgresql')
+        assert result_sql == 'SELECT * FROM t WHERE a = ANY(%s) AND b IN (%s, %s)'
+        assert result_args == ([1, 2], 3, 4)
+
+        result_sql, result_args = prepare_query(
+            'SELECT * FROM t WHERE a IN %(ids)s', {'ids': ArrayParam(['x', 'y'])}, 'sqlite')
+        assert result_sql == 'SELECT * FROM t WHERE a IN (SELECT value FROM json_each(:ids))'
+        assert result_args == {'ids': '["x","y"]'}
+
+    def test_large_list_stays_one_parameter(self):
+        """Test statement size does not grow with the list."""
+        ids = list(range(100_000))
+        result_sql, result_args = prepare_query('SELECT * FROM t WHERE id IN %s', (ids,),
+                                                'postgresql', 'array')
+        assert result_sql == 'SELECT * FROM t WHERE id = ANY(%s)'
+        assert result_args == (ids,)
+
+    @pytest.mark.parametrize(('sql', 'args', 'dialect', 'expected_sql'), [
+        ('SELECT * FROM t WHERE id IN %s', ([],), 'postgresql',
+         'SELECT * FROM t WHERE id IN (NULL)'),
+        ('SELECT * FROM t WHERE id IN (%s, %s)', (1, 2), 'postgresql',
+         'SELECT * FROM t WHERE id IN (%s, %s)'),
+        ('SELECT * FROM t WHERE b IN %s', ([b'x', b'y'],), 'sqlite',
+         'SELECT * FROM t WHERE b IN (?, ?)'),
+    ], ids=['empty', 'explicit_list', 'sqlite_bytes'])
+    def test_array_binding_falls_back_to_expansion(self, sql, args, dialect, expected_sql):
+        """Test cases that keep per-value placeholders."""
+        assert prepare_query(sql, args, dialect, 'array')[0] == expected_sql
+
+
+class TestSplitInList:
+    """Test splitting oversized IN lists into chunked argument sets."""
+
+    def test_splits_longest_list(self):
+        """Test the longest IN list is chunked and other args are kept."""
+        sql = 'SELECT * FROM t WHERE a IN %s AND b IN %s AND c = %s'
+        chunks = split_in_list(sql, ([1, 2, 3], list(range(5)), 'x'), size=2)
+        assert chunks == [([1, 2, 3], [0, 1], 'x'), ([1, 2, 3], [2, 3], 'x'), ([1, 2, 3], [4], 'x')]
+
+    def test_splits_single_and_named_lists(self):
+        """Test flat args for a lone IN and named IN lists."""
+        assert split_in_list('SELECT * FROM t WHERE a IN %s', (1, 2, 3), size=2) == [([1, 2],), ([3],)]
+        chunks = split_in_list('SELECT * FROM t WHERE a IN %(ids)s AND b = %(b)s',
+                               {'ids': [1, 2, 3], 'b': 0}, size=2)
+        assert chunks == [{'ids': [1, 2], 'b': 0}, {'ids': [3], 'b': 0}]
+
+    @pytest.mark.parametrize(('sql', 'args', 'in_binding'), [
+        ('SELECT * FROM t WHERE a IN %s', ([1, 2],), 'expand'),
+        ('SELECT * FROM t WHERE a NOT IN %s', ([1, 2, 3],), 'expand'),
+        ('SELECT * FROM t WHERE a IN %s', ([1, 2, 3],), 'array'),
+        ('SELECT * FROM t WHERE a IN %s', (ArrayParam([1, 2, 3]),), 'expand'),
+        ('SELECT * FROM t WHERE a = %s', (1,), 'expand'),
+    ], ids=['within_size', 'not_in', 'array_binding', 'array_param', 'no_in'])
+    def test_no_split(self, sql, args, in_binding):
+        """Test lists that are short, negated or array-bound stay whole."""
+        assert split_in_list(sql, args, size=2, in_binding=in_binding) is None
+
+
 class TestPrepareQueryAnyAll:
     """Test ANY(%s) / ALL(%s) array parameter binding.
 
@@ -604,6 +684,43 @@ class TestStandardizePlaceholders:
         assert '?' in result
 
 
+class TestFingerprint:
+    """Test statement normalization and fingerprinting."""
+
+    @pytest.mark.parametrize(('sql', 'dialect', 'expected'), [
+        ("SELECT * FROM t WHERE name = 'x' AND id = 42", 'postgresql',
+         'select * from t where name = ? and id = ?'),
+        ('select * from t where id in (%s, %s, %s)', 'postgresql',
+         'select * from t where id in(...)'),
+        ('SELECT  a ,b\n  FROM t -- trailing\n WHERE x = %(x)s', 'postgresql',
+         'select a, b from t where x = ?'),
+        ('SELECT "MixedCase" FROM t1 WHERE v > 1.5e3 /* note */', 'postgresql',
+         'select "MixedCase" from t1 where v > ?'),
+        ('SELECT $tag$body$tag$::text, x::int FROM t', 'postgresql',
+         'select ?::text, x::int from t'),
+        ('SELECT * FROM t WHERE a = :a AND b IN (?, ?)', 'sqlite',
+         'select * from t where a = ? and b in(...)'),
+    ], ids=['literals', 'in_list', 'whitespace_comments_named', 'quoted_ident_float',
+            'dollar_quote_cast', 'sqlite_placeholders'])
+    def test_normalize(self, sql, dialect, expected):
+        """Test literals, IN lists, comments and whitespace are collapsed."""
+        assert normalize_sql(sql, dialect) == expected
+
+    def test_fingerprint_groups_variants(self):
+        """Test statements differing only in values share a fingerprint."""
+        a = fingerprint('SELECT * FROM t WHERE id IN (1, 2) AND name = %s')
+        b = fingerprint("select *\nfrom t where id in (7) and name = 'bob'")
+        assert a == b
+        assert len(a) == 16
+        assert a != fingerprint('SELECT * FROM u WHERE id IN (1, 2) AND name = %s')
+
+    def test_fingerprint_keeps_quoted_identifiers_and_strings_distinct(self):
+        """Test identifiers are case-sensitive only when quoted."""
+        assert fingerprint('SELECT X FROM T') == fingerprint('select x from t')
+        assert fingerprint('SELECT "X" FROM t') != fingerprint('SELECT "x" FROM t')
+        assert normalize_sql("SELECT '-- not a comment', 1") == 'select ?, ?'
+
+
 class TestFullPipeline:
     """Test complete query processing scenarios."""
 
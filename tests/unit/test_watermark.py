@@ -0,0 +1,43 @@
+"""
+Watermark values are stored as text with a kind tag and round-trip exactly.
+"""
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from database.exceptions import ValidationError
+from database.watermark import _DECODERS, _encode
+
+
+@pytest.mark.parametrize('value', [
+    42,
+    True,
+    1.1,
+    Decimal('10.50'),
+    'v2024-01',
+    datetime.date(2024, 1, 2),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 678901),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    (datetime.datetime(2024, 1, 2, 3, 4, 5), 'a', 7),
+], ids=lambda v: type(v).__name__)
+def test_round_trip(value):
+    """Each supported type decodes to an equal value of the same type"""
+    kind, text = _encode(value)
+    decoded = _DECODERS[kind](text)
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_numpy_values_become_builtins():
+    """numpy scalars are stored as their Python equivalents"""
+    assert _encode(np.int64(7)) == ('int', '7')
+
+
+def test_unsupported_type():
+    with pytest.raises(ValidationError):
+        _encode(object())
+
+
+if __name__ == '__main__':
+    __import__('pytest').main([__file__])